@@ -0,0 +1,74 @@
+"""
+Measure the throughput and latency of the client's request paths against a local mock server.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_client [--requests 500] [--workers 8] [--latency 0.005] [--error-rate 0.0]
+"""
+
+import os
+import time
+import argparse
+import tempfile
+import statistics
+from typing import Text, List, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from py_twelvelabs import TwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.testing import MockServer
+
+
+def measure(name: Text, function: Callable[[int], None], count: int, workers: int):
+    def timed(i: int) -> float:
+        started_at = time.perf_counter()
+        function(i)
+        return time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        latencies: List[float] = sorted(executor.map(timed, range(count)))
+    elapsed = time.perf_counter() - started_at
+
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{name:<32} {count / elapsed:9.1f} ops/s {p50 * 1e3:9.2f} ms p50 {p99 * 1e3:9.2f} ms p99")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--upload-size", type=int, default=8 * 1024 * 1024)
+    args = parser.parse_args()
+
+    settings.RETRY_BACKOFF_FACTOR = 0.0
+    settings.TASK_WATCHER_MIN_POLLING_INTERVAL = 0.05
+
+    with MockServer(latency=args.latency, error_rate=args.error_rate, search_result_count=100, seed=0) as server:
+        settings.BASE_API_URL = server.base_url
+        index_id = server.add_index()
+        task_ids = [server.add_task(index_id, status="ready") for _ in range(10)]
+
+        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as video_file:
+            video_file.write(os.urandom(args.upload_size))
+
+        try:
+            with TwelveLabsAPIClient(api_key="bench", pool_maxsize=args.workers) as client:
+                measure("task.get", lambda i: client.task.get(task_ids[i % len(task_ids)]), args.requests, args.workers)
+                measure("index.list", lambda i: client.index.list(), args.requests, args.workers)
+                measure("search.iter_query (10 pages)", lambda i: list(client.search.iter_query(index_id, "query", ["visual"], page_limit=10)), args.requests // 10, args.workers)
+                measure(f"task.create_async ({args.upload_size >> 20} MiB)", lambda i: client.task.create_async(index_id, video_file=video_file.name), max(1, args.requests // 50), args.workers)
+
+                server.task_duration = 0.5
+                measure("task.create_sync (0.5 s task)", lambda i: client.task.create_sync(index_id, video_url="https://example.com/video.mp4"), max(1, args.requests // 10), args.workers)
+        finally:
+            os.remove(video_file.name)
+
+        print(f"{server.request_count} requests served")
+
+
+if __name__ == "__main__":
+    main()
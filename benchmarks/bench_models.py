@@ -0,0 +1,111 @@
+"""
+Compare the per-item cost of building models from API responses.
+
+Run from the repository root with:
+
+    python -m benchmarks.bench_models [--items 5000] [--repeat 5]
+"""
+
+import sys
+import timeit
+import argparse
+from datetime import datetime, timedelta
+from typing import Text, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field, validator
+
+from py_twelvelabs.models import Task, Clip
+from py_twelvelabs.utilities.dates import parse_datetime
+
+
+class LegacyTask(BaseModel):
+    """
+    Task model as it was before the fast construction path, parsing timestamps with strptime in a try/except loop.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: Text = Field(alias="_id")
+    index_id: Text
+    video_id: Optional[Text] = None
+    status: Text
+    metadata: Dict
+    created_at: datetime
+    updated_at: datetime
+    type: Optional[Text] = None
+    estimated_time: Optional[datetime] = None
+    process: Optional[Dict] = None
+
+    @validator("created_at", "updated_at", "estimated_time", pre=True)
+    def parse_date(cls, value):
+        if value is None or isinstance(value, datetime):
+            return value
+        for fmt in ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"]:
+            try:
+                return datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+        raise ValueError(value)
+
+
+def get_tasks(count: int) -> List[Dict]:
+    started_at = datetime(2024, 1, 1)
+    tasks = []
+    for i in range(count):
+        created_at = started_at + timedelta(seconds=i)
+        tasks.append({
+            "_id": f"task_{i}",
+            "index_id": "index_1",
+            "video_id": f"video_{i}",
+            "status": "ready",
+            "metadata": {"filename": f"video_{i}.mp4", "duration": 60.0, "width": 1280, "height": 720},
+            "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+            "updated_at": (created_at + timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+    return tasks
+
+
+def construct_task(data: Dict) -> Task:
+    """
+    Build a task without validation, for comparison. In pydantic v2 this is slower than validating, because validation
+    runs in pydantic-core while model_construct runs in Python.
+    """
+
+    values = {key: value for key, value in data.items() if key != "_id"}
+    values['created_at'] = parse_datetime(values['created_at'])
+    values['updated_at'] = parse_datetime(values['updated_at'])
+    return Task.model_construct(id=data['_id'], **values)
+
+
+def get_clips(count: int) -> List[Dict]:
+    return [{"video_id": f"video_{i % 100}", "score": 90.0 - i / count, "start": float(i), "end": float(i + 5), "confidence": "high", "thumbnail_url": f"https://example.com/{i}.jpg", "metadata": [{"type": "visual"}]} for i in range(count)]
+
+
+def measure(name: Text, function, items: List, repeat: int):
+    def run():
+        parse_datetime.cache_clear()
+        for item in items:
+            function(item)
+
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    print(f"{name:<40} {best / len(items) * 1e6:8.2f} us/item")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tasks = get_tasks(args.items)
+    measure("Task, strptime validation (before)", lambda data: LegacyTask(**data), tasks, args.repeat)
+    measure("Task, fromisoformat validation", lambda data: Task(**data), tasks, args.repeat)
+    measure("Task, model_construct", construct_task, tasks, args.repeat)
+
+    clips = get_clips(args.items)
+    measure("Search clip, dict copy", dict, clips, args.repeat)
+    measure("Search clip, Clip", Clip.from_api, clips, args.repeat)
+    print(f"{'Size of a dict clip / Clip':<40} {sys.getsizeof(dict(clips[0])):5d} / {sys.getsizeof(Clip.from_api(clips[0]))} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Measure the cold-start cost of the client: importing the client, creating a client and sending the first request.
+
+Every measurement runs in a fresh interpreter, against a local mock server. Run from the repository root with:
+
+    python -m benchmarks.bench_startup [--runs 10]
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+from typing import Text, Dict, List
+
+from py_twelvelabs.testing import MockServer
+
+
+SCRIPT = """
+import sys
+import json
+import time
+
+started_at = time.perf_counter()
+from py_twelvelabs import TwelveLabsAPIClient
+imported_at = time.perf_counter()
+client = TwelveLabsAPIClient(api_key="bench")
+created_at = time.perf_counter()
+client.task.get(sys.argv[1])
+requested_at = time.perf_counter()
+print(json.dumps({"import": imported_at - started_at, "client": created_at - imported_at, "first request": requested_at - created_at, "total": requested_at - started_at, "modules": len(sys.modules)}))
+"""
+
+
+def run(task_id: Text, base_url: Text) -> Dict[Text, float]:
+    env = {**os.environ, "BASE_API_URL": base_url, "PYTHONPATH": os.getcwd()}
+    output = subprocess.run([sys.executable, "-c", SCRIPT, task_id], env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with MockServer() as server:
+        task_id = server.add_task(server.add_index(), status="ready")
+        results: List[Dict[Text, float]] = [run(task_id, server.base_url) for _ in range(args.runs)]
+
+    for name in ("import", "client", "first request", "total"):
+        values = sorted(result[name] for result in results)
+        print(f"{name:<16} {statistics.median(values) * 1e3:8.1f} ms median {values[0] * 1e3:8.1f} ms min")
+    print(f"{'modules loaded':<16} {results[-1]['modules']:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,20 @@
-from .client import TwelveLabsAPIClient
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import TwelveLabsAPIClient
+    from .async_client import AsyncTwelveLabsAPIClient
+
+
+def __getattr__(name):
+    # The clients are imported on first use, so that importing the package stays cheap and the synchronous client does
+    # not pull in httpx.
+    if name == "TwelveLabsAPIClient":
+        from .client import TwelveLabsAPIClient
+        return TwelveLabsAPIClient
+    if name == "AsyncTwelveLabsAPIClient":
+        from .async_client import AsyncTwelveLabsAPIClient
+        return AsyncTwelveLabsAPIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["TwelveLabsAPIClient", "AsyncTwelveLabsAPIClient"]
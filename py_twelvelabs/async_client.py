@@ -0,0 +1,417 @@
+import os
+import time
+import asyncio
+from functools import cached_property
+from typing import TYPE_CHECKING, Text, Dict, Callable, AsyncIterator
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.logger import get_logger
+from py_twelvelabs.utilities.retry import RetryPolicy
+from py_twelvelabs.utilities.rate_limiter import RateLimiter
+from py_twelvelabs.utilities.cache import ResponseCache
+from py_twelvelabs.utilities.search_cache import SearchCache
+from py_twelvelabs.utilities.metrics import Metrics
+from py_twelvelabs.utilities.single_flight import AsyncSingleFlight
+from py_twelvelabs.utilities.deadline import Deadline, get_deadline
+from py_twelvelabs.exceptions import MissingAPIKeyError, MethodNotImplementedError, MissingDependencyError
+
+if TYPE_CHECKING:
+    from py_twelvelabs.watcher import AsyncTaskWatcher
+    from py_twelvelabs.callbacks import CallbackReceiver
+    from py_twelvelabs.utilities.dedup import UploadRegistry
+    from py_twelvelabs.utilities.upload import UploadStream
+    from py_twelvelabs.resources import AsyncIndexResource, AsyncTaskResource, AsyncSearchResource
+
+
+class AsyncTwelveLabsAPIClient:
+    """
+    Asynchronous Twelve Labs API client.
+
+    All resources share one non-blocking connection pool, so many requests can run concurrently on a single event loop.
+    It can be used as an async context manager to release the pooled connections when done.
+    """
+
+    def __init__(self, api_key: Text = None, pool_maxsize: int = None, keep_alive: bool = None, idle_timeout: float = None, retry_policy: RetryPolicy = None, rate_limiter: RateLimiter = None, cache: ResponseCache = None, search_cache: SearchCache = None, metrics: Metrics = None, connect_timeout: float = None, read_timeout: float = None, callback_receiver: "CallbackReceiver" = None, upload_registry: "UploadRegistry" = None):
+        """
+        Initialize the asynchronous Twelve Labs API client.
+
+        :param api_key: API key.
+        :param pool_maxsize: Maximum number of concurrent connections. Defaults to settings.POOL_MAXSIZE.
+        :param keep_alive: Whether to reuse connections between requests. Defaults to settings.KEEP_ALIVE.
+        :param idle_timeout: Seconds after which idle pooled connections are discarded. Defaults to settings.IDLE_TIMEOUT.
+        :param retry_policy: Policy for retrying failed requests. Defaults to a policy built from the RETRY_* settings.
+        :param rate_limiter: Client-side rate limiter. Defaults to a limiter built from the RATE_LIMIT* settings.
+        :param cache: Cache of index and task responses. Defaults to a cache built from the CACHE_* settings if settings.CACHE_ENABLED is set, and to no caching otherwise.
+        :param search_cache: Cache of search results. Defaults to a cache built from the SEARCH_CACHE_* settings if settings.SEARCH_CACHE_ENABLED is set, and to no caching otherwise.
+        :param metrics: Instrumentation of API calls. Defaults to in-memory metrics, enabled by settings.METRICS_ENABLED.
+        :param connect_timeout: Seconds to wait for a connection to be established, or None to wait forever. Defaults to settings.CONNECT_TIMEOUT.
+        :param read_timeout: Seconds to wait between bytes received from the API, or None to wait forever. Defaults to settings.READ_TIMEOUT.
+        :param callback_receiver: Receiver of task notifications. When given, watched tasks are polled when a notification arrives, or after settings.CALLBACK_FALLBACK_TIMEOUT if none does. Notifications of ready tasks also invalidate the search cache.
+        :param upload_registry: Record of uploaded video files, used to skip uploading the same content to an index twice. Defaults to a registry built from the DEDUP_* settings if settings.DEDUP_ENABLED is set, and to no deduplication otherwise.
+        """
+
+        if httpx is None:
+            raise MissingDependencyError("The asynchronous client requires httpx. Install it with `pip install py_twelvelabs[async]`.")
+
+        self.api_key = self._get_api_key(api_key)
+        self.logger = get_logger(__name__)
+
+        self.pool_maxsize = pool_maxsize if pool_maxsize is not None else settings.POOL_MAXSIZE
+        self.keep_alive = keep_alive if keep_alive is not None else settings.KEEP_ALIVE
+        self.idle_timeout = idle_timeout if idle_timeout is not None else settings.IDLE_TIMEOUT
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(namespace=self.api_key)
+        self.cache = cache if cache is not None else (ResponseCache() if settings.CACHE_ENABLED else None)
+        self.search_cache = search_cache if search_cache is not None else (SearchCache() if settings.SEARCH_CACHE_ENABLED else None)
+        self.single_flight = AsyncSingleFlight()
+        self.metrics = metrics if metrics is not None else Metrics(enabled=settings.METRICS_ENABLED)
+        self.connect_timeout = connect_timeout if connect_timeout is not None else settings.CONNECT_TIMEOUT
+        self.read_timeout = read_timeout if read_timeout is not None else settings.READ_TIMEOUT
+        self.callback_receiver = callback_receiver
+        self.upload_registry = upload_registry if upload_registry is not None else (self._create_upload_registry() if settings.DEDUP_ENABLED else None)
+
+        self._http_client = None
+        self._task_watcher = None
+
+        if self.callback_receiver is not None and self.search_cache is not None:
+            self.callback_receiver.add_listener(self._on_callback)
+
+    def _on_callback(self, task_id: Text, status: Text):
+        if status != "ready":
+            return
+        index_id = self.callback_receiver.get_index_id(task_id)
+        if index_id is not None:
+            self.search_cache.invalidate(index_id)
+        else:
+            self.search_cache.clear()
+
+    @staticmethod
+    def _create_upload_registry() -> "UploadRegistry":
+        from py_twelvelabs.utilities.dedup import UploadRegistry
+        return UploadRegistry()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @cached_property
+    def index(self) -> "AsyncIndexResource":
+        """
+        Index resource. It is created on first use.
+        """
+
+        from py_twelvelabs.resources import AsyncIndexResource
+        return AsyncIndexResource(self)
+
+    @cached_property
+    def task(self) -> "AsyncTaskResource":
+        """
+        Task resource. It is created on first use.
+        """
+
+        from py_twelvelabs.resources import AsyncTaskResource
+        return AsyncTaskResource(self)
+
+    @cached_property
+    def search(self) -> "AsyncSearchResource":
+        """
+        Search resource. It is created on first use.
+        """
+
+        from py_twelvelabs.resources import AsyncSearchResource
+        return AsyncSearchResource(self)
+
+    @property
+    def task_watcher(self) -> "AsyncTaskWatcher":
+        """
+        Task watcher shared by all coroutines waiting on tasks of this client. It is created on first use.
+        """
+
+        if self._task_watcher is None:
+            from py_twelvelabs.watcher import AsyncTaskWatcher
+            self._task_watcher = AsyncTaskWatcher(self)
+        return self._task_watcher
+
+    async def close(self):
+        """
+        Stop the task watcher and listening for task notifications, close the HTTP client and release all pooled connections.
+        """
+
+        if self._task_watcher is not None:
+            await self._task_watcher.close()
+            self._task_watcher = None
+
+        if self.callback_receiver is not None and self.search_cache is not None:
+            self.callback_receiver.remove_listener(self._on_callback)
+
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _create_http_client(self) -> "httpx.AsyncClient":
+        """
+        Create an HTTP client backed by a connection pool.
+
+        :return: HTTP client.
+        """
+
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize,
+            max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+            keepalive_expiry=self.idle_timeout,
+        )
+        return httpx.AsyncClient(limits=limits, timeout=None)
+
+    def _get_http_client(self) -> "httpx.AsyncClient":
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        :return: HTTP client.
+        """
+
+        if self._http_client is None:
+            self._http_client = self._create_http_client()
+        return self._http_client
+
+    def _get_api_key(self, api_key: Text = None) -> Text:
+        """
+        Get the API key.
+
+        The API key can be provided as an argument or as the environment variable TWELVE_LABS_API_KEY.
+
+        :param api_key: API key.
+        :return: API key.
+        """
+
+        if api_key is None:
+            api_key = os.environ.get('TWELVE_LABS_API_KEY', None)
+        if api_key is None:
+            raise MissingAPIKeyError('API key must be provided.')
+        return api_key
+
+    def _get_headers(self, headers: Dict = None) -> Dict:
+        """
+        Get request headers.
+
+        :param headers: Request headers.
+        :return: Request headers.
+        """
+
+        if headers is None:
+            headers = {}
+
+        headers.update({
+            'Content-Type': 'application/json',
+            'x-api-key': self.api_key
+        })
+        return headers
+
+    def _get_url(self, endpoint: str) -> Text:
+        """
+        Get the API URL.
+
+        :param endpoint: API endpoint.
+        :return: API URL.
+        """
+
+        return f"{settings.BASE_API_URL}/{settings.API_VERSION}/{endpoint}"
+
+    def _get_timeout(self, call_deadline: Deadline) -> "httpx.Timeout":
+        """
+        Get the timeouts of a request, capped to the time left before the deadline of the call.
+
+        :param call_deadline: Deadline of the call.
+        :return: Timeouts.
+        """
+
+        read_timeout = call_deadline.get_timeout(self.read_timeout)
+        return httpx.Timeout(connect=call_deadline.get_timeout(self.connect_timeout), read=read_timeout, write=read_timeout, pool=call_deadline.get_timeout(None))
+
+    async def submit_request(self, endpoint: str, headers: Dict = None, params: Dict = None, data: Dict = None, method: str = "GET") -> "httpx.Response":
+        """
+        Submit a request to the Twelve Labs API.
+
+        Requests wait for the client's rate limiter before every attempt. Idempotent requests and safe POSTs that fail with a retryable status code or a connection error are retried according to the client's retry policy.
+        Retries stop at the deadline of the current deadline scope, and the request is cancelled as soon as its cancel token is cancelled.
+
+        :param endpoint: API endpoint.
+        :param headers: Request headers. The API key and content type are automatically added.
+        :param params: Request parameters. Parameters set to None are omitted.
+        :param data: Request data.
+        :param method: HTTP method.
+        :return: Response data.
+        """
+
+        url = self._get_url(endpoint)
+        headers = self._get_headers(headers)
+        call_deadline = get_deadline()
+
+        retry_policy = self.retry_policy.for_endpoint(endpoint)
+        is_retryable = retry_policy.is_retryable_request(method, endpoint)
+        started_at = time.monotonic()
+        retry_number = 1
+
+        while True:
+            call_deadline.check()
+            timer = self.metrics.start_request(endpoint, method, retry_number)
+            try:
+                await self.rate_limiter.acquire_async(endpoint)
+                call_deadline.check()
+                timer.mark("queue")
+                response = await call_deadline.run_async(self._send(url, headers, params, data, method, timer.trace, self._get_timeout(call_deadline)))
+            except httpx.TransportError as e:
+                timer.finish(error=e)
+                call_deadline.check()
+                backoff = retry_policy.get_backoff(retry_number)
+                if not is_retryable or not retry_policy.can_retry(retry_number, started_at, backoff) or not call_deadline.allows(backoff):
+                    raise
+                self.logger.warning("%s %s failed with %r, retrying in %.2f seconds.", method, endpoint, e, backoff)
+            except BaseException as e:
+                timer.finish(error=e)
+                raise
+            else:
+                timer.finish(response.status_code)
+                self.metrics.instrument_response(response, endpoint, method)
+                if not is_retryable or not retry_policy.is_retryable_status(response.status_code):
+                    return response
+                backoff = retry_policy.get_backoff(retry_number, response.headers.get("Retry-After"))
+                if not retry_policy.can_retry(retry_number, started_at, backoff) or not call_deadline.allows(backoff):
+                    return response
+                self.logger.warning("%s %s failed with status %s, retrying in %.2f seconds.", method, endpoint, response.status_code, backoff)
+
+            await call_deadline.sleep_async(backoff)
+            retry_number += 1
+
+    async def _send(self, url: Text, headers: Dict, params: Dict, data: Dict, method: str, trace: Callable = None, timeout: "httpx.Timeout" = None) -> "httpx.Response":
+        """
+        Send a single request over the shared connection pool.
+
+        :param url: Request URL.
+        :param headers: Request headers.
+        :param params: Request parameters. Parameters set to None are omitted.
+        :param data: Request data.
+        :param method: HTTP method.
+        :param trace: Coroutine function receiving the request's trace events.
+        :param timeout: Request timeouts. Defaults to the client's timeouts.
+        :return: Response data.
+        """
+
+        http_client = self._get_http_client()
+        extensions = {"trace": trace} if trace is not None else None
+        timeout = timeout if timeout is not None else self._get_timeout(get_deadline())
+
+        if method == "GET":
+            if params is not None:
+                params = {key: value for key, value in params.items() if value is not None}
+            response = await http_client.get(
+                url=url,
+                headers=headers,
+                params=params,
+                extensions=extensions,
+                timeout=timeout,
+            )
+
+        elif method == "POST":
+            response = await http_client.post(
+                url=url,
+                headers=headers,
+                json=data,
+                extensions=extensions,
+                timeout=timeout,
+            )
+
+        elif method == "PUT":
+            response = await http_client.put(
+                url=url,
+                headers=headers,
+                json=data,
+                extensions=extensions,
+                timeout=timeout,
+            )
+
+        elif method == "DELETE":
+            response = await http_client.delete(
+                url=url,
+                headers=headers,
+                extensions=extensions,
+                timeout=timeout,
+            )
+
+        else:
+            raise MethodNotImplementedError(f"Method {method} not implemented yet.")
+
+        return response
+
+    async def submit_multi_part_request(self, endpoint: str, data: Dict, headers: Dict = None, method: str = "GET", chunk_size: int = None, progress_callback: Callable[[int, int], None] = None) -> "httpx.Response":
+        """
+        Submit a multi-part request to the Twelve Labs API.
+
+        The body is streamed in chunks and file reads are run in the default executor, so large uploads neither load files into memory nor block the event loop.
+
+        :param endpoint: API endpoint.
+        :param headers: Request headers. The API key and content type are automatically added.
+        :param data: Request data.
+        :param method: HTTP method.
+        :param chunk_size: Number of bytes read from the body at a time. Defaults to settings.UPLOAD_CHUNK_SIZE.
+        :param progress_callback: Function called after every chunk with the number of bytes sent and the total number of bytes.
+        :return: Response data.
+        """
+
+        url = self._get_url(endpoint)
+        headers = self._get_headers(headers)
+
+        from requests_toolbelt.multipart.encoder import MultipartEncoder
+        from py_twelvelabs.utilities.upload import UploadStream
+
+        multipart_data = UploadStream(MultipartEncoder(fields=data), chunk_size or settings.UPLOAD_CHUNK_SIZE, progress_callback)
+        headers['Content-Type'] = multipart_data.content_type
+        headers['Content-Length'] = str(multipart_data.len)
+        http_client = self._get_http_client()
+
+        if method == "POST":
+            call_deadline = get_deadline()
+            call_deadline.check()
+            timer = self.metrics.start_request(endpoint, method)
+            try:
+                await self.rate_limiter.acquire_async(endpoint)
+                call_deadline.check()
+                timer.mark("queue")
+                response = await call_deadline.run_async(http_client.post(
+                    url=url,
+                    headers=headers,
+                    content=self._iter_multi_part_data(multipart_data),
+                    extensions={"trace": timer.trace},
+                    timeout=self._get_timeout(call_deadline),
+                ))
+            except BaseException as e:
+                timer.finish(error=e)
+                raise
+            timer.finish(response.status_code)
+            self.metrics.instrument_response(response, endpoint, method)
+
+        else:
+            raise MethodNotImplementedError(f"Method {method} not supported yet.")
+
+        return response
+
+    async def _iter_multi_part_data(self, multipart_data: "UploadStream") -> AsyncIterator[bytes]:
+        """
+        Iterate over a multi-part body in chunks.
+
+        :param multipart_data: Multi-part upload stream.
+        :return: Async iterator of body chunks.
+        """
+
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, multipart_data.read)
+            if not chunk:
+                break
+            yield chunk
@@ -0,0 +1,284 @@
+import hmac
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Text, Dict, List, Tuple, Callable, Optional
+
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.logger import get_logger
+from py_twelvelabs.exceptions import InsufficientParametersError
+
+
+SIGNATURE_HEADER = "TL-Signature"
+
+
+def sign_callback(body: bytes, secret: Text, timestamp: int = None) -> Text:
+    """
+    Sign the body of a task notification.
+
+    The signature is an HMAC-SHA256 of the timestamp and the body, keyed with the shared secret, in the form
+    t=<timestamp>,v1=<hex digest>.
+
+    :param body: Request body.
+    :param secret: Shared secret.
+    :param timestamp: Unix time of the notification. Defaults to now.
+    :return: Value of the signature header.
+    """
+
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    digest = hmac.new(secret.encode(), f"{timestamp}.".encode() + body, hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={digest}"
+
+
+def verify_callback(body: bytes, signature: Optional[Text], secret: Text, max_age: float) -> bool:
+    """
+    Verify the signature of a task notification.
+
+    :param body: Request body.
+    :param signature: Value of the signature header.
+    :param secret: Shared secret.
+    :param max_age: Maximum number of seconds between the signature timestamp and now, in either direction, so that old notifications cannot be replayed.
+    :return: True if the signature is valid and recent.
+    """
+
+    if not signature:
+        return False
+    try:
+        fields = dict(part.split("=", 1) for part in signature.split(","))
+        timestamp = int(fields['t'])
+    except (KeyError, ValueError):
+        return False
+
+    if abs(time.time() - timestamp) > max_age:
+        return False
+    expected = sign_callback(body, secret, timestamp).split("v1=", 1)[1]
+    return hmac.compare_digest(expected, fields.get('v1', ""))
+
+
+def send_callback(url: Text, task: Dict, secret: Text, timeout: float = 10.0) -> int:
+    """
+    Send a signed task notification, as the API does when a task completes.
+
+    Used by the mock server and in tests to stand in for the API.
+
+    :param url: URL of the callback receiver.
+    :param task: Task payload, with at least its _id and status.
+    :param secret: Shared secret.
+    :param timeout: Seconds to wait for the receiver.
+    :return: Status code of the response.
+    """
+
+    body = json.dumps({"type": f"index.task.{task['status']}", "created_at": int(time.time()), "data": task}, default=str).encode()
+    request = Request(url, data=body, method="POST", headers={"Content-Type": "application/json", SIGNATURE_HEADER: sign_callback(body, secret)})
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            return response.status
+    except HTTPError as e:
+        return e.code
+
+
+class _CallbackHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+
+        if 0 <= length <= settings.CALLBACK_MAX_BODY_SIZE:
+            status = self.server.receiver.handle(self.path, self.headers, self.rfile.read(length))
+        else:
+            status = 400 if length < 0 else 413
+            self.server.receiver.logger.warning("Rejected a task notification with a Content-Length of %s.", self.headers.get("Content-Length"))
+            # The body is not read, so the connection cannot be reused.
+            self.close_connection = True
+
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CallbackReceiver:
+    """
+    Local HTTP endpoint that receives signed task notifications and tells the task watchers of a client, so that they do
+    not need to poll tasks while they are being processed.
+
+    The URL of the receiver must be reachable by the API and registered as a webhook. Notifications are only accepted
+    with a valid and recent HMAC-SHA256 signature and a body of at most settings.CALLBACK_MAX_BODY_SIZE bytes. Watched tasks are not polled until a notification arrives for them,
+    or until settings.CALLBACK_FALLBACK_TIMEOUT has passed, after which they are polled as usual.
+    """
+
+    def __init__(self, secret: Text = None, host: Text = None, port: int = None, path: Text = None, public_url: Text = None, max_age: float = None):
+        """
+        Initialize the callback receiver.
+
+        :param secret: Secret shared with the sender, used to verify notifications. Defaults to settings.CALLBACK_SECRET.
+        :param host: Address to listen on. Defaults to settings.CALLBACK_HOST.
+        :param port: Port to listen on, or 0 for any free port. Defaults to settings.CALLBACK_PORT.
+        :param path: Path notifications are posted to. Defaults to settings.CALLBACK_PATH.
+        :param public_url: URL the API posts notifications to, e.g. behind a proxy. Defaults to the local address of the receiver.
+        :param max_age: Maximum age of a notification in seconds. Defaults to settings.CALLBACK_MAX_AGE.
+        """
+
+        self.secret = secret or settings.CALLBACK_SECRET
+        if not self.secret:
+            raise InsufficientParametersError("A secret must be provided to verify task notifications.")
+        self.path = path or settings.CALLBACK_PATH
+        self.max_age = max_age if max_age is not None else settings.CALLBACK_MAX_AGE
+        self.logger = get_logger(__name__)
+
+        self.notification_count = 0
+        self.rejected_count = 0
+
+        self._listeners: List[Callable[[Text, Text], None]] = []
+        self._statuses: "OrderedDict[Text, Text]" = OrderedDict()
+        self._index_ids: Dict[Text, Text] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+        self._server = ThreadingHTTPServer((host or settings.CALLBACK_HOST, port if port is not None else settings.CALLBACK_PORT), _CallbackHandler)
+        self._server.daemon_threads = True
+        self._server.receiver = self
+        address, bound_port = self._server.server_address[:2]
+        self.url = public_url or f"http://{address}:{bound_port}{self.path}"
+
+    def __enter__(self) -> "CallbackReceiver":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self) -> "CallbackReceiver":
+        """
+        Start accepting notifications on a background thread.
+
+        :return: The receiver.
+        """
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="py-twelvelabs-callback-receiver", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop accepting notifications and close the listening socket.
+        """
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def add_listener(self, listener: Callable[[Text, Text], None]):
+        """
+        Register a function to be called, from the receiver's threads, with the task ID and status of every notification.
+
+        :param listener: Function to call.
+        """
+
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Text, Text], None]):
+        """
+        Unregister a function added with add_listener.
+
+        :param listener: Function to unregister.
+        """
+
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def get_status(self, task_id: Text) -> Optional[Text]:
+        """
+        Get the status of a recently notified task, e.g. for a task that completed before it started being watched.
+
+        :param task_id: Task ID.
+        :return: Notified status, or None if no notification was received for the task.
+        """
+
+        with self._lock:
+            return self._statuses.get(task_id)
+
+    def get_index_id(self, task_id: Text) -> Optional[Text]:
+        """
+        Get the index ID of a recently notified task.
+
+        :param task_id: Task ID.
+        :return: Index ID, or None if no notification with an index ID was received for the task.
+        """
+
+        with self._lock:
+            return self._index_ids.get(task_id)
+
+    def handle(self, path: Text, headers: Dict, body: bytes) -> int:
+        """
+        Handle a notification.
+
+        :param path: Request path.
+        :param headers: Request headers.
+        :param body: Request body.
+        :return: Status code of the response.
+        """
+
+        if path.split("?", 1)[0] != self.path:
+            return 404
+        if not verify_callback(body, headers.get(SIGNATURE_HEADER), self.secret, self.max_age):
+            with self._lock:
+                self.rejected_count += 1
+            self.logger.warning("Rejected a task notification with a missing, invalid or expired signature.")
+            return 401
+
+        try:
+            task_id, status, index_id = self._parse(json.loads(body))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return 400
+
+        with self._lock:
+            self.notification_count += 1
+            self._statuses[task_id] = status
+            self._statuses.move_to_end(task_id)
+            if index_id is not None:
+                self._index_ids[task_id] = index_id
+            while len(self._statuses) > settings.CALLBACK_HISTORY_SIZE:
+                oldest_task_id, _ = self._statuses.popitem(last=False)
+                self._index_ids.pop(oldest_task_id, None)
+            listeners = list(self._listeners)
+
+        self.logger.debug("Received a notification that task %s is %s.", task_id, status, extra={"task_id": task_id, "status": status})
+        for listener in listeners:
+            try:
+                listener(task_id, status)
+            except Exception:
+                self.logger.exception("Listener for task %s notifications raised an exception.", task_id)
+        return 204
+
+    @staticmethod
+    def _parse(payload: Dict) -> Tuple[Text, Text, Optional[Text]]:
+        """
+        Get the task ID, status and index ID of a notification.
+
+        :param payload: Notification payload.
+        :return: Task ID, status, and index ID or None if the notification does not include it.
+        """
+
+        data = payload.get('data', payload)
+        task_id = data.get('_id') or data.get('id') or data['task_id']
+        status = data.get('status') or payload['type'].rsplit(".", 1)[-1]
+        index_id = data.get('index_id')
+        return str(task_id), str(status), str(index_id) if index_id is not None else None
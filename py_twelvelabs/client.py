@@ -1,30 +1,194 @@
 import os
+import time
 import requests
-from typing import Text, Dict
-from requests_toolbelt.multipart.encoder import MultipartEncoder
+import threading
+from functools import cached_property
+from typing import TYPE_CHECKING, Text, Dict, Tuple, Callable, Optional
+from requests.adapters import HTTPAdapter
 
 from py_twelvelabs.settings import settings
 from py_twelvelabs.utilities.logger import get_logger
-from py_twelvelabs.resources import IndexResource, TaskResource, SearchResource
+from py_twelvelabs.utilities.retry import RetryPolicy
+from py_twelvelabs.utilities.rate_limiter import RateLimiter
+from py_twelvelabs.utilities.cache import ResponseCache
+from py_twelvelabs.utilities.search_cache import SearchCache
+from py_twelvelabs.utilities.metrics import Metrics, TimedHTTPConnectionPool, TimedHTTPSConnectionPool
+from py_twelvelabs.utilities.single_flight import SingleFlight
+from py_twelvelabs.utilities.deadline import Deadline, get_deadline
 from py_twelvelabs.exceptions import MissingAPIKeyError, MethodNotImplementedError
 
+if TYPE_CHECKING:
+    from py_twelvelabs.watcher import TaskWatcher
+    from py_twelvelabs.callbacks import CallbackReceiver
+    from py_twelvelabs.utilities.dedup import UploadRegistry
+    from py_twelvelabs.resources import IndexResource, TaskResource, SearchResource
+
 
 class TwelveLabsAPIClient:
     """
     Twelve Labs API client.
+
+    The client keeps a pooled, keep-alive HTTP session that is shared by all of its resources.
+    It can be used as a context manager to release the pooled connections when done.
     """
 
-    def __init__(self, api_key: Text = None):
+    def __init__(self, api_key: Text = None, pool_connections: int = None, pool_maxsize: int = None, keep_alive: bool = None, idle_timeout: float = None, retry_policy: RetryPolicy = None, rate_limiter: RateLimiter = None, cache: ResponseCache = None, search_cache: SearchCache = None, metrics: Metrics = None, connect_timeout: float = None, read_timeout: float = None, callback_receiver: "CallbackReceiver" = None, upload_registry: "UploadRegistry" = None):
         """
         Initialize the Twelve Labs API client.
+
+        :param api_key: API key.
+        :param pool_connections: Number of per-host connection pools to cache. Defaults to settings.POOL_CONNECTIONS.
+        :param pool_maxsize: Maximum number of connections kept open per host. Defaults to settings.POOL_MAXSIZE.
+        :param keep_alive: Whether to reuse connections between requests. Defaults to settings.KEEP_ALIVE.
+        :param idle_timeout: Seconds after which idle pooled connections are discarded. Defaults to settings.IDLE_TIMEOUT.
+        :param retry_policy: Policy for retrying failed requests. Defaults to a policy built from the RETRY_* settings.
+        :param rate_limiter: Client-side rate limiter. Defaults to a limiter built from the RATE_LIMIT* settings.
+        :param cache: Cache of index and task responses. Defaults to a cache built from the CACHE_* settings if settings.CACHE_ENABLED is set, and to no caching otherwise.
+        :param search_cache: Cache of search results. Defaults to a cache built from the SEARCH_CACHE_* settings if settings.SEARCH_CACHE_ENABLED is set, and to no caching otherwise.
+        :param metrics: Instrumentation of API calls. Defaults to in-memory metrics, enabled by settings.METRICS_ENABLED.
+        :param connect_timeout: Seconds to wait for a connection to be established, or None to wait forever. Defaults to settings.CONNECT_TIMEOUT.
+        :param read_timeout: Seconds to wait between bytes received from the API, or None to wait forever. Defaults to settings.READ_TIMEOUT.
+        :param callback_receiver: Receiver of task notifications. When given, watched tasks are polled when a notification arrives, or after settings.CALLBACK_FALLBACK_TIMEOUT if none does. Notifications of ready tasks also invalidate the search cache.
+        :param upload_registry: Record of uploaded video files, used to skip uploading the same content to an index twice. Defaults to a registry built from the DEDUP_* settings if settings.DEDUP_ENABLED is set, and to no deduplication otherwise.
         """
 
         self.api_key = self._get_api_key(api_key)
         self.logger = get_logger(__name__)
 
-        self.index = IndexResource(self)
-        self.task = TaskResource(self)
-        self.search = SearchResource(self)
+        self.pool_connections = pool_connections if pool_connections is not None else settings.POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize if pool_maxsize is not None else settings.POOL_MAXSIZE
+        self.keep_alive = keep_alive if keep_alive is not None else settings.KEEP_ALIVE
+        self.idle_timeout = idle_timeout if idle_timeout is not None else settings.IDLE_TIMEOUT
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(namespace=self.api_key)
+        self.cache = cache if cache is not None else (ResponseCache() if settings.CACHE_ENABLED else None)
+        self.search_cache = search_cache if search_cache is not None else (SearchCache() if settings.SEARCH_CACHE_ENABLED else None)
+        self.single_flight = SingleFlight()
+        self.metrics = metrics if metrics is not None else Metrics(enabled=settings.METRICS_ENABLED)
+        self.connect_timeout = connect_timeout if connect_timeout is not None else settings.CONNECT_TIMEOUT
+        self.read_timeout = read_timeout if read_timeout is not None else settings.READ_TIMEOUT
+        self.callback_receiver = callback_receiver
+        self.upload_registry = upload_registry if upload_registry is not None else (self._create_upload_registry() if settings.DEDUP_ENABLED else None)
+
+        self._session_lock = threading.Lock()
+        self._session = None
+        self._last_used_at = None
+        self._task_watcher = None
+
+        if self.callback_receiver is not None and self.search_cache is not None:
+            self.callback_receiver.add_listener(self._on_callback)
+
+    def _on_callback(self, task_id: Text, status: Text):
+        if status != "ready":
+            return
+        index_id = self.callback_receiver.get_index_id(task_id)
+        if index_id is not None:
+            self.search_cache.invalidate(index_id)
+        else:
+            self.search_cache.clear()
+
+    @staticmethod
+    def _create_upload_registry() -> "UploadRegistry":
+        from py_twelvelabs.utilities.dedup import UploadRegistry
+        return UploadRegistry()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @cached_property
+    def index(self) -> "IndexResource":
+        """
+        Index resource. It is created on first use.
+        """
+
+        from py_twelvelabs.resources import IndexResource
+        return IndexResource(self)
+
+    @cached_property
+    def task(self) -> "TaskResource":
+        """
+        Task resource. It is created on first use.
+        """
+
+        from py_twelvelabs.resources import TaskResource
+        return TaskResource(self)
+
+    @cached_property
+    def search(self) -> "SearchResource":
+        """
+        Search resource. It is created on first use.
+        """
+
+        from py_twelvelabs.resources import SearchResource
+        return SearchResource(self)
+
+    @property
+    def task_watcher(self) -> "TaskWatcher":
+        """
+        Task watcher shared by all callers waiting on tasks of this client. It is created on first use.
+        """
+
+        with self._session_lock:
+            if self._task_watcher is None:
+                from py_twelvelabs.watcher import TaskWatcher
+                self._task_watcher = TaskWatcher(self)
+            return self._task_watcher
+
+    def close(self):
+        """
+        Stop the task watcher and listening for task notifications, close the HTTP session and release all pooled connections.
+        """
+
+        if self._task_watcher is not None:
+            self._task_watcher.close()
+            self._task_watcher = None
+
+        if self.callback_receiver is not None and self.search_cache is not None:
+            self.callback_receiver.remove_listener(self._on_callback)
+
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create an HTTP session backed by a connection pool.
+
+        :return: HTTP session.
+        """
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        adapter.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get_session(self) -> requests.Session:
+        """
+        Get the shared HTTP session.
+
+        The session is created on first use. Pooled connections that have been idle for longer than the idle timeout are dropped, so that stale connections closed by the server are not reused.
+
+        :return: HTTP session.
+        """
+
+        with self._session_lock:
+            now = time.monotonic()
+            if self._session is not None and self._last_used_at is not None and now - self._last_used_at > self.idle_timeout:
+                self.logger.debug("Discarding connections idle for more than %s seconds.", self.idle_timeout)
+                self._session.close()
+                self._session = None
+
+            if self._session is None:
+                self._session = self._create_session()
+
+            self._last_used_at = now
+            return self._session
 
     def _get_api_key(self, api_key: Text = None) -> Text:
         """
@@ -57,6 +221,8 @@ class TwelveLabsAPIClient:
             'Content-Type': 'application/json',
             'x-api-key': self.api_key
         })
+        if not self.keep_alive:
+            headers['Connection'] = 'close'
         return headers
 
     def _get_url(self, endpoint: str) -> Text:
@@ -69,10 +235,23 @@ class TwelveLabsAPIClient:
 
         return f"{settings.BASE_API_URL}/{settings.API_VERSION}/{endpoint}"
 
+    def _get_timeout(self, call_deadline: Deadline) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Get the connect and read timeouts of a request, capped to the time left before the deadline of the call.
+
+        :param call_deadline: Deadline of the call.
+        :return: Connect and read timeouts.
+        """
+
+        return call_deadline.get_timeout(self.connect_timeout), call_deadline.get_timeout(self.read_timeout)
+
     def submit_request(self, endpoint: str, headers: Dict = None, params: Dict = None, data: Dict = None, method: str = "GET") -> requests.Response:
         """
         Submit a request to the Twelve Labs API.
 
+        Requests wait for the client's rate limiter before every attempt. Idempotent requests and safe POSTs that fail with a retryable status code or a connection error are retried according to the client's retry policy.
+        Retries stop at the deadline of the current deadline scope, and raise RequestCancelledError once its cancel token is cancelled.
+
         :param endpoint: API endpoint.
         :param headers: Request headers. The API key and content type are automatically added.
         :param params: Request parameters.
@@ -83,32 +262,89 @@ class TwelveLabsAPIClient:
 
         url = self._get_url(endpoint)
         headers = self._get_headers(headers)
+        call_deadline = get_deadline()
+
+        retry_policy = self.retry_policy.for_endpoint(endpoint)
+        is_retryable = retry_policy.is_retryable_request(method, endpoint)
+        started_at = time.monotonic()
+        retry_number = 1
+
+        while True:
+            call_deadline.check()
+            timer = self.metrics.start_request(endpoint, method, retry_number)
+            try:
+                self.rate_limiter.acquire(endpoint)
+                call_deadline.check()
+                timer.mark("queue")
+                response = self._send(url, headers, params, data, method, self._get_timeout(call_deadline))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                timer.finish(error=e)
+                call_deadline.check()
+                backoff = retry_policy.get_backoff(retry_number)
+                if not is_retryable or not retry_policy.can_retry(retry_number, started_at, backoff) or not call_deadline.allows(backoff):
+                    raise
+                self.logger.warning("%s %s failed with %s, retrying in %.2f seconds.", method, endpoint, e, backoff)
+            except BaseException as e:
+                timer.finish(error=e)
+                raise
+            else:
+                timer.mark_response(response.elapsed.total_seconds())
+                timer.finish(response.status_code)
+                self.metrics.instrument_response(response, endpoint, method)
+                if not is_retryable or not retry_policy.is_retryable_status(response.status_code):
+                    return response
+                backoff = retry_policy.get_backoff(retry_number, response.headers.get("Retry-After"))
+                if not retry_policy.can_retry(retry_number, started_at, backoff) or not call_deadline.allows(backoff):
+                    return response
+                self.logger.warning("%s %s failed with status %s, retrying in %.2f seconds.", method, endpoint, response.status_code, backoff)
+
+            call_deadline.sleep(backoff)
+            retry_number += 1
+
+    def _send(self, url: Text, headers: Dict, params: Dict, data: Dict, method: str, timeout: Tuple[Optional[float], Optional[float]] = None) -> requests.Response:
+        """
+        Send a single request over the shared session.
+
+        :param url: Request URL.
+        :param headers: Request headers.
+        :param params: Request parameters.
+        :param data: Request data.
+        :param method: HTTP method.
+        :param timeout: Connect and read timeouts.
+        :return: Response data.
+        """
+
+        session = self._get_session()
 
         if method == "GET":
-            response = requests.get(
+            response = session.get(
                 url=url,
                 headers=headers,
                 params=params,
+                timeout=timeout,
             )
 
         elif method == "POST":
-            response = requests.post(
+            response = session.post(
                 url=url,
                 headers=headers,
                 json=data,
+                timeout=timeout,
             )
 
         elif method == "PUT":
-            response = requests.put(
+            response = session.put(
                 url=url,
                 headers=headers,
                 json=data,
+                timeout=timeout,
             )
 
         elif method == "DELETE":
-            response = requests.delete(
+            response = session.delete(
                 url=url,
                 headers=headers,
+                timeout=timeout,
             )
 
         else:
@@ -116,29 +352,51 @@ class TwelveLabsAPIClient:
 
         return response
 
-    def submit_multi_part_request(self, endpoint: str, data: Dict, headers: Dict = None, method: str = "GET") -> requests.Response:
+    def submit_multi_part_request(self, endpoint: str, data: Dict, headers: Dict = None, method: str = "GET", chunk_size: int = None, progress_callback: Callable[[int, int], None] = None) -> requests.Response:
         """
         Submit a multi-part request to the Twelve Labs API.
 
+        The body is streamed in chunks, so files are never loaded into memory as a whole.
+
         :param endpoint: API endpoint.
         :param headers: Request headers. The API key and content type are automatically added.
         :param data: Request data.
         :param method: HTTP method.
+        :param chunk_size: Number of bytes read from the body at a time. Defaults to settings.UPLOAD_CHUNK_SIZE.
+        :param progress_callback: Function called after every chunk with the number of bytes sent and the total number of bytes.
         :return: Response data.
         """
 
         url = self._get_url(endpoint)
         headers = self._get_headers(headers)
 
-        multipart_data = MultipartEncoder(fields=data)
+        from requests_toolbelt.multipart.encoder import MultipartEncoder
+        from py_twelvelabs.utilities.upload import UploadStream
+
+        multipart_data = UploadStream(MultipartEncoder(fields=data), chunk_size or settings.UPLOAD_CHUNK_SIZE, progress_callback)
         headers['Content-Type'] = multipart_data.content_type
+        session = self._get_session()
 
         if method == "POST":
-            response = requests.post(
-                url=url,
-                headers=headers,
-                data=multipart_data,
-            )
+            call_deadline = get_deadline()
+            call_deadline.check()
+            timer = self.metrics.start_request(endpoint, method)
+            try:
+                self.rate_limiter.acquire(endpoint)
+                call_deadline.check()
+                timer.mark("queue")
+                response = session.post(
+                    url=url,
+                    headers=headers,
+                    data=multipart_data,
+                    timeout=self._get_timeout(call_deadline),
+                )
+            except BaseException as e:
+                timer.finish(error=e)
+                raise
+            timer.mark_response(response.elapsed.total_seconds())
+            timer.finish(response.status_code)
+            self.metrics.instrument_response(response, endpoint, method)
 
         else:
             raise MethodNotImplementedError(f"Method {method} not supported yet.")
@@ -38,4 +38,32 @@ class TaskFailedError(Exception):
     """
     Raised when a task fails.
     """
-    pass
\ No newline at end of file
+    pass
+
+
+class MissingDependencyError(Exception):
+    """
+    Raised when an optional dependency required by a feature is not installed.
+    """
+    pass
+
+
+class ResumableUploadError(Exception):
+    """
+    Raised when parts of a resumable upload could not be sent.
+    """
+    pass
+
+
+class DeadlineExceededError(Exception):
+    """
+    Raised when a call does not complete before its deadline.
+    """
+    pass
+
+
+class RequestCancelledError(Exception):
+    """
+    Raised when a call is cancelled with a cancel token.
+    """
+    pass
@@ -0,0 +1,368 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Text, Dict, List, Tuple, Iterable, Optional
+
+from py_twelvelabs.models import Index, Task
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.logger import get_logger
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexes (
+    id TEXT PRIMARY KEY,
+    index_name TEXT NOT NULL,
+    engine_id TEXT,
+    video_count INTEGER,
+    total_duration REAL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS indexes_index_name ON indexes (index_name);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    index_id TEXT NOT NULL,
+    video_id TEXT,
+    status TEXT NOT NULL,
+    filename TEXT,
+    duration REAL,
+    width INTEGER,
+    height INTEGER,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_index_id_filename ON tasks (index_id, filename);
+CREATE INDEX IF NOT EXISTS tasks_index_id_duration ON tasks (index_id, duration);
+CREATE INDEX IF NOT EXISTS tasks_index_id_width_height ON tasks (index_id, width, height);
+CREATE INDEX IF NOT EXISTS tasks_filename ON tasks (filename);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS tasks_updated_at ON tasks (updated_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    kind TEXT PRIMARY KEY,
+    updated_at TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+# Timestamps are stored in a fixed-width format, so that they sort and compare as text.
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+_TASK_SORT_COLUMNS = ("created_at", "updated_at", "filename", "duration", "width", "height")
+
+
+def _format_datetime(value: datetime) -> Text:
+    return value.strftime(_DATETIME_FORMAT)
+
+
+class SyncResult:
+    """
+    Number of indexes and tasks written and removed by a sync.
+    """
+
+    __slots__ = ("indexes", "tasks", "removed")
+
+    def __init__(self, indexes: int = 0, tasks: int = 0, removed: int = 0):
+        self.indexes = indexes
+        self.tasks = tasks
+        self.removed = removed
+
+    def __repr__(self) -> Text:
+        return f"SyncResult(indexes={self.indexes}, tasks={self.tasks}, removed={self.removed})"
+
+
+class _BaseMetadataMirror:
+    """
+    Storage and queries shared by the synchronous and asynchronous metadata mirrors.
+
+    Indexes and tasks are kept in a local SQLite database, with the task metadata that listings are filtered on (file
+    name, duration, width and height) in indexed columns. Each sync lists indexes and tasks by last update, newest first,
+    and stops at the newest update seen by the previous sync. A full sync lists everything and also removes the indexes
+    and tasks that no longer exist.
+    """
+
+    def __init__(self, client, path: Text = None):
+        """
+        Initialize the mirror.
+
+        :param client: Client the indexes and tasks are listed with.
+        :param path: Path of the SQLite database, or ":memory:". Defaults to settings.MIRROR_DATABASE, or to mirror.sqlite3 in the py_twelvelabs directory of the user's cache directory.
+        """
+
+        self.client = client
+        self.path = path or settings.MIRROR_DATABASE or os.path.join(os.path.expanduser("~"), ".cache", "py_twelvelabs", "mirror.sqlite3")
+        self.logger = get_logger(__name__)
+        if self.path != ":memory:" and os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        with self._lock:
+            if self.path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def get_index(self, index_id: Text) -> Optional[Index]:
+        """
+        Get a mirrored index.
+
+        :param index_id: Index ID.
+        :return: Index, or None if it is not in the mirror.
+        """
+
+        rows = self._query("SELECT data FROM indexes WHERE id = ?", (index_id,))
+        return Index(**json.loads(rows[0][0])) if rows else None
+
+    def find_indexes(self, index_name: Text = None) -> List[Index]:
+        """
+        Find mirrored indexes, most recently updated first.
+
+        :param index_name: Index name.
+        :return: Indexes.
+        """
+
+        if index_name is None:
+            rows = self._query("SELECT data FROM indexes ORDER BY updated_at DESC", ())
+        else:
+            rows = self._query("SELECT data FROM indexes WHERE index_name = ? ORDER BY updated_at DESC", (index_name,))
+        return [Index(**json.loads(row[0])) for row in rows]
+
+    def get_task(self, task_id: Text) -> Optional[Task]:
+        """
+        Get a mirrored task.
+
+        :param task_id: Task ID.
+        :return: Task, or None if it is not in the mirror.
+        """
+
+        rows = self._query("SELECT data FROM tasks WHERE id = ?", (task_id,))
+        return Task(**json.loads(rows[0][0])) if rows else None
+
+    def find_tasks(self, index_id: Text = None, status: Text = None, filename: Text = None, duration: float = None, min_duration: float = None, max_duration: float = None, width: int = None, height: int = None, sort_by: Text = "updated_at", sort_option: Text = "desc", limit: int = None, offset: int = 0) -> List[Task]:
+        """
+        Find mirrored tasks, with the same filters as TaskResource.list, answered from the local database.
+
+        :param index_id: Index ID.
+        :param status: Task status.
+        :param filename: Video file name.
+        :param duration: Video duration in seconds.
+        :param min_duration: Minimum video duration in seconds.
+        :param max_duration: Maximum video duration in seconds.
+        :param width: Video width.
+        :param height: Video height.
+        :param sort_by: Field to sort by: created_at, updated_at, filename, duration, width or height.
+        :param sort_option: Sort order, asc or desc.
+        :param limit: Maximum number of tasks.
+        :param offset: Number of matching tasks to skip.
+        :return: Tasks.
+        """
+
+        where, params = self._get_task_filter(index_id, status, filename, duration, min_duration, max_duration, width, height)
+        if sort_by not in _TASK_SORT_COLUMNS:
+            raise ValueError(f"Tasks cannot be sorted by {sort_by}, only by one of {_TASK_SORT_COLUMNS}.")
+        order = "ASC" if sort_option == "asc" else "DESC"
+        sql = f"SELECT data FROM tasks{where} ORDER BY {sort_by} {order}, id {order} LIMIT ? OFFSET ?"
+        rows = self._query(sql, (*params, -1 if limit is None else limit, offset))
+        return [Task(**json.loads(row[0])) for row in rows]
+
+    def count_tasks(self, index_id: Text = None, status: Text = None, filename: Text = None, duration: float = None, min_duration: float = None, max_duration: float = None, width: int = None, height: int = None) -> int:
+        """
+        Count mirrored tasks, with the filters of find_tasks.
+
+        :return: Number of matching tasks.
+        """
+
+        where, params = self._get_task_filter(index_id, status, filename, duration, min_duration, max_duration, width, height)
+        return self._query(f"SELECT COUNT(*) FROM tasks{where}", params)[0][0]
+
+    def get_last_sync(self, kind: Text) -> Optional[Tuple[Optional[datetime], float]]:
+        """
+        Get the state of the last sync of indexes or tasks.
+
+        :param kind: "indexes" or "tasks".
+        :return: Newest update time seen and Unix time of the sync, or None if they were never synced.
+        """
+
+        rows = self._query("SELECT updated_at, synced_at FROM sync_state WHERE kind = ?", (kind,))
+        if not rows:
+            return None
+        updated_at, synced_at = rows[0]
+        return (datetime.strptime(updated_at, _DATETIME_FORMAT) if updated_at else None), synced_at
+
+    @staticmethod
+    def _get_task_filter(index_id, status, filename, duration, min_duration, max_duration, width, height) -> Tuple[Text, Tuple]:
+        conditions, params = [], []
+        for column, operator, value in (("index_id", "=", index_id), ("status", "=", status), ("filename", "=", filename), ("duration", "=", duration), ("duration", ">=", min_duration), ("duration", "<=", max_duration), ("width", "=", width), ("height", "=", height)):
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), tuple(params)
+
+    def _query(self, sql: Text, params: Tuple) -> List[Tuple]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def _get_watermark(self, kind: Text, full: bool) -> Optional[datetime]:
+        if full:
+            return None
+        last_sync = self.get_last_sync(kind)
+        return last_sync[0] if last_sync is not None else None
+
+    def _write_indexes(self, indexes: Iterable[Index]) -> int:
+        rows = [(index.id, index.index_name, index.engine_id, index.video_count, index.total_duration, _format_datetime(index.created_at), _format_datetime(index.updated_at), index.model_dump_json(by_alias=True)) for index in indexes]
+        return self._write("indexes", ("id", "index_name", "engine_id", "video_count", "total_duration", "created_at", "updated_at", "data"), rows)
+
+    def _write_tasks(self, tasks: Iterable[Task]) -> int:
+        rows = []
+        for task in tasks:
+            metadata = task.metadata or {}
+            rows.append((task.id, task.index_id, task.video_id, task.status, metadata.get('filename'), metadata.get('duration'), metadata.get('width'), metadata.get('height'), _format_datetime(task.created_at), _format_datetime(task.updated_at), task.model_dump_json(by_alias=True)))
+        return self._write("tasks", ("id", "index_id", "video_id", "status", "filename", "duration", "width", "height", "created_at", "updated_at", "data"), rows)
+
+    def _write(self, table: Text, columns: Tuple[Text, ...], rows: List[Tuple]) -> int:
+        """
+        Insert or update rows in one transaction, skipping those that are already stored unchanged.
+
+        :param table: Table name.
+        :param columns: Column names, starting with id and ending with data.
+        :param rows: Rows.
+        :return: Number of rows written.
+        """
+
+        if not rows:
+            return 0
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            stored = dict(self._connection.execute(f"SELECT id, data FROM {table} WHERE id IN ({', '.join('?' * len(rows))})", [row[0] for row in rows]))
+            rows = [row for row in rows if stored.get(row[0]) != row[-1]]
+            self._connection.executemany(f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", rows)
+        return len(rows)
+
+    def _finish_sync(self, kind: Text, newest: Optional[datetime], seen_ids: Optional[set]) -> int:
+        """
+        Record the newest update seen by a sync and, after a full sync, remove the rows that were not seen.
+
+        :param kind: "indexes" or "tasks".
+        :param newest: Newest update time seen.
+        :param seen_ids: IDs listed by a full sync, or None after an incremental sync.
+        :return: Number of rows removed.
+        """
+
+        removed = 0
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            if seen_ids is not None:
+                stale_ids = [row[0] for row in self._connection.execute(f"SELECT id FROM {kind}") if row[0] not in seen_ids]
+                self._connection.executemany(f"DELETE FROM {kind} WHERE id = ?", [(stale_id,) for stale_id in stale_ids])
+                removed = len(stale_ids)
+            previous = self._connection.execute("SELECT updated_at FROM sync_state WHERE kind = ?", (kind,)).fetchone()
+            watermark = _format_datetime(newest) if newest is not None else None
+            if previous is not None and previous[0] is not None and (watermark is None or previous[0] > watermark):
+                watermark = previous[0]
+            self._connection.execute("INSERT OR REPLACE INTO sync_state (kind, updated_at, synced_at) VALUES (?, ?, ?)", (kind, watermark, time.time()))
+        return removed
+
+
+class MetadataMirror(_BaseMetadataMirror):
+    """
+    Local, queryable mirror of the indexes and tasks of an account, kept up to date with incremental syncs.
+    """
+
+    def __enter__(self) -> "MetadataMirror":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def sync(self, full: bool = False) -> SyncResult:
+        """
+        Bring the mirror up to date.
+
+        :param full: List every index and task instead of only those updated since the last sync, and remove those that no longer exist.
+        :return: Numbers of indexes and tasks written and removed.
+        """
+
+        result = SyncResult()
+        for kind, iter_all in (("indexes", self.client.index.iter_all), ("tasks", self.client.task.iter_all)):
+            watermark = self._get_watermark(kind, full)
+            seen_ids = set() if full else None
+            newest, batch = None, []
+            write = self._write_indexes if kind == "indexes" else self._write_tasks
+
+            items = iter_all(page_limit=settings.MIRROR_PAGE_LIMIT, prefetch=settings.MIRROR_PREFETCH_PAGES, sort_by="updated_at", sort_option="desc")
+            try:
+                for item in items:
+                    if watermark is not None and item.updated_at < watermark:
+                        break
+                    newest = item.updated_at if newest is None else max(newest, item.updated_at)
+                    if seen_ids is not None:
+                        seen_ids.add(item.id)
+                    batch.append(item)
+                    if len(batch) >= settings.MIRROR_PAGE_LIMIT:
+                        setattr(result, kind, getattr(result, kind) + write(batch))
+                        batch = []
+            finally:
+                items.close()
+
+            setattr(result, kind, getattr(result, kind) + write(batch))
+            result.removed += self._finish_sync(kind, newest, seen_ids)
+
+        self.logger.info("Synced the metadata mirror: %d indexes and %d tasks written, %d removed.", result.indexes, result.tasks, result.removed)
+        return result
+
+
+class AsyncMetadataMirror(_BaseMetadataMirror):
+    """
+    Local, queryable mirror of the indexes and tasks of an account, kept up to date with incremental syncs through an
+    asynchronous client. Queries are answered from the local database and do not need to be awaited.
+    """
+
+    async def __aenter__(self) -> "AsyncMetadataMirror":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def sync(self, full: bool = False) -> SyncResult:
+        """
+        Bring the mirror up to date.
+
+        :param full: List every index and task instead of only those updated since the last sync, and remove those that no longer exist.
+        :return: Numbers of indexes and tasks written and removed.
+        """
+
+        result = SyncResult()
+        for kind, iter_all in (("indexes", self.client.index.iter_all), ("tasks", self.client.task.iter_all)):
+            watermark = self._get_watermark(kind, full)
+            seen_ids = set() if full else None
+            newest, batch = None, []
+            write = self._write_indexes if kind == "indexes" else self._write_tasks
+
+            items = iter_all(page_limit=settings.MIRROR_PAGE_LIMIT, prefetch=settings.MIRROR_PREFETCH_PAGES, sort_by="updated_at", sort_option="desc")
+            try:
+                async for item in items:
+                    if watermark is not None and item.updated_at < watermark:
+                        break
+                    newest = item.updated_at if newest is None else max(newest, item.updated_at)
+                    if seen_ids is not None:
+                        seen_ids.add(item.id)
+                    batch.append(item)
+                    if len(batch) >= settings.MIRROR_PAGE_LIMIT:
+                        setattr(result, kind, getattr(result, kind) + write(batch))
+                        batch = []
+            finally:
+                await items.aclose()
+
+            setattr(result, kind, getattr(result, kind) + write(batch))
+            result.removed += self._finish_sync(kind, newest, seen_ids)
+
+        self.logger.info("Synced the metadata mirror: %d indexes and %d tasks written, %d removed.", result.indexes, result.tasks, result.removed)
+        return result
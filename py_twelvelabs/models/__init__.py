@@ -1,2 +1,4 @@
 from py_twelvelabs.models.index import Index
-from py_twelvelabs.models.task import Task, TaskStatus
\ No newline at end of file
+from py_twelvelabs.models.task import Task, TaskStatus, BulkTaskResult
+from py_twelvelabs.models.search import Clip, SearchResult, BatchSearchResult
+from py_twelvelabs.models.columns import ClipColumns
@@ -0,0 +1,61 @@
+from array import array
+from typing import Text, List, Iterable, Optional
+
+from py_twelvelabs.models.search import Clip
+from py_twelvelabs.exceptions import MissingDependencyError
+
+
+class ClipColumns:
+    """
+    Column-oriented view of search result clips.
+
+    Scores and timestamps are stored as contiguous, writable float64 arrays: NumPy arrays when NumPy is installed, which
+    support vectorized ranking and thresholding, or array.array otherwise. Video IDs and confidences are kept as lists.
+    """
+
+    def __init__(self, video_ids: List[Text], scores, starts, ends, confidences: List[Optional[Text]]):
+        self.video_ids = video_ids
+        self.scores = scores
+        self.starts = starts
+        self.ends = ends
+        self.confidences = confidences
+
+    @classmethod
+    def from_clips(cls, clips: Iterable[Clip], use_numpy: bool = None) -> "ClipColumns":
+        """
+        Build columns from clips.
+
+        :param clips: Clips.
+        :param use_numpy: Store scores and timestamps as NumPy arrays. Defaults to using NumPy if it is installed.
+        :return: Clip columns.
+        """
+
+        numpy = None
+        if use_numpy or use_numpy is None:
+            # NumPy is imported on first use, as importing it is slow.
+            try:
+                import numpy
+            except ImportError:
+                if use_numpy:
+                    raise MissingDependencyError("NumPy arrays require numpy. Install it with `pip install py_twelvelabs[numpy]`.")
+
+        video_ids, scores, starts, ends, confidences = [], array("d"), array("d"), array("d"), []
+        for clip in clips:
+            video_ids.append(clip.video_id)
+            scores.append(clip.score)
+            starts.append(clip.start)
+            ends.append(clip.end)
+            confidences.append(clip.confidence)
+
+        if numpy is not None:
+            scores, starts, ends = (numpy.array(column, dtype=numpy.float64) for column in (scores, starts, ends))
+        return cls(video_ids, scores, starts, ends, confidences)
+
+    def __len__(self) -> int:
+        return len(self.video_ids)
+
+    def __getitem__(self, position: int) -> Clip:
+        return Clip(self.video_ids[position], self.scores[position], self.starts[position], self.ends[position], self.confidences[position])
+
+    def to_clips(self) -> List[Clip]:
+        return [self[position] for position in range(len(self))]
@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Text, List, Optional
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
+
+from py_twelvelabs.utilities.dates import parse_datetime
 
 
 class Index(BaseModel):
@@ -8,7 +10,9 @@ class Index(BaseModel):
     Index model.
     """
 
-    _id: Text
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: Text = Field(alias="_id")
     index_name: Text
     index_options: List[Text]
     created_at: datetime
@@ -22,4 +26,6 @@ class Index(BaseModel):
 
     @validator("created_at", "updated_at", "expires_at", pre=True, allow_reuse=True)
     def parse_date(cls, value):
-        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ")
\ No newline at end of file
+        if isinstance(value, datetime):
+            return value
+        return parse_datetime(value)
\ No newline at end of file
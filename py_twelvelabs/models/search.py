@@ -0,0 +1,93 @@
+from typing import Text, Dict, List, Optional
+from pydantic import BaseModel
+
+
+class Clip:
+    """
+    Search result clip.
+
+    Clips are plain objects with __slots__ rather than pydantic models, since a result set can hold many thousands of
+    them: they take a fraction of the memory of a dict and are built without validation.
+    """
+
+    __slots__ = ("video_id", "score", "start", "end", "confidence", "thumbnail_url", "metadata", "modules", "index_id")
+
+    def __init__(self, video_id: Text, score: float, start: float, end: float, confidence: Optional[Text] = None, thumbnail_url: Optional[Text] = None, metadata: Optional[List[Dict]] = None, modules: Optional[List[Dict]] = None, index_id: Optional[Text] = None):
+        self.video_id = video_id
+        self.score = score
+        self.start = start
+        self.end = end
+        self.confidence = confidence
+        self.thumbnail_url = thumbnail_url
+        self.metadata = metadata
+        self.modules = modules
+        self.index_id = index_id
+
+    @classmethod
+    def from_api(cls, data: Dict) -> "Clip":
+        """
+        Build a clip from a search result returned by the API.
+
+        :param data: Search result.
+        :return: Clip.
+        """
+
+        return cls(data['video_id'], data['score'], data['start'], data['end'], data.get('confidence'), data.get('thumbnail_url'), data.get('metadata'), data.get('modules'))
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Clip) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> Text:
+        return f"Clip(video_id={self.video_id!r}, score={self.score!r}, start={self.start!r}, end={self.end!r}, confidence={self.confidence!r})"
+
+
+class SearchResult:
+    """
+    Page of search results with its clips parsed into Clip objects.
+    """
+
+    __slots__ = ("clips", "page_info", "search_pool")
+
+    def __init__(self, clips: List[Clip], page_info: Dict, search_pool: Optional[Dict] = None):
+        self.clips = clips
+        self.page_info = page_info
+        self.search_pool = search_pool
+
+    @classmethod
+    def from_api(cls, data: Dict) -> "SearchResult":
+        """
+        Build a search result page from the response of a search request.
+
+        :param data: Response data.
+        :return: Search result page.
+        """
+
+        return cls([Clip.from_api(clip) for clip in data['data']], data['page_info'], data.get('search_pool'))
+
+    @property
+    def next_page_token(self) -> Optional[Text]:
+        return self.page_info.get('next_page_token')
+
+    def __len__(self) -> int:
+        return len(self.clips)
+
+    def __iter__(self):
+        return iter(self.clips)
+
+
+class BatchSearchResult(BaseModel):
+    """
+    Result of a single query run as part of a batch search.
+    """
+
+    position: int
+    query: Dict
+    result: Optional[Dict] = None
+    error: Optional[Text] = None
+
+    @property
+    def is_successful(self) -> bool:
+        return self.error is None
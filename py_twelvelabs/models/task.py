@@ -1,7 +1,9 @@
 
 from datetime import datetime
 from typing import Text, Dict, Optional
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
+
+from py_twelvelabs.utilities.dates import parse_datetime
 
 
 class Task(BaseModel):
@@ -9,7 +11,9 @@ class Task(BaseModel):
     Task model.
     """
 
-    _id: Text
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: Text = Field(alias="_id")
     index_id: Text
     video_id: Optional[Text] = None
     status: Text
@@ -18,16 +22,13 @@ class Task(BaseModel):
     updated_at: datetime
     type: Optional[Text] = None
     estimated_time: Optional[datetime] = None
+    process: Optional[Dict] = None
 
     @validator("created_at", "updated_at", "estimated_time", pre=True, allow_reuse=True)
     def parse_date(cls, value):
-        formats = ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"]
-        for fmt in formats:
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
-        raise ValueError(f"time data '{value}' does not match any of the formats {formats}")
+        if value is None or isinstance(value, datetime):
+            return value
+        return parse_datetime(value)
     
 
 class TaskStatus(BaseModel):
@@ -40,4 +41,19 @@ class TaskStatus(BaseModel):
     validating: int
     pending: int
     failed: int
-    total_result: int
\ No newline at end of file
+    total_result: int
+
+
+class BulkTaskResult(BaseModel):
+    """
+    Result of creating a single task as part of a bulk ingestion.
+    """
+
+    video_file: Optional[Text] = None
+    video_url: Optional[Text] = None
+    task_id: Optional[Text] = None
+    error: Optional[Text] = None
+
+    @property
+    def is_successful(self) -> bool:
+        return self.error is None
@@ -1,3 +1,3 @@
-from py_twelvelabs.resources.task import TaskResource
-from py_twelvelabs.resources.index import IndexResource
-from py_twelvelabs.resources.search import SearchResource
\ No newline at end of file
+from py_twelvelabs.resources.task import TaskResource, AsyncTaskResource
+from py_twelvelabs.resources.index import IndexResource, AsyncIndexResource
+from py_twelvelabs.resources.search import SearchResource, AsyncSearchResource
\ No newline at end of file
@@ -1,7 +1,9 @@
-from typing import Text, List
+from typing import Text, List, Dict, Iterator, AsyncIterator
 
 from py_twelvelabs.settings import settings
 from py_twelvelabs.models import Index, TaskStatus
+from py_twelvelabs.utilities.cache import ResponseCache
+from py_twelvelabs.utilities.pagination import iter_items, aiter_items
 from py_twelvelabs.exceptions import APIRequestError
 
 
@@ -9,12 +11,12 @@ class IndexResource:
     def __init__(self, client):
         self.client = client
 
-    def create(self, index_name: Text, index_options: List[Text], engine_id: Text = settings.DEFAULT_ENGINE, addons: List[Text] = None) -> Text:
+    def create(self, index_name: Text, index_options: List[Text], engine_id: Text = None, addons: List[Text] = None) -> Text:
         """
         Create an index.
 
         :param index_name: Index name.
-        :param engine_id: Engine ID. 
+        :param engine_id: Engine ID. Defaults to settings.DEFAULT_ENGINE.
         :param index_options: Index options.
         :param addons: Addons.
         :return: Index ID.
@@ -22,7 +24,7 @@ class IndexResource:
 
         data = {
             "index_name": index_name,
-            "engine_id": engine_id,
+            "engine_id": engine_id if engine_id is not None else settings.DEFAULT_ENGINE,
             "index_options": index_options,
             "addons": addons,
         }
@@ -30,22 +32,41 @@ class IndexResource:
         response = self.client.submit_request("indexes", method="POST", data=data)
         result = response.json()
         if response.status_code == 201:
+            if self.client.cache is not None:
+                self.client.cache.invalidate_index()
             return result['_id']
         else:
             raise APIRequestError(f"Failed to create index {index_name}: {result['message']}")
 
     def get(self, index_id: Text) -> Index:
         """
-        Get an index.
+        Get an index. The index is served from the client's response cache when one is configured, and concurrent calls
+        for the same index share a single request.
 
         :param index_id: Index ID.
         :return: Index.
         """
-        
-        response = self.client.submit_request(f"indexes/{index_id}")
+
+        return self.client.single_flight.do(("indexes", index_id), lambda: self._get(index_id))
+
+    def _get(self, index_id: Text) -> Index:
+        cache = self.client.cache
+        generation = cache['index'].generation if cache is not None else None
+        entry = cache['index'].lookup(index_id) if cache is not None else None
+        if entry is not None and entry.is_fresh:
+            return entry.copy_value()
+
+        response = self.client.submit_request(f"indexes/{index_id}", headers=ResponseCache.get_conditional_headers(entry))
+        if response.status_code == 304 and entry is not None:
+            cache['index'].revalidate(index_id, entry, generation)
+            return entry.copy_value()
         result = response.json()
         if response.status_code == 200:
-            return Index(**result)
+            with self.client.metrics.time("parse", f"indexes/{index_id}"):
+                index = Index(**result)
+            if cache is not None:
+                cache['index'].set(index_id, index, response.headers.get("ETag"), generation)
+            return index
         else:
             raise APIRequestError(f"Failed to get index {index_id}: {result['message']}")
         
@@ -61,7 +82,8 @@ class IndexResource:
         result = response.json()
         if response.status_code == 200:
             if result is not None:
-                return TaskStatus(**result)
+                with self.client.metrics.time("parse", "tasks/status"):
+                    return TaskStatus(**result)
             else:
                 return None
         else:
@@ -69,7 +91,7 @@ class IndexResource:
         
     def list(self, page: int = 1, page_limit: Text = 10, sort_by: Text = "created_at", sort_option: Text = "desc", _id: Text = None, index_name: Text = None, index_options: List[Text] = None) -> List[Index]:
         """
-        List indexes.
+        List indexes. The page is served from the client's response cache when one is configured.
 
         :param page: Page number.
         :param page_limit: Page limit.
@@ -91,13 +113,65 @@ class IndexResource:
             "index_options": index_options,
         }
 
-        response = self.client.submit_request("indexes", params=params)
+        cache = self.client.cache
+        key = ResponseCache.get_key(params)
+        generation = cache['index_list'].generation if cache is not None else None
+        entry = cache['index_list'].lookup(key) if cache is not None else None
+        if entry is not None and entry.is_fresh:
+            return entry.copy_value()
+
+        response = self.client.submit_request("indexes", headers=ResponseCache.get_conditional_headers(entry), params=params)
+        if response.status_code == 304 and entry is not None:
+            cache['index_list'].revalidate(key, entry, generation)
+            return entry.copy_value()
         result = response.json()
         if response.status_code == 200:
-            return [Index(**index) for index in result['data']]
+            with self.client.metrics.time("parse", "indexes"):
+                indexes = [Index(**index) for index in result['data']]
+            if cache is not None:
+                cache['index_list'].set(key, indexes, response.headers.get("ETag"), generation)
+            return indexes
         else:
             raise APIRequestError(f"Failed to list indexes: {result['message']}")
         
+    def iter_all(self, page_limit: int = 50, max_items: int = None, prefetch: int = None, sort_by: Text = "created_at", sort_option: Text = "desc", _id: Text = None, index_name: Text = None, index_options: List[Text] = None) -> Iterator[Index]:
+        """
+        Lazily iterate over all indexes, one index at a time.
+
+        Pages are requested as the caller advances the iterator, with the next pages prefetched concurrently in the background.
+
+        :param page_limit: Page limit.
+        :param max_items: Maximum number of indexes to yield.
+        :param prefetch: Number of pages to fetch ahead. Defaults to settings.LIST_PREFETCH_PAGES.
+        :param sort_by: Sort by.
+        :param sort_option: Sort option.
+        :param _id: Index ID.
+        :param index_name: Index name.
+        :param index_options: Index options.
+        :return: Iterator of Indexes.
+        """
+
+        params = {
+            "page_limit": page_limit,
+            "sort_by": sort_by,
+            "sort_option": sort_option,
+            "_id": _id,
+            "index_name": index_name,
+            "index_options": index_options,
+        }
+
+        prefetch = prefetch if prefetch is not None else settings.LIST_PREFETCH_PAGES
+        for item in iter_items(self._get_page, params, max_items=max_items, prefetch=prefetch):
+            yield Index(**item)
+
+    def _get_page(self, params: Dict) -> Dict:
+        response = self.client.submit_request("indexes", params=params)
+        result = response.json()
+        if response.status_code == 200:
+            return result
+        else:
+            raise APIRequestError(f"Failed to list indexes: {result['message']}")
+
     # TODO: add metod to list all tasks
 
     def update(self, index_id: Text, index_name: Text) -> bool:
@@ -111,6 +185,8 @@ class IndexResource:
 
         response = self.client.submit_request(f"indexes/{index_id}", headers={"accept": "application/json"}, method="PUT", data={"index_name": index_name})
         if response.status_code == 200:
+            if self.client.cache is not None:
+                self.client.cache.invalidate_index(index_id)
             return True
         else:
             result = response.json()
@@ -126,7 +202,218 @@ class IndexResource:
 
         response = self.client.submit_request(f"indexes/{index_id}", method="DELETE")
         if response.status_code == 204:
+            if self.client.cache is not None:
+                self.client.cache.invalidate_index(index_id)
+            if self.client.search_cache is not None:
+                self.client.search_cache.invalidate(index_id)
+            if self.client.upload_registry is not None:
+                self.client.upload_registry.remove_index(index_id)
+            return True
+        else:
+            result = response.json()
+            raise APIRequestError(f"Failed to delete index {index_id}: {result['message']}")
+
+
+class AsyncIndexResource:
+    def __init__(self, client):
+        self.client = client
+
+    async def create(self, index_name: Text, index_options: List[Text], engine_id: Text = None, addons: List[Text] = None) -> Text:
+        """
+        Create an index.
+
+        :param index_name: Index name.
+        :param engine_id: Engine ID. Defaults to settings.DEFAULT_ENGINE.
+        :param index_options: Index options.
+        :param addons: Addons.
+        :return: Index ID.
+        """
+
+        data = {
+            "index_name": index_name,
+            "engine_id": engine_id if engine_id is not None else settings.DEFAULT_ENGINE,
+            "index_options": index_options,
+            "addons": addons,
+        }
+
+        response = await self.client.submit_request("indexes", method="POST", data=data)
+        result = response.json()
+        if response.status_code == 201:
+            if self.client.cache is not None:
+                self.client.cache.invalidate_index()
+            return result['_id']
+        else:
+            raise APIRequestError(f"Failed to create index {index_name}: {result['message']}")
+
+    async def get(self, index_id: Text) -> Index:
+        """
+        Get an index. The index is served from the client's response cache when one is configured, and concurrent calls
+        for the same index share a single request.
+
+        :param index_id: Index ID.
+        :return: Index.
+        """
+
+        return await self.client.single_flight.do(("indexes", index_id), lambda: self._get(index_id))
+
+    async def _get(self, index_id: Text) -> Index:
+        cache = self.client.cache
+        generation = cache['index'].generation if cache is not None else None
+        entry = cache['index'].lookup(index_id) if cache is not None else None
+        if entry is not None and entry.is_fresh:
+            return entry.copy_value()
+
+        response = await self.client.submit_request(f"indexes/{index_id}", headers=ResponseCache.get_conditional_headers(entry))
+        if response.status_code == 304 and entry is not None:
+            cache['index'].revalidate(index_id, entry, generation)
+            return entry.copy_value()
+        result = response.json()
+        if response.status_code == 200:
+            with self.client.metrics.time("parse", f"indexes/{index_id}"):
+                index = Index(**result)
+            if cache is not None:
+                cache['index'].set(index_id, index, response.headers.get("ETag"), generation)
+            return index
+        else:
+            raise APIRequestError(f"Failed to get index {index_id}: {result['message']}")
+
+    async def get_task_status(self, index_id: Text) -> TaskStatus:
+        """
+        Get task status.
+
+        :param index_id: Index ID.
+        :return: Task status.
+        """
+
+        response = await self.client.submit_request(f"tasks/status?index_id={index_id}")
+        result = response.json()
+        if response.status_code == 200:
+            if result is not None:
+                with self.client.metrics.time("parse", "tasks/status"):
+                    return TaskStatus(**result)
+            else:
+                return None
+        else:
+            raise APIRequestError(f"Failed to get task status for index {index_id}: {result['message']}")
+
+    async def list(self, page: int = 1, page_limit: Text = 10, sort_by: Text = "created_at", sort_option: Text = "desc", _id: Text = None, index_name: Text = None, index_options: List[Text] = None) -> List[Index]:
+        """
+        List indexes. The page is served from the client's response cache when one is configured.
+
+        :param page: Page number.
+        :param page_limit: Page limit.
+        :param sort_by: Sort by.
+        :param sort_option: Sort option.
+        :param _id: Index ID.
+        :param index_name: Index name.
+        :param index_options: Index options.
+        :return: List of Indexes.
+        """
+
+        params = {
+            "page": page,
+            "page_limit": page_limit,
+            "sort_by": sort_by,
+            "sort_option": sort_option,
+            "_id": _id,
+            "index_name": index_name,
+            "index_options": index_options,
+        }
+
+        cache = self.client.cache
+        key = ResponseCache.get_key(params)
+        generation = cache['index_list'].generation if cache is not None else None
+        entry = cache['index_list'].lookup(key) if cache is not None else None
+        if entry is not None and entry.is_fresh:
+            return entry.copy_value()
+
+        response = await self.client.submit_request("indexes", headers=ResponseCache.get_conditional_headers(entry), params=params)
+        if response.status_code == 304 and entry is not None:
+            cache['index_list'].revalidate(key, entry, generation)
+            return entry.copy_value()
+        result = response.json()
+        if response.status_code == 200:
+            with self.client.metrics.time("parse", "indexes"):
+                indexes = [Index(**index) for index in result['data']]
+            if cache is not None:
+                cache['index_list'].set(key, indexes, response.headers.get("ETag"), generation)
+            return indexes
+        else:
+            raise APIRequestError(f"Failed to list indexes: {result['message']}")
+
+    async def iter_all(self, page_limit: int = 50, max_items: int = None, prefetch: int = None, sort_by: Text = "created_at", sort_option: Text = "desc", _id: Text = None, index_name: Text = None, index_options: List[Text] = None) -> AsyncIterator[Index]:
+        """
+        Lazily iterate over all indexes, one index at a time.
+
+        Pages are requested as the caller advances the iterator, with the next pages prefetched concurrently in the background.
+
+        :param page_limit: Page limit.
+        :param max_items: Maximum number of indexes to yield.
+        :param prefetch: Number of pages to fetch ahead. Defaults to settings.LIST_PREFETCH_PAGES.
+        :param sort_by: Sort by.
+        :param sort_option: Sort option.
+        :param _id: Index ID.
+        :param index_name: Index name.
+        :param index_options: Index options.
+        :return: Iterator of Indexes.
+        """
+
+        params = {
+            "page_limit": page_limit,
+            "sort_by": sort_by,
+            "sort_option": sort_option,
+            "_id": _id,
+            "index_name": index_name,
+            "index_options": index_options,
+        }
+
+        prefetch = prefetch if prefetch is not None else settings.LIST_PREFETCH_PAGES
+        async for item in aiter_items(self._get_page, params, max_items=max_items, prefetch=prefetch):
+            yield Index(**item)
+
+    async def _get_page(self, params: Dict) -> Dict:
+        response = await self.client.submit_request("indexes", params=params)
+        result = response.json()
+        if response.status_code == 200:
+            return result
+        else:
+            raise APIRequestError(f"Failed to list indexes: {result['message']}")
+
+    async def update(self, index_id: Text, index_name: Text) -> bool:
+        """
+        Update an index name.
+
+        :param index_id: Index ID.
+        :param index_name: Index name.
+        :return: True if successful.
+        """
+
+        response = await self.client.submit_request(f"indexes/{index_id}", headers={"accept": "application/json"}, method="PUT", data={"index_name": index_name})
+        if response.status_code == 200:
+            if self.client.cache is not None:
+                self.client.cache.invalidate_index(index_id)
+            return True
+        else:
+            result = response.json()
+            raise APIRequestError(f"Failed to update index {index_id} name: {result['message']}")
+
+    async def delete(self, index_id: Text) -> bool:
+        """
+        Delete an index.
+
+        :param index_id: Index ID.
+        :return: True if successful.
+        """
+
+        response = await self.client.submit_request(f"indexes/{index_id}", method="DELETE")
+        if response.status_code == 204:
+            if self.client.cache is not None:
+                self.client.cache.invalidate_index(index_id)
+            if self.client.search_cache is not None:
+                self.client.search_cache.invalidate(index_id)
+            if self.client.upload_registry is not None:
+                self.client.upload_registry.remove_index(index_id)
             return True
         else:
             result = response.json()
-            raise APIRequestError(f"Failed to delete index {index_id}: {result['message']}")
\ No newline at end of file
+            raise APIRequestError(f"Failed to delete index {index_id}: {result['message']}")
@@ -1,5 +1,14 @@
-from typing import Text, List, Optional
+import heapq
+import asyncio
+from itertools import islice
+from contextvars import copy_context
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Text, List, Optional, Dict, Tuple, Union, Iterable, Iterator, AsyncIterator
 
+from py_twelvelabs.models import Clip, SearchResult, ClipColumns, BatchSearchResult
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.merge import amerge
+from py_twelvelabs.utilities.checkpoint import BatchCheckpoint
 from py_twelvelabs.exceptions import APIRequestError
 
 
@@ -12,6 +21,8 @@ class SearchResource:
         """
         Query an index and return the first page of results.
 
+        The page is served from the client's search cache when one is configured and an equivalent query was run recently.
+
         :param index_id: Index ID.
         :param search_query: Search query.
         :param search_options: Search options.
@@ -36,10 +47,18 @@ class SearchResource:
             "page_limit": page_limit,
         }
 
+        search_cache = self.client.search_cache
+        if search_cache is not None:
+            result = search_cache.get(data)
+            if result is not None:
+                return result
+
         response = self.client.submit_request("search", method="POST", data=data)
         result = response.json()
 
         if response.status_code == 200:
+            if search_cache is not None:
+                search_cache.set(data, result)
             return result
         else:
             raise APIRequestError(f"Failed to query index {index_id}: {result['message']}")
@@ -77,12 +96,602 @@ class SearchResource:
         :return: Query result.
         """
 
-        results = []
+        return list(self.iter_pages(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit))
+
+    def iter_pages(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, prefetch: bool = False) -> Iterator[Dict]:
+        """
+        Query an index and lazily yield each page of results as it arrives.
+
+        Pages are only requested as the caller advances the iterator, so stopping early skips the remaining pages.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param prefetch: Fetch the next page in the background while the caller handles the current one.
+        :return: Iterator of search result pages.
+        """
 
         result = self.query(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit)
-        
-        while('next_page_token' in result['page_info']):
-            result = self.get_search_result_page(page_token=result['page_info']['next_page_token'])
-            results.append(result)
-            
-        return results
+
+        if not prefetch:
+            yield result
+            while 'next_page_token' in result['page_info']:
+                result = self.get_search_result_page(page_token=result['page_info']['next_page_token'])
+                yield result
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        next_page = None
+        try:
+            while True:
+                if 'next_page_token' in result['page_info']:
+                    next_page = executor.submit(copy_context().run, self.get_search_result_page, page_token=result['page_info']['next_page_token'])
+                else:
+                    next_page = None
+
+                yield result
+
+                if next_page is None:
+                    break
+                result = next_page.result()
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+            executor.shutdown(wait=False)
+
+    def iter_query(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, prefetch: bool = False, as_clips: bool = False) -> Iterator[Union[Dict, Clip]]:
+        """
+        Query an index and lazily yield individual results across all pages.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param prefetch: Fetch the next page in the background while the caller handles the current one.
+        :param as_clips: Yield compact Clip objects instead of dicts. Requires group_by "clip".
+        :return: Iterator of search results.
+        """
+
+        for page in self.iter_pages(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit, prefetch=prefetch):
+            if as_clips:
+                yield from map(Clip.from_api, page['data'])
+            else:
+                yield from page['data']
+
+    def iter_results(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, prefetch: bool = False) -> Iterator[SearchResult]:
+        """
+        Query an index and lazily yield each page of results as a typed SearchResult.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param prefetch: Fetch the next page in the background while the caller handles the current one.
+        :return: Iterator of search result pages.
+        """
+
+        for page in self.iter_pages(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit, prefetch=prefetch):
+            yield SearchResult.from_api(page)
+
+    def query_columns(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, prefetch: bool = False, max_clips: int = None, use_numpy: bool = None) -> ClipColumns:
+        """
+        Query an index and collect the clips of all pages into columns of video IDs, scores, timestamps and confidences.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param prefetch: Fetch the next page in the background while the current one is parsed.
+        :param max_clips: Maximum number of clips to collect. No further pages are requested once it is reached.
+        :param use_numpy: Store scores and timestamps as NumPy arrays. Defaults to using NumPy if it is installed.
+        :return: Clip columns.
+        """
+
+        clips = self.iter_query(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit, prefetch=prefetch, as_clips=True)
+        try:
+            return ClipColumns.from_clips(islice(clips, max_clips), use_numpy=use_numpy)
+        finally:
+            clips.close()
+
+    def federated_query(self, index_ids: List[Text], search_query: Text, search_options: List[Text], threshold: Optional[Text] = "low", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, top_k: int = None, max_workers: int = None) -> Iterator[Clip]:
+        """
+        Run the same query against several indexes concurrently and yield their clips merged by descending score.
+
+        The first page of every index is requested in parallel. The per-index results, which the API returns sorted by
+        score, are then merged with a heap, and the next page of an index is only requested once every clip of its
+        current page has been merged. With top_k, iteration stops after the k best clips, so pages that cannot contain any
+        of them are never requested. Every clip has its index_id set.
+
+        :param index_ids: Index IDs.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param threshold: Threshold.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param top_k: Maximum number of clips to yield across all indexes.
+        :param max_workers: Maximum number of first pages requested concurrently. Defaults to settings.FEDERATED_SEARCH_MAX_WORKERS.
+        :return: Iterator of clips.
+        """
+
+        pages = [self.iter_results(index_id=index_id, search_query=search_query, search_options=search_options, threshold=threshold, operator=operator, conversation_option=conversation_option, page_limit=page_limit) for index_id in index_ids]
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(len(index_ids), max_workers or settings.FEDERATED_SEARCH_MAX_WORKERS))) as executor:
+                first_pages = [future.result() for future in [executor.submit(copy_context().run, next, iterator, None) for iterator in pages]]
+
+            streams = [self._iter_index_clips(index_id, first_page, iterator) for index_id, first_page, iterator in zip(index_ids, first_pages, pages)]
+            yield from islice(heapq.merge(*streams, key=lambda clip: -clip.score), top_k)
+        finally:
+            for iterator in pages:
+                iterator.close()
+
+    @staticmethod
+    def _iter_index_clips(index_id: Text, page: Optional[SearchResult], pages: Iterator[SearchResult]) -> Iterator[Clip]:
+        while page is not None:
+            for clip in page.clips:
+                clip.index_id = index_id
+                yield clip
+            page = next(pages, None)
+
+    def query_batch(self, index_id: Text, queries: Iterable[Union[Text, Dict]], search_options: List[Text] = None, max_workers: int = None, ordered: bool = False, checkpoint_file: Text = None, group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10) -> Iterator[BatchSearchResult]:
+        """
+        Run many queries against an index concurrently, yielding the first page of results of each one.
+
+        Queries are sent from a thread pool that shares the client's connection pool, rate limiter and retry policy, so
+        max_workers should not exceed the client's pool_maxsize. A failed query is reported in its result and does not
+        stop the others. With a checkpoint file, every successful result is recorded as it completes, so a batch that
+        crashed can be run again to send only the remaining queries. The file is removed once every query has succeeded.
+
+        :param index_id: Index ID.
+        :param queries: Search queries, or dictionaries of query keyword arguments such as search_query and search_options.
+        :param search_options: Search options, unless set per query.
+        :param max_workers: Maximum number of concurrent queries. Defaults to settings.BATCH_SEARCH_MAX_WORKERS.
+        :param ordered: Yield results in the order of the queries instead of as they complete.
+        :param checkpoint_file: Path of a JSON Lines file recording completed queries. Running the batch again with the same file skips them.
+        :param group_by: Group by, unless set per query.
+        :param threshold: Threshold, unless set per query.
+        :param sort_option: Sort option, unless set per query.
+        :param operator: Operator, unless set per query.
+        :param conversation_option: Conversation option, unless set per query.
+        :param page_limit: Page limit, unless set per query.
+        :return: Iterator of batch search results, in completion order unless ordered is set.
+        """
+
+        max_workers = max_workers if max_workers is not None else settings.BATCH_SEARCH_MAX_WORKERS
+        defaults = {"index_id": index_id, "search_options": search_options, "group_by": group_by, "threshold": threshold, "sort_option": sort_option, "operator": operator, "conversation_option": conversation_option, "page_limit": page_limit}
+        checkpoint = BatchCheckpoint(checkpoint_file) if checkpoint_file else None
+        completed = checkpoint.load() if checkpoint is not None else {}
+
+        pending = enumerate(queries)
+        in_flight = {}
+        buffered = {}
+        next_position = 0
+        is_exhausted = False
+        is_successful = True
+        # The pool is shut down without waiting, so that closing the iterator early does not block until the queries
+        # in flight complete.
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while True:
+                ready = []
+                while not is_exhausted and len(in_flight) < max_workers and len(buffered) < max_workers * 4:
+                    item = next(pending, None)
+                    if item is None:
+                        is_exhausted = True
+                        break
+                    position, query = self._get_batch_query(item, defaults, completed, ready)
+                    if query is not None:
+                        in_flight[executor.submit(copy_context().run, self.query, **query)] = (position, query)
+
+                if not in_flight and not ready:
+                    break
+
+                if in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        position, query = in_flight.pop(future)
+                        ready.append(self._get_batch_search_result(position, query, future, checkpoint))
+
+                for result in ready:
+                    is_successful = is_successful and result.is_successful
+                    if not ordered:
+                        yield result
+                    else:
+                        buffered[result.position] = result
+                while next_position in buffered:
+                    yield buffered.pop(next_position)
+                    next_position += 1
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+            if checkpoint is not None:
+                checkpoint.close()
+
+        if checkpoint is not None and is_successful:
+            checkpoint.remove()
+
+    @staticmethod
+    def _get_batch_query(item: Tuple[int, Union[Text, Dict]], defaults: Dict, completed: Dict[int, Dict], ready: List[BatchSearchResult]) -> Tuple[int, Optional[Dict]]:
+        """
+        Build the keyword arguments of a query of a batch, or reuse its result from the checkpoint.
+
+        :param item: Position and query.
+        :param defaults: Default keyword arguments.
+        :param completed: Results recorded in the checkpoint by position.
+        :param ready: Results ready to be yielded, to which a reused result is added.
+        :return: Position and keyword arguments, or None as keyword arguments if the result was reused.
+        """
+
+        position, query = item
+        query = {**defaults, **({"search_query": query} if isinstance(query, str) else query)}
+        entry = completed.get(position)
+        if entry is not None and entry['query'] == query:
+            ready.append(BatchSearchResult(position=position, query=query, result=entry['result']))
+            return position, None
+        return position, query
+
+    @staticmethod
+    def _get_batch_search_result(position: int, query: Dict, future, checkpoint: Optional[BatchCheckpoint]) -> BatchSearchResult:
+        result = BatchSearchResult(position=position, query=query)
+        error = future.exception()
+        if error is None:
+            result.result = future.result()
+            if checkpoint is not None:
+                checkpoint.write(position, query, result.result)
+        else:
+            result.error = str(error)
+        return result
+
+
+class AsyncSearchResource:
+    def __init__(self, client):
+        self.client = client
+
+    async def query(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10):
+        """
+        Query an index and return the first page of results.
+
+        The page is served from the client's search cache when one is configured and an equivalent query was run recently.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :return: Query result.
+        """
+
+        data = {
+            "index_id": index_id,
+            "query": search_query,
+            "search_options": search_options,
+            "group_by": group_by,
+            "threshold": threshold,
+            "sort_option": sort_option,
+            "operator": operator,
+            "conversation_option": conversation_option,
+            "page_limit": page_limit,
+        }
+
+        search_cache = self.client.search_cache
+        if search_cache is not None:
+            result = search_cache.get(data)
+            if result is not None:
+                return result
+
+        response = await self.client.submit_request("search", method="POST", data=data)
+        result = response.json()
+
+        if response.status_code == 200:
+            if search_cache is not None:
+                search_cache.set(data, result)
+            return result
+        else:
+            raise APIRequestError(f"Failed to query index {index_id}: {result['message']}")
+
+    async def get_search_result_page(self, page_token: Text):
+        """
+        Get a search result page.
+
+        :param page_token: Page token.
+        :return: Search result page.
+        """
+
+        response = await self.client.submit_request(method="GET", endpoint=f"search/{page_token}")
+        result = response.json()
+
+        if response.status_code == 200:
+            return result
+        else:
+            raise APIRequestError(f"Failed to get search result page: {result['message']}")
+
+    async def query_all(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10):
+        """
+        Query an index and return all pages of results.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :return: Query result.
+        """
+
+        return [page async for page in self.iter_pages(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit)]
+
+    async def iter_pages(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, prefetch: bool = False) -> AsyncIterator[Dict]:
+        """
+        Query an index and lazily yield each page of results as it arrives.
+
+        Pages are only requested as the caller advances the iterator, so stopping early skips the remaining pages.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param prefetch: Fetch the next page in a background task while the caller handles the current one.
+        :return: Async iterator of search result pages.
+        """
+
+        result = await self.query(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit)
+
+        if not prefetch:
+            yield result
+            while 'next_page_token' in result['page_info']:
+                result = await self.get_search_result_page(page_token=result['page_info']['next_page_token'])
+                yield result
+            return
+
+        next_page = None
+        try:
+            while True:
+                if 'next_page_token' in result['page_info']:
+                    next_page = asyncio.ensure_future(self.get_search_result_page(page_token=result['page_info']['next_page_token']))
+                else:
+                    next_page = None
+
+                yield result
+
+                if next_page is None:
+                    break
+                result = await next_page
+        finally:
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+
+    async def iter_query(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, prefetch: bool = False, as_clips: bool = False) -> AsyncIterator[Union[Dict, Clip]]:
+        """
+        Query an index and lazily yield individual results across all pages.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param prefetch: Fetch the next page in a background task while the caller handles the current one.
+        :param as_clips: Yield compact Clip objects instead of dicts. Requires group_by "clip".
+        :return: Async iterator of search results.
+        """
+
+        async for page in self.iter_pages(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit, prefetch=prefetch):
+            for clip in page['data']:
+                yield Clip.from_api(clip) if as_clips else clip
+
+    async def iter_results(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, prefetch: bool = False) -> AsyncIterator[SearchResult]:
+        """
+        Query an index and lazily yield each page of results as a typed SearchResult.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param prefetch: Fetch the next page in a background task while the caller handles the current one.
+        :return: Async iterator of search result pages.
+        """
+
+        async for page in self.iter_pages(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit, prefetch=prefetch):
+            yield SearchResult.from_api(page)
+
+    async def query_columns(self, index_id: Text, search_query: Text, search_options: List[Text], group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, prefetch: bool = False, max_clips: int = None, use_numpy: bool = None) -> ClipColumns:
+        """
+        Query an index and collect the clips of all pages into columns of video IDs, scores, timestamps and confidences.
+
+        :param index_id: Index ID.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param group_by: Group by.
+        :param threshold: Threshold.
+        :param sort_option: Sort option.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param prefetch: Fetch the next page in a background task while the current one is parsed.
+        :param max_clips: Maximum number of clips to collect. No further pages are requested once it is reached.
+        :param use_numpy: Store scores and timestamps as NumPy arrays. Defaults to using NumPy if it is installed.
+        :return: Clip columns.
+        """
+
+        clips = []
+        iterator = self.iter_query(index_id=index_id, search_query=search_query, search_options=search_options, group_by=group_by, threshold=threshold, sort_option=sort_option, operator=operator, conversation_option=conversation_option, page_limit=page_limit, prefetch=prefetch, as_clips=True)
+        try:
+            async for clip in iterator:
+                clips.append(clip)
+                if max_clips is not None and len(clips) >= max_clips:
+                    break
+        finally:
+            await iterator.aclose()
+        return ClipColumns.from_clips(clips[:max_clips], use_numpy=use_numpy)
+
+    async def federated_query(self, index_ids: List[Text], search_query: Text, search_options: List[Text], threshold: Optional[Text] = "low", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10, top_k: int = None) -> AsyncIterator[Clip]:
+        """
+        Run the same query against several indexes concurrently and yield their clips merged by descending score.
+
+        The first page of every index is requested concurrently. The per-index results are then merged with a heap, and
+        the next page of an index is only requested once every clip of its current page has been merged. With top_k,
+        iteration stops after the k best clips, so pages that cannot contain any of them are never requested. Every clip
+        has its index_id set.
+
+        :param index_ids: Index IDs.
+        :param search_query: Search query.
+        :param search_options: Search options.
+        :param threshold: Threshold.
+        :param operator: Operator.
+        :param conversation_option: Conversation option.
+        :param page_limit: Page limit.
+        :param top_k: Maximum number of clips to yield across all indexes.
+        :return: Async iterator of clips.
+        """
+
+        pages = [self.iter_results(index_id=index_id, search_query=search_query, search_options=search_options, threshold=threshold, operator=operator, conversation_option=conversation_option, page_limit=page_limit) for index_id in index_ids]
+        try:
+            first_pages = await asyncio.gather(*[self._get_next_page(iterator) for iterator in pages])
+            streams = [self._iter_index_clips(index_id, first_page, iterator) for index_id, first_page, iterator in zip(index_ids, first_pages, pages)]
+
+            merged = amerge(streams, key=lambda clip: -clip.score)
+            try:
+                count = 0
+                async for clip in merged:
+                    if top_k is not None and top_k <= 0:
+                        break
+                    yield clip
+                    count += 1
+                    # Stop before the merge advances past the last clip, which could request another page.
+                    if top_k is not None and count >= top_k:
+                        break
+            finally:
+                await merged.aclose()
+        finally:
+            for iterator in pages:
+                await iterator.aclose()
+
+    @staticmethod
+    async def _get_next_page(pages: AsyncIterator[SearchResult]) -> Optional[SearchResult]:
+        try:
+            return await pages.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    @staticmethod
+    async def _iter_index_clips(index_id: Text, page: Optional[SearchResult], pages: AsyncIterator[SearchResult]) -> AsyncIterator[Clip]:
+        while page is not None:
+            for clip in page.clips:
+                clip.index_id = index_id
+                yield clip
+            page = await AsyncSearchResource._get_next_page(pages)
+
+    async def query_batch(self, index_id: Text, queries: Iterable[Union[Text, Dict]], search_options: List[Text] = None, max_workers: int = None, ordered: bool = False, checkpoint_file: Text = None, group_by: Optional[Text] = "clip", threshold: Optional[Text] = "low", sort_option: Text = "score", operator: Text = "or", conversation_option: Text = "semantic", page_limit: int = 10) -> AsyncIterator[BatchSearchResult]:
+        """
+        Run many queries against an index concurrently, yielding the first page of results of each one.
+
+        A failed query is reported in its result and does not stop the others. With a checkpoint file, every successful
+        result is recorded as it completes, so a batch that crashed can be run again to send only the remaining queries.
+        The file is removed once every query has succeeded.
+
+        :param index_id: Index ID.
+        :param queries: Search queries, or dictionaries of query keyword arguments such as search_query and search_options.
+        :param search_options: Search options, unless set per query.
+        :param max_workers: Maximum number of concurrent queries. Defaults to settings.BATCH_SEARCH_MAX_WORKERS.
+        :param ordered: Yield results in the order of the queries instead of as they complete.
+        :param checkpoint_file: Path of a JSON Lines file recording completed queries. Running the batch again with the same file skips them.
+        :param group_by: Group by, unless set per query.
+        :param threshold: Threshold, unless set per query.
+        :param sort_option: Sort option, unless set per query.
+        :param operator: Operator, unless set per query.
+        :param conversation_option: Conversation option, unless set per query.
+        :param page_limit: Page limit, unless set per query.
+        :return: Async iterator of batch search results, in completion order unless ordered is set.
+        """
+
+        max_workers = max_workers if max_workers is not None else settings.BATCH_SEARCH_MAX_WORKERS
+        defaults = {"index_id": index_id, "search_options": search_options, "group_by": group_by, "threshold": threshold, "sort_option": sort_option, "operator": operator, "conversation_option": conversation_option, "page_limit": page_limit}
+        checkpoint = BatchCheckpoint(checkpoint_file) if checkpoint_file else None
+        completed = checkpoint.load() if checkpoint is not None else {}
+
+        pending = enumerate(queries)
+        in_flight = {}
+        buffered = {}
+        next_position = 0
+        is_exhausted = False
+        is_successful = True
+        try:
+            while True:
+                ready = []
+                while not is_exhausted and len(in_flight) < max_workers and len(buffered) < max_workers * 4:
+                    item = next(pending, None)
+                    if item is None:
+                        is_exhausted = True
+                        break
+                    position, query = SearchResource._get_batch_query(item, defaults, completed, ready)
+                    if query is not None:
+                        in_flight[asyncio.ensure_future(self.query(**query))] = (position, query)
+
+                if not in_flight and not ready:
+                    break
+
+                if in_flight:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        position, query = in_flight.pop(future)
+                        ready.append(SearchResource._get_batch_search_result(position, query, future, checkpoint))
+
+                for result in ready:
+                    is_successful = is_successful and result.is_successful
+                    if not ordered:
+                        yield result
+                    else:
+                        buffered[result.position] = result
+                while next_position in buffered:
+                    yield buffered.pop(next_position)
+                    next_position += 1
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if checkpoint is not None:
+                checkpoint.close()
+
+        if checkpoint is not None and is_successful:
+            checkpoint.remove()
@@ -1,11 +1,22 @@
-import time
-import mimetypes
-from typing import Text, List
+import os
+import asyncio
+from contextlib import ExitStack
+from urllib.parse import urlparse
+from contextvars import copy_context
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Text, List, Dict, Union, Callable, Iterable, Iterator, AsyncIterator, Optional
 
-from py_twelvelabs.models import Task
+from py_twelvelabs.models import Task, BulkTaskResult
 from py_twelvelabs.settings import settings
+from py_twelvelabs.watcher import RUNNING_TASK_STATUSES
+from py_twelvelabs.utilities.cache import ResponseCache
 from py_twelvelabs.utilities.logger import get_logger
-from py_twelvelabs.exceptions import APIRequestError, InsufficientParametersError, TaskFailedError, TaskDeletionNotAllowedError
+from py_twelvelabs.utilities.bulk import BulkScheduler
+from py_twelvelabs.utilities.pagination import iter_items, aiter_items
+from py_twelvelabs.utilities.upload import open_video_file
+from py_twelvelabs.utilities.resumable import ResumableUpload
+from py_twelvelabs.utilities.deadline import CancelToken, deadline
+from py_twelvelabs.exceptions import APIRequestError, InsufficientParametersError, TaskDeletionNotAllowedError, ResumableUploadError, DeadlineExceededError, RequestCancelledError
 
 
 class TaskResource:
@@ -13,7 +24,7 @@ class TaskResource:
         self.client = client
         self.logger = get_logger(__name__)
 
-    def create_async(self, index_id: Text, video_file: Text = None, video_url: Text = None, language: Text = "en", provide_transcription: Text = "false", transcription_file: Text = None, transcription_url: Text = None, disable_video_stream: Text = "false"):
+    def create_async(self, index_id: Text, video_file: Text = None, video_url: Text = None, language: Text = "en", provide_transcription: Text = "false", transcription_file: Text = None, transcription_url: Text = None, disable_video_stream: Text = "false", chunk_size: int = None, progress_callback: Callable[[int, int], None] = None, use_mmap: bool = False):
         """
         Create a task asynchronously.
 
@@ -25,7 +36,10 @@ class TaskResource:
         :param transcription_file: Transcription file.
         :param transcription_url: Transcription URL.
         :param disable_video_stream: Disable video stream.
-        :return: Task ID.
+        :param chunk_size: Number of bytes of the upload read at a time. Defaults to settings.UPLOAD_CHUNK_SIZE.
+        :param progress_callback: Function called during the upload with the number of bytes sent and the total number of bytes.
+        :param use_mmap: Read the video file through a memory map.
+        :return: Task ID. When the client has an upload registry and the content of the video file was already uploaded to the index, the ID of the existing task is returned without uploading the file again.
         """
 
         if video_file is None and video_url is None:
@@ -38,8 +52,6 @@ class TaskResource:
             "disable_video_stream": disable_video_stream,
         }
 
-        if video_file is not None:
-            data['video_file'] = self._get_video_tuple(video_file)
         if video_url is not None:
             data['video_url'] = video_url
         if transcription_file is not None:
@@ -47,14 +59,74 @@ class TaskResource:
         if transcription_url is not None:
             data['transcription_url'] = transcription_url
 
-        response = self.client.submit_multi_part_request("tasks", method="POST", data=data)
+        registry = self.client.upload_registry
+        if registry is None or video_file is None:
+            return self._create(data, video_file, chunk_size, progress_callback, use_mmap)
+
+        content_hash = registry.get_hash(video_file)
+        return self.client.single_flight.do(("uploads", index_id, content_hash), lambda: self._create_once(index_id, content_hash, data, video_file, chunk_size, progress_callback, use_mmap))
+
+    def _create(self, data: Dict, video_file: Text = None, chunk_size: int = None, progress_callback: Callable[[int, int], None] = None, use_mmap: bool = False) -> Text:
+        with ExitStack() as stack:
+            if video_file is not None:
+                data['video_file'] = stack.enter_context(open_video_file(video_file, use_mmap=use_mmap))
+            response = self.client.submit_multi_part_request("tasks", method="POST", data=data, chunk_size=chunk_size, progress_callback=progress_callback)
+
         result = response.json()
         if response.status_code == 201:
             return result['_id']
         else:
             raise APIRequestError(f"Failed to create task: {result['message']}")
+
+    def _create_once(self, index_id: Text, content_hash: Text, data: Dict, video_file: Text, chunk_size: int = None, progress_callback: Callable[[int, int], None] = None, use_mmap: bool = False) -> Text:
+        """
+        Create a task from a video file, unless its content was already uploaded to the index.
+
+        :param index_id: Index ID.
+        :param content_hash: Content hash of the video file.
+        :param data: Multi-part fields of the task.
+        :param video_file: Video file.
+        :param chunk_size: Number of bytes of the upload read at a time.
+        :param progress_callback: Function called during the upload with the number of bytes sent and the total number of bytes.
+        :param use_mmap: Read the video file through a memory map.
+        :return: Task ID.
+        """
+
+        registry = self.client.upload_registry
+        entry = registry.lookup(index_id, content_hash)
+        if entry is not None and settings.DEDUP_VERIFY:
+            entry = self._verify_upload(index_id, content_hash, entry)
+        if entry is not None:
+            self.logger.info("Skipping upload of %s: its content was already uploaded to index %s as task %s.", video_file, index_id, entry['task_id'], extra={"task_id": entry['task_id']})
+            return entry['task_id']
+
+        task_id = self._create(data, video_file, chunk_size, progress_callback, use_mmap)
+        registry.record(index_id, content_hash, task_id, size=os.path.getsize(video_file))
+        return task_id
+
+    def _verify_upload(self, index_id: Text, content_hash: Text, entry: Dict) -> Optional[Dict]:
+        """
+        Check that the task recorded for an upload still exists and did not fail, forgetting the upload otherwise.
+
+        :param index_id: Index ID.
+        :param content_hash: Content hash.
+        :param entry: Recorded upload.
+        :return: Recorded upload, or None if it was forgotten.
+        """
+
+        try:
+            task = self.get(entry['task_id'])
+        except APIRequestError:
+            task = None
+
+        if task is None or task.status == 'failed':
+            self.client.upload_registry.remove(index_id, content_hash)
+            return None
+        if task.video_id is not None and entry['video_id'] is None:
+            self.client.upload_registry.record(index_id, content_hash, task.id, video_id=task.video_id)
+        return entry
         
-    def create_sync(self, index_id: Text, video_file: Text = None, video_url: Text = None, language: Text = "en", provide_transcription: Text = "false", transcription_file: Text = None, transcription_url: Text = None, disable_video_stream: Text = "false"):
+    def create_sync(self, index_id: Text, video_file: Text = None, video_url: Text = None, language: Text = "en", provide_transcription: Text = "false", transcription_file: Text = None, transcription_url: Text = None, disable_video_stream: Text = "false", timeout: float = None, cancel_token: CancelToken = None):
         """
         Create a task synchronously.
 
@@ -66,48 +138,141 @@ class TaskResource:
         :param transcription_file: Transcription file.
         :param transcription_url: Transcription URL.
         :param disable_video_stream: Disable video stream.
+        :param timeout: Number of seconds the upload and the wait may take in total. Defaults to settings.TASK_WAIT_TIMEOUT, and to no time limit if that is not set.
+        :param cancel_token: Token that stops the upload or the wait. The task keeps being processed by the API.
         :return: Task.
         """
 
-        task_id = self.create_async(index_id, video_file, video_url, language, provide_transcription, transcription_file, transcription_url, disable_video_stream)
+        with deadline(timeout if timeout is not None else settings.TASK_WAIT_TIMEOUT, cancel_token) as call_deadline:
+            task_id = self.create_async(index_id, video_file, video_url, language, provide_transcription, transcription_file, transcription_url, disable_video_stream)
 
-        is_task_running = True
+            self.logger.info("Task %s created, waiting for it to complete.", task_id, extra={"task_id": task_id})
 
-        while is_task_running:
-            task = self.get(task_id)
-            task_status = task.status
-            self.logger.info(f"Task {task_id} is in the {task_status} state.")
+            future = self.client.task_watcher.watch(task_id, index_id=index_id)
+            try:
+                return call_deadline.wait(future)
+            except (DeadlineExceededError, RequestCancelledError):
+                self.client.task_watcher.unwatch(task_id, future)
+                raise
 
-            wait_durtion = task['process']['remain_seconds'] if 'process' in task else settings.TASK_STATUS_POLLING_INTERVAL
+    def create_resumable(self, index_id: Text, video_file: Text, upload_url: Union[Text, Callable[[int], Text]], video_url: Text, complete_url: Text = None, upload_headers: Dict = None, state_file: Text = None, part_size: int = None, max_retries: int = None, language: Text = "en", provide_transcription: Text = "false", disable_video_stream: Text = "false") -> Text:
+        """
+        Upload a video in resumable parts to a staging location and create a task from its URL.
 
-            if task_status in ('pending', 'indexing', 'validating'):
-                self.logger.info(f"Task {task_id} will be polled again in {wait_durtion} seconds.")
-                time.sleep(wait_durtion)
+        Parts that were already sent are recorded in a local state file, so calling this again after a failure or a
+        process restart only sends the missing parts.
 
-            elif task_status == 'ready':
-                self.logger.info(f"Task {task_id} completed successfully.")
-                is_task_running = False
+        :param index_id: Index ID.
+        :param video_file: Video file.
+        :param upload_url: URL that receives every part as a PUT with a Content-Range header, or a function returning the URL for a part number (starting at 1).
+        :param video_url: URL the uploaded video is served from once all parts are sent. The task is created from it.
+        :param complete_url: URL that is sent a POST with the part numbers and ETags once all parts are sent, e.g. to complete an object store multipart upload.
+        :param upload_headers: Extra headers sent with every part and with the completion request.
+        :param state_file: Path of the state file. Defaults to the video file path with an .upload.json suffix.
+        :param part_size: Size of each part in bytes. Defaults to settings.RESUMABLE_UPLOAD_PART_SIZE.
+        :param max_retries: Number of times a failed part is retried. Defaults to settings.RESUMABLE_UPLOAD_MAX_RETRIES.
+        :param language: Language.
+        :param provide_transcription: Provide transcription.
+        :param disable_video_stream: Disable video stream.
+        :return: Task ID.
+        """
 
-            else:
-                raise TaskFailedError(f"Task {task_id} failed with status {task_status}.")
-            
-        return task
+        session = self.client._get_session()
+        upload = ResumableUpload(video_file, upload_url, state_file=state_file, part_size=part_size, max_retries=max_retries, headers=upload_headers, session=session, timeout=(self.client.connect_timeout, self.client.read_timeout))
+        parts = upload.upload()
+
+        if complete_url is not None:
+            response = session.post(complete_url, json={"parts": parts}, headers=upload_headers, timeout=(self.client.connect_timeout, self.client.read_timeout))
+            if response.status_code >= 300:
+                raise ResumableUploadError(f"Failed to complete the upload of {video_file}: HTTP {response.status_code}.")
+
+        return self.create_async(index_id, video_url=video_url, language=language, provide_transcription=provide_transcription, disable_video_stream=disable_video_stream)
+
+    def create_bulk(self, index_id: Text, videos: Iterable[Union[Text, Dict]], max_workers: int = None, max_per_host: int = None, language: Text = "en", provide_transcription: Text = "false", disable_video_stream: Text = "false") -> Iterator[BulkTaskResult]:
+        """
+        Create many tasks concurrently, yielding a result for each video as its task is created.
+
+        Videos are uploaded from a thread pool that shares the client's connection pool, so max_workers should not exceed the client's pool_maxsize.
+        A failure to create one task is reported in its result and does not stop the others.
+
+        :param index_id: Index ID.
+        :param videos: Video files, video URLs or dictionaries of create_async keyword arguments. Strings starting with http:// or https:// are treated as video URLs.
+        :param max_workers: Maximum number of concurrent uploads. Defaults to settings.BULK_MAX_WORKERS.
+        :param max_per_host: Maximum number of concurrent uploads per video host. Local files count against the API host. Defaults to settings.BULK_MAX_PER_HOST.
+        :param language: Language, unless set per video.
+        :param provide_transcription: Provide transcription, unless set per video.
+        :param disable_video_stream: Disable video stream, unless set per video.
+        :return: Iterator of task creation results, in completion order.
+        """
+
+        max_workers = max_workers if max_workers is not None else settings.BULK_MAX_WORKERS
+        max_per_host = max_per_host if max_per_host is not None else settings.BULK_MAX_PER_HOST
+        defaults = {"index_id": index_id, "language": language, "provide_transcription": provide_transcription, "disable_video_stream": disable_video_stream}
+        scheduler = BulkScheduler(videos, max_per_host, urlparse(settings.BASE_API_URL).netloc, max_deferred=max_workers * 4)
+
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                while len(in_flight) < max_workers:
+                    acquired = scheduler.acquire()
+                    if acquired is None:
+                        break
+                    kwargs, host = acquired
+                    future = executor.submit(copy_context().run, self.create_async, **{**defaults, **kwargs})
+                    in_flight[future] = (kwargs, host)
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kwargs, host = in_flight.pop(future)
+                    scheduler.release(host)
+                    yield self._get_bulk_task_result(kwargs, future)
+
+    @staticmethod
+    def _get_bulk_task_result(kwargs: Dict, future) -> BulkTaskResult:
+        result = BulkTaskResult(video_file=kwargs.get('video_file'), video_url=kwargs.get('video_url'))
+        error = future.exception()
+        if error is None:
+            result.task_id = future.result()
+        else:
+            result.error = str(error)
+        return result
 
-    def _get_video_tuple(self, video_file):
-        return (video_file, open(video_file, "rb"), mimetypes.guess_type(video_file )[0])
-        
     def get(self, task_id: Text) -> Task:
         """
         Get a task.
 
+        Tasks that have finished processing are served from the client's response cache when one is configured. Running
+        tasks are always fetched, so that their status is never stale. Concurrent calls for the same task share a single
+        request.
+
         :param task_id: Task ID.
         :return: Task.
         """
-        
-        response = self.client.submit_request(f"tasks/{task_id}")
+
+        return self.client.single_flight.do(("tasks", task_id), lambda: self._get(task_id))
+
+    def _get(self, task_id: Text) -> Task:
+        cache = self.client.cache
+        generation = cache['task'].generation if cache is not None else None
+        entry = cache['task'].lookup(task_id) if cache is not None else None
+        if entry is not None and entry.is_fresh:
+            return entry.copy_value()
+
+        response = self.client.submit_request(f"tasks/{task_id}", headers=ResponseCache.get_conditional_headers(entry))
+        if response.status_code == 304 and entry is not None:
+            cache['task'].revalidate(task_id, entry, generation)
+            return entry.copy_value()
         result = response.json()
         if response.status_code == 200:
-            return Task(**result)
+            with self.client.metrics.time("parse", f"tasks/{task_id}"):
+                task = Task(**result)
+            self._observe(task)
+            if cache is not None and task.status not in RUNNING_TASK_STATUSES:
+                cache['task'].set(task_id, task, response.headers.get("ETag"), generation)
+            return task
         else:
             raise APIRequestError(f"Failed to get task {task_id}: {result['message']}")
         
@@ -150,10 +315,74 @@ class TaskResource:
         response = self.client.submit_request("tasks", params=params)
         result = response.json()
         if response.status_code == 200:
-            return [Task(**task) for task in result['data']]
+            with self.client.metrics.time("parse", "tasks"):
+                tasks = [Task(**task) for task in result['data']]
+            return [self._observe(task) for task in tasks]
         else:
             raise APIRequestError(f"Failed to list tasks: {result['message']}")
         
+    def iter_all(self, page_limit: int = 50, max_items: int = None, prefetch: int = None, sort_by: Text = "created_at", sort_option: Text = "desc", _id: Text = None, index_id: Text = None, filename: Text = None, duration: int = None, width: int = None, height: int = None, created_at: Text = None, updated_at: Text = None, estimated_time: Text = None) -> Iterator[Task]:
+        """
+        Lazily iterate over all tasks, one task at a time.
+
+        Pages are requested as the caller advances the iterator, with the next pages prefetched concurrently in the background.
+
+        :param page_limit: Page limit.
+        :param max_items: Maximum number of tasks to yield.
+        :param prefetch: Number of pages to fetch ahead. Defaults to settings.LIST_PREFETCH_PAGES.
+        :param sort_by: Sort by.
+        :param sort_option: Sort option.
+        :param _id: Task ID.
+        :param index_id: Index ID.
+        :param filename: Filename.
+        :param duration: Duration.
+        :param width: Width.
+        :param height: Height.
+        :param created_at: Created at.
+        :param updated_at: Updated at.
+        :param estimated_time: Estimated time.
+        :return: Iterator of Tasks.
+        """
+
+        params = {
+            "page_limit": page_limit,
+            "sort_by": sort_by,
+            "sort_option": sort_option,
+            "_id": _id,
+            "index_id": index_id,
+            "filename": filename,
+            "duration": duration,
+            "width": width,
+            "height": height,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "estimated_time": estimated_time,
+        }
+
+        prefetch = prefetch if prefetch is not None else settings.LIST_PREFETCH_PAGES
+        for item in iter_items(self._get_page, params, max_items=max_items, prefetch=prefetch):
+            yield self._observe(Task(**item))
+
+    def _get_page(self, params: Dict) -> Dict:
+        response = self.client.submit_request("tasks", params=params)
+        result = response.json()
+        if response.status_code == 200:
+            return result
+        else:
+            raise APIRequestError(f"Failed to list tasks: {result['message']}")
+
+    def _observe(self, task: Task) -> Task:
+        """
+        Invalidate the cached search results of the index of a ready task that were cached before the task was updated.
+
+        :param task: Task.
+        :return: The task.
+        """
+
+        if self.client.search_cache is not None and task.status == "ready":
+            self.client.search_cache.observe_ready_task(task.index_id, task.updated_at)
+        return task
+
     def delete(self, task_id: Text):
         """
         Delete a task.
@@ -165,9 +394,360 @@ class TaskResource:
         response = self.client.submit_request(f"tasks/{task_id}", method="DELETE")
         # TODO: if the status of the task is 'ready', the video vector must be deleted first
         if response.status_code == 204:
+            if self.client.cache is not None:
+                self.client.cache.invalidate_task(task_id)
+            if self.client.upload_registry is not None:
+                self.client.upload_registry.remove_task(task_id)
+            return True
+        elif response.status_code == 409:
+            self.logger.error("Failed to delete task %s: %s", task_id, response.json()['message'], extra={"task_id": task_id})
+            raise TaskDeletionNotAllowedError("Only tasks with status 'ready' or 'failed' can be deleted.")
+        else:
+            result = response.json()
+            raise APIRequestError(f"Failed to delete task {task_id}: {result['message']}")
+
+
+class AsyncTaskResource:
+    def __init__(self, client):
+        self.client = client
+        self.logger = get_logger(__name__)
+
+    async def create_async(self, index_id: Text, video_file: Text = None, video_url: Text = None, language: Text = "en", provide_transcription: Text = "false", transcription_file: Text = None, transcription_url: Text = None, disable_video_stream: Text = "false", chunk_size: int = None, progress_callback: Callable[[int, int], None] = None, use_mmap: bool = False):
+        """
+        Create a task without waiting for it to complete.
+
+        :param index_id: Index ID.
+        :param video_file: Video file. Either video_file or video_url must be provided.
+        :param video_url: Video URL. Either video_file or video_url must be provided.
+        :param language: Language.
+        :param provide_transcription: Provide transcription.
+        :param transcription_file: Transcription file.
+        :param transcription_url: Transcription URL.
+        :param disable_video_stream: Disable video stream.
+        :param chunk_size: Number of bytes of the upload read at a time. Defaults to settings.UPLOAD_CHUNK_SIZE.
+        :param progress_callback: Function called during the upload with the number of bytes sent and the total number of bytes.
+        :param use_mmap: Read the video file through a memory map.
+        :return: Task ID. When the client has an upload registry and the content of the video file was already uploaded to the index, the ID of the existing task is returned without uploading the file again.
+        """
+
+        if video_file is None and video_url is None:
+            raise InsufficientParametersError("Video file or URL must be provided.")
+
+        data = {
+            "index_id": index_id,
+            "language": language,
+            "provide_transcription": provide_transcription,
+            "disable_video_stream": disable_video_stream,
+        }
+
+        if video_url is not None:
+            data['video_url'] = video_url
+        if transcription_file is not None:
+            data['transcription_file'] = transcription_file
+        if transcription_url is not None:
+            data['transcription_url'] = transcription_url
+
+        registry = self.client.upload_registry
+        if registry is None or video_file is None:
+            return await self._create(data, video_file, chunk_size, progress_callback, use_mmap)
+
+        content_hash = await asyncio.get_running_loop().run_in_executor(None, registry.get_hash, video_file)
+        return await self.client.single_flight.do(("uploads", index_id, content_hash), lambda: self._create_once(index_id, content_hash, data, video_file, chunk_size, progress_callback, use_mmap))
+
+    async def _create(self, data: Dict, video_file: Text = None, chunk_size: int = None, progress_callback: Callable[[int, int], None] = None, use_mmap: bool = False) -> Text:
+        with ExitStack() as stack:
+            if video_file is not None:
+                data['video_file'] = stack.enter_context(open_video_file(video_file, use_mmap=use_mmap))
+            response = await self.client.submit_multi_part_request("tasks", method="POST", data=data, chunk_size=chunk_size, progress_callback=progress_callback)
+
+        result = response.json()
+        if response.status_code == 201:
+            return result['_id']
+        else:
+            raise APIRequestError(f"Failed to create task: {result['message']}")
+
+    async def _create_once(self, index_id: Text, content_hash: Text, data: Dict, video_file: Text, chunk_size: int = None, progress_callback: Callable[[int, int], None] = None, use_mmap: bool = False) -> Text:
+        """
+        Create a task from a video file, unless its content was already uploaded to the index.
+
+        :param index_id: Index ID.
+        :param content_hash: Content hash of the video file.
+        :param data: Multi-part fields of the task.
+        :param video_file: Video file.
+        :param chunk_size: Number of bytes of the upload read at a time.
+        :param progress_callback: Function called during the upload with the number of bytes sent and the total number of bytes.
+        :param use_mmap: Read the video file through a memory map.
+        :return: Task ID.
+        """
+
+        registry = self.client.upload_registry
+        entry = registry.lookup(index_id, content_hash)
+        if entry is not None and settings.DEDUP_VERIFY:
+            entry = await self._verify_upload(index_id, content_hash, entry)
+        if entry is not None:
+            self.logger.info("Skipping upload of %s: its content was already uploaded to index %s as task %s.", video_file, index_id, entry['task_id'], extra={"task_id": entry['task_id']})
+            return entry['task_id']
+
+        task_id = await self._create(data, video_file, chunk_size, progress_callback, use_mmap)
+        registry.record(index_id, content_hash, task_id, size=os.path.getsize(video_file))
+        return task_id
+
+    async def _verify_upload(self, index_id: Text, content_hash: Text, entry: Dict) -> Optional[Dict]:
+        """
+        Check that the task recorded for an upload still exists and did not fail, forgetting the upload otherwise.
+
+        :param index_id: Index ID.
+        :param content_hash: Content hash.
+        :param entry: Recorded upload.
+        :return: Recorded upload, or None if it was forgotten.
+        """
+
+        try:
+            task = await self.get(entry['task_id'])
+        except APIRequestError:
+            task = None
+
+        if task is None or task.status == 'failed':
+            self.client.upload_registry.remove(index_id, content_hash)
+            return None
+        if task.video_id is not None and entry['video_id'] is None:
+            self.client.upload_registry.record(index_id, content_hash, task.id, video_id=task.video_id)
+        return entry
+
+    async def create_sync(self, index_id: Text, video_file: Text = None, video_url: Text = None, language: Text = "en", provide_transcription: Text = "false", transcription_file: Text = None, transcription_url: Text = None, disable_video_stream: Text = "false", timeout: float = None, cancel_token: CancelToken = None):
+        """
+        Create a task and wait for it to complete.
+
+        :param index_id: Index ID.
+        :param video_file: Video file. Either video_file or video_url must be provided.
+        :param video_url: Video URL. Either video_file or video_url must be provided.
+        :param language: Language.
+        :param provide_transcription: Provide transcription.
+        :param transcription_file: Transcription file.
+        :param transcription_url: Transcription URL.
+        :param disable_video_stream: Disable video stream.
+        :param timeout: Number of seconds the upload and the wait may take in total. Defaults to settings.TASK_WAIT_TIMEOUT, and to no time limit if that is not set.
+        :param cancel_token: Token that stops the upload or the wait. The task keeps being processed by the API.
+        :return: Task.
+        """
+
+        with deadline(timeout if timeout is not None else settings.TASK_WAIT_TIMEOUT, cancel_token) as call_deadline:
+            task_id = await self.create_async(index_id, video_file, video_url, language, provide_transcription, transcription_file, transcription_url, disable_video_stream)
+
+            self.logger.info("Task %s created, waiting for it to complete.", task_id, extra={"task_id": task_id})
+
+            future = self.client.task_watcher.watch(task_id, index_id=index_id)
+            try:
+                return await call_deadline.run_async(future)
+            except (DeadlineExceededError, RequestCancelledError):
+                self.client.task_watcher.unwatch(task_id, future)
+                raise
+
+    async def create_bulk(self, index_id: Text, videos: Iterable[Union[Text, Dict]], max_workers: int = None, max_per_host: int = None, language: Text = "en", provide_transcription: Text = "false", disable_video_stream: Text = "false") -> AsyncIterator[BulkTaskResult]:
+        """
+        Create many tasks concurrently, yielding a result for each video as its task is created.
+
+        Uploads run as tasks on the event loop and share the client's connection pool.
+        A failure to create one task is reported in its result and does not stop the others.
+
+        :param index_id: Index ID.
+        :param videos: Video files, video URLs or dictionaries of create_async keyword arguments. Strings starting with http:// or https:// are treated as video URLs.
+        :param max_workers: Maximum number of concurrent uploads. Defaults to settings.BULK_MAX_WORKERS.
+        :param max_per_host: Maximum number of concurrent uploads per video host. Local files count against the API host. Defaults to settings.BULK_MAX_PER_HOST.
+        :param language: Language, unless set per video.
+        :param provide_transcription: Provide transcription, unless set per video.
+        :param disable_video_stream: Disable video stream, unless set per video.
+        :return: Async iterator of task creation results, in completion order.
+        """
+
+        max_workers = max_workers if max_workers is not None else settings.BULK_MAX_WORKERS
+        max_per_host = max_per_host if max_per_host is not None else settings.BULK_MAX_PER_HOST
+        defaults = {"index_id": index_id, "language": language, "provide_transcription": provide_transcription, "disable_video_stream": disable_video_stream}
+        scheduler = BulkScheduler(videos, max_per_host, urlparse(settings.BASE_API_URL).netloc, max_deferred=max_workers * 4)
+
+        in_flight = {}
+        try:
+            while True:
+                while len(in_flight) < max_workers:
+                    acquired = scheduler.acquire()
+                    if acquired is None:
+                        break
+                    kwargs, host = acquired
+                    future = asyncio.ensure_future(self.create_async(**{**defaults, **kwargs}))
+                    in_flight[future] = (kwargs, host)
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    kwargs, host = in_flight.pop(future)
+                    scheduler.release(host)
+                    yield TaskResource._get_bulk_task_result(kwargs, future)
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    async def get(self, task_id: Text) -> Task:
+        """
+        Get a task.
+
+        Tasks that have finished processing are served from the client's response cache when one is configured. Running
+        tasks are always fetched, so that their status is never stale. Concurrent calls for the same task share a single
+        request.
+
+        :param task_id: Task ID.
+        :return: Task.
+        """
+
+        return await self.client.single_flight.do(("tasks", task_id), lambda: self._get(task_id))
+
+    async def _get(self, task_id: Text) -> Task:
+        cache = self.client.cache
+        generation = cache['task'].generation if cache is not None else None
+        entry = cache['task'].lookup(task_id) if cache is not None else None
+        if entry is not None and entry.is_fresh:
+            return entry.copy_value()
+
+        response = await self.client.submit_request(f"tasks/{task_id}", headers=ResponseCache.get_conditional_headers(entry))
+        if response.status_code == 304 and entry is not None:
+            cache['task'].revalidate(task_id, entry, generation)
+            return entry.copy_value()
+        result = response.json()
+        if response.status_code == 200:
+            with self.client.metrics.time("parse", f"tasks/{task_id}"):
+                task = Task(**result)
+            self._observe(task)
+            if cache is not None and task.status not in RUNNING_TASK_STATUSES:
+                cache['task'].set(task_id, task, response.headers.get("ETag"), generation)
+            return task
+        else:
+            raise APIRequestError(f"Failed to get task {task_id}: {result['message']}")
+
+    async def list(self, page: int = 1, page_limit: Text = 10, sort_by: Text = "created_at", sort_option: Text = "desc", _id: Text = None, index_id: Text = None, filename: Text = None, duration: int = None, width: int = None, height: int = None, created_at: Text = None, updated_at: Text = None, estimated_time: Text = None) -> List[Task]:
+        """
+        List tasks.
+
+        :param page: Page number.
+        :param page_limit: Page limit.
+        :param sort_by: Sort by.
+        :param sort_option: Sort option.
+        :param _id: Task ID.
+        :param index_id: Index ID.
+        :param filename: Filename.
+        :param duration: Duration.
+        :param width: Width.
+        :param height: Height.
+        :param created_at: Created at.
+        :param updated_at: Updated at.
+        :param estimated_time: Estimated time.
+        :return: List of Tasks.
+        """
+
+        params = {
+            "page": page,
+            "page_limit": page_limit,
+            "sort_by": sort_by,
+            "sort_option": sort_option,
+            "_id": _id,
+            "index_id": index_id,
+            "filename": filename,
+            "duration": duration,
+            "width": width,
+            "height": height,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "estimated_time": estimated_time,
+        }
+
+        response = await self.client.submit_request("tasks", params=params)
+        result = response.json()
+        if response.status_code == 200:
+            with self.client.metrics.time("parse", "tasks"):
+                tasks = [Task(**task) for task in result['data']]
+            return [self._observe(task) for task in tasks]
+        else:
+            raise APIRequestError(f"Failed to list tasks: {result['message']}")
+
+    async def iter_all(self, page_limit: int = 50, max_items: int = None, prefetch: int = None, sort_by: Text = "created_at", sort_option: Text = "desc", _id: Text = None, index_id: Text = None, filename: Text = None, duration: int = None, width: int = None, height: int = None, created_at: Text = None, updated_at: Text = None, estimated_time: Text = None) -> AsyncIterator[Task]:
+        """
+        Lazily iterate over all tasks, one task at a time.
+
+        Pages are requested as the caller advances the iterator, with the next pages prefetched concurrently in the background.
+
+        :param page_limit: Page limit.
+        :param max_items: Maximum number of tasks to yield.
+        :param prefetch: Number of pages to fetch ahead. Defaults to settings.LIST_PREFETCH_PAGES.
+        :param sort_by: Sort by.
+        :param sort_option: Sort option.
+        :param _id: Task ID.
+        :param index_id: Index ID.
+        :param filename: Filename.
+        :param duration: Duration.
+        :param width: Width.
+        :param height: Height.
+        :param created_at: Created at.
+        :param updated_at: Updated at.
+        :param estimated_time: Estimated time.
+        :return: Iterator of Tasks.
+        """
+
+        params = {
+            "page_limit": page_limit,
+            "sort_by": sort_by,
+            "sort_option": sort_option,
+            "_id": _id,
+            "index_id": index_id,
+            "filename": filename,
+            "duration": duration,
+            "width": width,
+            "height": height,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "estimated_time": estimated_time,
+        }
+
+        prefetch = prefetch if prefetch is not None else settings.LIST_PREFETCH_PAGES
+        async for item in aiter_items(self._get_page, params, max_items=max_items, prefetch=prefetch):
+            yield self._observe(Task(**item))
+
+    async def _get_page(self, params: Dict) -> Dict:
+        response = await self.client.submit_request("tasks", params=params)
+        result = response.json()
+        if response.status_code == 200:
+            return result
+        else:
+            raise APIRequestError(f"Failed to list tasks: {result['message']}")
+
+    def _observe(self, task: Task) -> Task:
+        """
+        Invalidate the cached search results of the index of a ready task that were cached before the task was updated.
+
+        :param task: Task.
+        :return: The task.
+        """
+
+        if self.client.search_cache is not None and task.status == "ready":
+            self.client.search_cache.observe_ready_task(task.index_id, task.updated_at)
+        return task
+
+    async def delete(self, task_id: Text):
+        """
+        Delete a task.
+
+        :param task_id: Task ID.
+        :return: True if successful.
+        """
+
+        response = await self.client.submit_request(f"tasks/{task_id}", method="DELETE")
+        if response.status_code == 204:
+            if self.client.cache is not None:
+                self.client.cache.invalidate_task(task_id)
+            if self.client.upload_registry is not None:
+                self.client.upload_registry.remove_task(task_id)
             return True
         elif response.status_code == 409:
-            self.logger.error(f"Failed to delete task {task_id}: {response.json()['message']}")
+            self.logger.error("Failed to delete task %s: %s", task_id, response.json()['message'], extra={"task_id": task_id})
             raise TaskDeletionNotAllowedError("Only tasks with status 'ready' or 'failed' can be deleted.")
         else:
             result = response.json()
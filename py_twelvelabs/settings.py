@@ -1,17 +1,169 @@
-from typing import Text
-from pydantic_settings import BaseSettings
+import threading
+from functools import lru_cache
+from typing import Text, Dict, List, Optional
 
 
-class Settings(BaseSettings):
+@lru_cache(maxsize=None)
+def get_settings_class() -> type:
     """
-    Settings class.
+    Get the settings class. It is defined on first use, so that importing the package does not import pydantic-settings.
+
+    :return: Settings class.
     """
 
-    # Twelve Labs
-    BASE_API_URL: Text = "https://api.twelvelabs.io"
-    API_VERSION: Text = "v1.1"
-    DEFAULT_ENGINE: Text = "marengo2.5"
-    TASK_STATUS_POLLING_INTERVAL: int = 5
+    from pydantic_settings import BaseSettings
+
+    class Settings(BaseSettings):
+        """
+        Settings class.
+        """
+
+        # Twelve Labs
+        BASE_API_URL: Text = "https://api.twelvelabs.io"
+        API_VERSION: Text = "v1.1"
+        DEFAULT_ENGINE: Text = "marengo2.5"
+        TASK_STATUS_POLLING_INTERVAL: int = 5
+
+        # Task watcher
+        TASK_WATCHER_MIN_POLLING_INTERVAL: float = 1.0
+        TASK_WATCHER_MAX_POLLING_INTERVAL: float = 60.0
+        TASK_WATCHER_POLLING_JITTER: float = 0.1
+        TASK_WATCHER_LIST_THRESHOLD: int = 2
+        TASK_WATCHER_LIST_PAGE_LIMIT: int = 50
+        TASK_WATCHER_LIST_MAX_PAGES: int = 2
+        TASK_WATCHER_MAX_WORKERS: int = 4
+        TASK_WATCHER_MAX_POLL_ERRORS: int = 5
+
+        # Task callbacks
+        CALLBACK_HOST: Text = "127.0.0.1"
+        CALLBACK_PORT: int = 0
+        CALLBACK_PATH: Text = "/callbacks/tasks"
+        CALLBACK_SECRET: Text = ""
+        CALLBACK_MAX_AGE: float = 300.0
+        CALLBACK_FALLBACK_TIMEOUT: float = 300.0
+        CALLBACK_HISTORY_SIZE: int = 4096
+        CALLBACK_MAX_BODY_SIZE: int = 1024 * 1024
+
+        # Upload deduplication
+        DEDUP_ENABLED: bool = False
+        DEDUP_DATABASE: Text = ""
+        DEDUP_HASH_CHUNK_SIZE: int = 1024 * 1024
+        DEDUP_VERIFY: bool = True
+
+        # Metadata mirror
+        MIRROR_DATABASE: Text = ""
+        MIRROR_PAGE_LIMIT: int = 50
+        MIRROR_PREFETCH_PAGES: int = 2
+
+        # Listing
+        LIST_PREFETCH_PAGES: int = 2
+
+        # Bulk ingestion
+        BULK_MAX_WORKERS: int = 4
+        BULK_MAX_PER_HOST: int = 4
+
+        # HTTP transport
+        POOL_CONNECTIONS: int = 10
+        POOL_MAXSIZE: int = 10
+        KEEP_ALIVE: bool = True
+        IDLE_TIMEOUT: float = 60.0
+        UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+
+        # Timeouts
+        CONNECT_TIMEOUT: Optional[float] = 10.0
+        READ_TIMEOUT: Optional[float] = 60.0
+        TASK_WAIT_TIMEOUT: Optional[float] = None
+
+        # Retries
+        RETRY_MAX_RETRIES: int = 3
+        RETRY_BACKOFF_FACTOR: float = 0.5
+        RETRY_MAX_BACKOFF: float = 30.0
+        RETRY_MAX_ELAPSED_TIME: float = 120.0
+        RETRY_STATUS_CODES: List[int] = [429, 500, 502, 503, 504]
+        RETRY_SAFE_POST_ENDPOINTS: List[Text] = ["search"]
+        RETRY_ENDPOINT_OVERRIDES: Dict[Text, Dict] = {}
+
+        # Rate limiting
+        RATE_LIMITS: Dict[Text, float] = {}
+        RATE_LIMIT_BURST: float = 1.0
+        RATE_LIMIT_BACKEND: Text = "memory"
+        RATE_LIMIT_DIRECTORY: Text = ""
+
+        # Response cache
+        CACHE_ENABLED: bool = False
+        CACHE_MAXSIZE: int = 1024
+        CACHE_TTLS: Dict[Text, float] = {"index": 300.0, "index_list": 60.0, "task": 300.0}
+
+        # Batch search
+        BATCH_SEARCH_MAX_WORKERS: int = 4
+
+        # Federated search
+        FEDERATED_SEARCH_MAX_WORKERS: int = 8
+
+        # Search cache
+        SEARCH_CACHE_ENABLED: bool = False
+        SEARCH_CACHE_BACKEND: Text = "memory"
+        SEARCH_CACHE_TTL: float = 300.0
+        SEARCH_CACHE_MAXSIZE: int = 1024
+        SEARCH_CACHE_DIRECTORY: Text = ""
+
+        # Logging
+        LOG_FORMAT: Text = "color"
+        LOG_QUEUE_ENABLED: bool = False
+        LOG_QUEUE_MAXSIZE: int = 10000
+        LOG_RATE_LIMIT_INTERVAL: float = 0.0
+
+        # Metrics
+        METRICS_ENABLED: bool = True
+        METRICS_BUCKETS: List[float] = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+        # Resumable uploads
+        RESUMABLE_UPLOAD_PART_SIZE: int = 8 * 1024 * 1024
+        RESUMABLE_UPLOAD_MAX_RETRIES: int = 3
+        RESUMABLE_UPLOAD_MAX_WORKERS: int = 4
+        RESUMABLE_UPLOAD_BACKOFF_FACTOR: float = 0.5
+
+    return Settings
+
+
+class LazySettings:
+    """
+    Settings that are read from the environment on first access, and that behave like a Settings object afterwards.
+    """
+
+    __slots__ = ("_settings", "_lock")
+
+    def __init__(self):
+        object.__setattr__(self, "_settings", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _get_settings(self):
+        if self._settings is None:
+            with self._lock:
+                if self._settings is None:
+                    object.__setattr__(self, "_settings", get_settings_class()())
+        return self._settings
+
+    def __getattr__(self, name: Text):
+        return getattr(self._get_settings(), name)
+
+    def __setattr__(self, name: Text, value):
+        setattr(self._get_settings(), name, value)
+
+    def __delattr__(self, name: Text):
+        delattr(self._get_settings(), name)
+
+    def __dir__(self) -> List[Text]:
+        return dir(self._get_settings())
+
+    def __repr__(self) -> Text:
+        return repr(self._get_settings())
+
+
+def __getattr__(name: Text):
+    if name == "Settings":
+        return get_settings_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-settings = Settings()
\ No newline at end of file
+settings = LazySettings()
@@ -0,0 +1 @@
+from py_twelvelabs.testing.server import MockServer
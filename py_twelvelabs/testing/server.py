@@ -0,0 +1,355 @@
+import os
+import re
+import json
+import time
+import uuid
+import random
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Text, Dict, List, Tuple, Union, Optional
+
+from py_twelvelabs.callbacks import send_callback
+
+
+def _format_datetime(value: datetime) -> Text:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _paginate(items: List[Dict], query: Dict) -> Dict:
+    page = int(query.get('page', ["1"])[0])
+    page_limit = int(query.get('page_limit', ["10"])[0])
+    total_pages = max(1, -(-len(items) // page_limit))
+    return {
+        "data": items[(page - 1) * page_limit:page * page_limit],
+        "page_info": {"page": page, "limit_per_page": page_limit, "total_page": total_pages, "total_results": len(items)},
+    }
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _handle(self):
+        body = self._read_body()
+        status, payload = self.server.mock.handle(self.command, self.path, dict(self.headers), body)
+
+        content = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockServer:
+    """
+    Local HTTP server that emulates the indexes, tasks, tasks/status and search endpoints of the Twelve Labs API.
+
+    Indexes and tasks are kept in memory. Tasks move from pending to indexing to ready over task_duration seconds, and
+    every search returns search_result_count clips, paginated with page tokens. Latency and error rates can be
+    configured to exercise the client's retries and to measure its overhead without the real API. When a callback URL
+    is given, a signed notification is sent to it when each task completes, as the API does for registered webhooks.
+    """
+
+    def __init__(self, latency: Union[float, Tuple[float, float]] = 0.0, error_rate: float = 0.0, error_status: int = 503, task_duration: float = 0.0, search_result_count: int = 50, seed: int = None, callback_url: Text = None, callback_secret: Text = None):
+        """
+        Initialize the mock server.
+
+        :param latency: Seconds added to every response, or a (minimum, maximum) range to draw from uniformly.
+        :param error_rate: Fraction of requests answered with error_status instead of being handled.
+        :param error_status: Status code of injected errors.
+        :param task_duration: Seconds a task takes to become ready after it was created.
+        :param search_result_count: Number of clips returned by every search.
+        :param seed: Seed of the random generator used for latency and errors.
+        :param callback_url: URL that task notifications are sent to.
+        :param callback_secret: Secret that task notifications are signed with.
+        """
+
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.task_duration = task_duration
+        self.search_result_count = search_result_count
+        self.callback_url = callback_url
+        self.callback_secret = callback_secret
+
+        self.indexes: Dict[Text, Dict] = {}
+        self.tasks: Dict[Text, Dict] = {}
+        self.request_count = 0
+        self.callback_count = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._searches: Dict[Text, List[Dict]] = {}
+        self._timers: List[threading.Timer] = []
+        self._routes = [
+            ("POST", re.compile(r"/indexes"), self._create_index),
+            ("GET", re.compile(r"/indexes"), self._list_indexes),
+            ("GET", re.compile(r"/indexes/(\w+)"), self._get_index),
+            ("PUT", re.compile(r"/indexes/(\w+)"), self._update_index),
+            ("DELETE", re.compile(r"/indexes/(\w+)"), self._delete_index),
+            ("POST", re.compile(r"/tasks"), self._create_task),
+            ("GET", re.compile(r"/tasks"), self._list_tasks),
+            ("GET", re.compile(r"/tasks/status"), self._get_task_status),
+            ("GET", re.compile(r"/tasks/(\w+)"), self._get_task),
+            ("DELETE", re.compile(r"/tasks/(\w+)"), self._delete_task),
+            ("POST", re.compile(r"/search"), self._search),
+            ("GET", re.compile(r"/search/([\w-]+)"), self._get_search_page),
+        ]
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _MockHandler)
+        self._server.daemon_threads = True
+        self._server.mock = self
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self) -> "MockServer":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        for timer in self._timers:
+            timer.cancel()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def add_index(self, index_name: Text = "index", index_options: List[Text] = None) -> Text:
+        """
+        Add an index directly, without a request.
+
+        :param index_name: Index name.
+        :param index_options: Index options.
+        :return: Index ID.
+        """
+
+        return self._create_index(None, {}, {"index_name": index_name, "index_options": index_options or ["visual"]})[1]['_id']
+
+    def add_task(self, index_id: Text, status: Text = None) -> Text:
+        """
+        Add a task directly, without a request.
+
+        :param index_id: Index ID.
+        :param status: Fixed status of the task. By default, the task progresses over task_duration seconds.
+        :return: Task ID.
+        """
+
+        task_id = self._new_task(index_id, "video.mp4")
+        if status is not None:
+            self.tasks[task_id]['status'] = status
+        return task_id
+
+    def handle(self, method: Text, path: Text, headers: Dict, body: bytes) -> Tuple[int, Optional[Dict]]:
+        """
+        Handle a request.
+
+        :param method: HTTP method.
+        :param path: Request path, including the query string.
+        :param headers: Request headers.
+        :param body: Request body.
+        :return: Status code and response payload.
+        """
+
+        with self._lock:
+            self.request_count += 1
+            latency = self._random.uniform(*self.latency) if isinstance(self.latency, tuple) else self.latency
+            is_error = self._random.random() < self.error_rate
+
+        if latency > 0:
+            time.sleep(latency)
+        if not headers.get("x-api-key"):
+            return 401, {"message": "Missing API key."}
+        if is_error:
+            return self.error_status, {"message": "Injected error."}
+
+        url = urlparse(path)
+        endpoint = re.sub(r"^/v[\d.]+", "", url.path)
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(endpoint)
+            if route_method == method and match is not None:
+                with self._lock:
+                    return handler(match, parse_qs(url.query), body if "multipart" in headers.get("Content-Type", "") else self._parse_json(body))
+        return 404, {"message": f"No route for {method} {endpoint}"}
+
+    @staticmethod
+    def _parse_json(body: bytes) -> Dict:
+        return json.loads(body) if body else {}
+
+    def _get_task_state(self, task: Dict) -> Dict:
+        if task['status'] in ("pending", "indexing"):
+            elapsed = (datetime.utcnow() - task['_created_at']).total_seconds()
+            if elapsed >= self.task_duration:
+                task['status'] = "ready"
+                task['updated_at'] = _format_datetime(task['_created_at'] + timedelta(seconds=self.task_duration))
+            elif elapsed >= self.task_duration / 2:
+                task['status'] = "indexing"
+            task['process'] = {"percentage": min(100.0, 100.0 * elapsed / self.task_duration) if self.task_duration else 100.0, "remain_seconds": max(0.0, self.task_duration - elapsed)}
+        return {key: value for key, value in task.items() if not key.startswith("_") or key == "_id"}
+
+    def _create_index(self, match, query, data):
+        now = _format_datetime(datetime.utcnow())
+        index_id = uuid.uuid4().hex[:24]
+        self.indexes[index_id] = {
+            "_id": index_id,
+            "index_name": data['index_name'],
+            "index_options": data['index_options'],
+            "engine_id": data.get('engine_id') or "marengo2.5",
+            "addons": data.get('addons'),
+            "created_at": now,
+            "updated_at": now,
+            "expires_at": _format_datetime(datetime.utcnow() + timedelta(days=90)),
+            "video_count": 0,
+            "total_duration": 0.0,
+        }
+        return 201, {"_id": index_id}
+
+    def _list_indexes(self, match, query, data):
+        indexes = sorted(self.indexes.values(), key=lambda index: index[query.get('sort_by', ["created_at"])[0]], reverse=query.get('sort_option', ["desc"])[0] == "desc")
+        return 200, _paginate(indexes, query)
+
+    def _get_index(self, match, query, data):
+        index = self.indexes.get(match.group(1))
+        if index is None:
+            return 404, {"message": f"Index {match.group(1)} does not exist."}
+        return 200, index
+
+    def _update_index(self, match, query, data):
+        index = self.indexes.get(match.group(1))
+        if index is None:
+            return 404, {"message": f"Index {match.group(1)} does not exist."}
+        index['index_name'] = data['index_name']
+        index['updated_at'] = _format_datetime(datetime.utcnow())
+        return 200, None
+
+    def _delete_index(self, match, query, data):
+        if self.indexes.pop(match.group(1), None) is None:
+            return 404, {"message": f"Index {match.group(1)} does not exist."}
+        return 204, None
+
+    def _new_task(self, index_id: Text, filename: Text) -> Text:
+        now = datetime.utcnow()
+        task_id = uuid.uuid4().hex[:24]
+        self.tasks[task_id] = {
+            "_id": task_id,
+            "index_id": index_id,
+            "video_id": task_id,
+            "status": "pending",
+            "metadata": {"filename": filename, "duration": 60.0, "width": 1280, "height": 720},
+            "created_at": _format_datetime(now),
+            "updated_at": _format_datetime(now),
+            "estimated_time": _format_datetime(now + timedelta(seconds=self.task_duration)),
+            "_created_at": now,
+        }
+        if index_id in self.indexes:
+            self.indexes[index_id]['video_count'] += 1
+        if self.callback_url is not None:
+            timer = threading.Timer(self.task_duration + 0.01, self._send_callback, (task_id,))
+            timer.daemon = True
+            timer.start()
+            self._timers.append(timer)
+        return task_id
+
+    def _send_callback(self, task_id: Text):
+        with self._lock:
+            task = self.tasks.get(task_id)
+            if task is None:
+                return
+            state = self._get_task_state(task)
+            if state['status'] not in ("ready", "failed"):
+                return
+            self.callback_count += 1
+        try:
+            send_callback(self.callback_url, state, self.callback_secret)
+        except OSError:
+            pass
+
+    def _create_task(self, match, query, body: bytes):
+        fields = dict(re.findall(rb'name="(\w+)"(?:; filename="[^"]*")?\r\n(?:[^\r\n]+\r\n)*\r\n([^\r\n]*)', body))
+        index_id = fields.get(b"index_id", b"").decode()
+        if index_id not in self.indexes:
+            return 400, {"message": f"Index {index_id} does not exist."}
+        filename = re.search(rb'filename="([^"]*)"', body)
+        return 201, {"_id": self._new_task(index_id, os.path.basename(filename.group(1).decode()) if filename else fields.get(b"video_url", b"").decode())}
+
+    def _list_tasks(self, match, query, data):
+        tasks = [self._get_task_state(task) for task in self.tasks.values() if 'index_id' not in query or task['index_id'] == query['index_id'][0]]
+        tasks.sort(key=lambda task: task[query.get('sort_by', ["created_at"])[0]], reverse=query.get('sort_option', ["desc"])[0] == "desc")
+        return 200, _paginate(tasks, query)
+
+    def _get_task_status(self, match, query, data):
+        index_id = query.get('index_id', [""])[0]
+        statuses = [self._get_task_state(task)['status'] for task in self.tasks.values() if task['index_id'] == index_id]
+        counts = {status: statuses.count(status) for status in ("ready", "validating", "pending", "failed")}
+        return 200, {"index_id": index_id, **counts, "total_result": len(statuses)}
+
+    def _get_task(self, match, query, data):
+        task = self.tasks.get(match.group(1))
+        if task is None:
+            return 404, {"message": f"Task {match.group(1)} does not exist."}
+        return 200, self._get_task_state(task)
+
+    def _delete_task(self, match, query, data):
+        task = self.tasks.get(match.group(1))
+        if task is None:
+            return 404, {"message": f"Task {match.group(1)} does not exist."}
+        if self._get_task_state(task)['status'] not in ("ready", "failed"):
+            return 409, {"message": "Only tasks with status 'ready' or 'failed' can be deleted."}
+        del self.tasks[match.group(1)]
+        return 204, None
+
+    def _search(self, match, query, data):
+        if data.get('index_id') not in self.indexes:
+            return 400, {"message": f"Index {data.get('index_id')} does not exist."}
+
+        clips = [{
+            "video_id": f"video_{i % 10}",
+            "score": round(95.0 - 90.0 * i / self.search_result_count, 2),
+            "start": float(i * 5),
+            "end": float(i * 5 + 5),
+            "confidence": "high" if i < self.search_result_count / 3 else "medium",
+            "metadata": [{"type": option} for option in data.get('search_options', [])],
+        } for i in range(self.search_result_count)]
+        search_id = uuid.uuid4().hex[:12]
+        self._searches[search_id] = clips
+        return 200, self._get_page(search_id, 1, int(data.get('page_limit') or 10))
+
+    def _get_search_page(self, match, query, data):
+        search_id, page, page_limit = match.group(1).split("-")
+        if search_id not in self._searches:
+            return 404, {"message": "Page token expired."}
+        return 200, self._get_page(search_id, int(page), int(page_limit))
+
+    def _get_page(self, search_id: Text, page: int, page_limit: int) -> Dict:
+        clips = self._searches[search_id]
+        total_pages = max(1, -(-len(clips) // page_limit))
+        page_info = {"page": page, "limit_per_page": page_limit, "total_page": total_pages, "total_results": len(clips), "page_expired_at": _format_datetime(datetime.utcnow() + timedelta(hours=1))}
+        if page < total_pages:
+            page_info['next_page_token'] = f"{search_id}-{page + 1}-{page_limit}"
+        return {"data": clips[(page - 1) * page_limit:page * page_limit], "page_info": page_info, "search_pool": {"index_id": "", "total_count": len(clips)}}
@@ -0,0 +1,106 @@
+from collections import deque, Counter
+from urllib.parse import urlparse
+from typing import Text, Dict, Union, Iterable, Optional, Tuple
+
+
+class BulkScheduler:
+    """
+    Hands out bulk ingestion items while keeping the number of in-flight items per host under a limit.
+
+    Items are pulled lazily from the input iterable. Items whose host is at its limit are set aside and handed out
+    once a slot on that host is released, so the input is never read far ahead of the uploads.
+    """
+
+    def __init__(self, items: Iterable[Union[Text, Dict]], max_per_host: int, default_host: Text, max_deferred: int):
+        """
+        Initialize the scheduler.
+
+        :param items: Video files, video URLs or dictionaries of create_async keyword arguments.
+        :param max_per_host: Maximum number of in-flight items per host.
+        :param default_host: Host used for local video files, i.e. the host they are uploaded to.
+        :param max_deferred: Maximum number of items set aside while their host is busy.
+        """
+
+        self._items = iter(items)
+        self._is_exhausted = False
+        self._deferred = deque()
+        self._in_flight = Counter()
+        self.max_per_host = max_per_host
+        self.default_host = default_host
+        self.max_deferred = max_deferred
+
+    @property
+    def is_done(self) -> bool:
+        """
+        Whether every item has been handed out.
+        """
+
+        return self._is_exhausted and not self._deferred
+
+    @staticmethod
+    def normalize(item: Union[Text, Dict]) -> Dict:
+        """
+        Convert an item to create_async keyword arguments.
+
+        Strings starting with http:// or https:// are treated as video URLs, any other string as a video file.
+
+        :param item: Video file, video URL or dictionary of create_async keyword arguments.
+        :return: create_async keyword arguments.
+        """
+
+        if isinstance(item, dict):
+            return item
+        if item.startswith(("http://", "https://")):
+            return {"video_url": item}
+        return {"video_file": item}
+
+    def get_host(self, kwargs: Dict) -> Text:
+        """
+        Get the host an item's video is transferred from.
+
+        :param kwargs: create_async keyword arguments.
+        :return: Host.
+        """
+
+        if kwargs.get('video_url') is not None:
+            return urlparse(kwargs['video_url']).netloc
+        return self.default_host
+
+    def acquire(self) -> Optional[Tuple[Dict, Text]]:
+        """
+        Get the next item whose host has a free slot and reserve that slot.
+
+        :return: create_async keyword arguments and host, or None if no item can be started right now.
+        """
+
+        for _ in range(len(self._deferred)):
+            kwargs, host = self._deferred.popleft()
+            if self._in_flight[host] < self.max_per_host:
+                self._in_flight[host] += 1
+                return kwargs, host
+            self._deferred.append((kwargs, host))
+
+        while not self._is_exhausted and len(self._deferred) < self.max_deferred:
+            try:
+                item = next(self._items)
+            except StopIteration:
+                self._is_exhausted = True
+                break
+
+            kwargs = self.normalize(item)
+            host = self.get_host(kwargs)
+            if self._in_flight[host] < self.max_per_host:
+                self._in_flight[host] += 1
+                return kwargs, host
+            self._deferred.append((kwargs, host))
+
+        return None
+
+    def release(self, host: Text):
+        """
+        Release a slot reserved by acquire.
+
+        :param host: Host.
+        """
+
+        self._in_flight[host] -= 1
@@ -0,0 +1,240 @@
+import copy
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Text, Dict, Hashable, Callable, Optional
+
+from py_twelvelabs.settings import settings
+
+
+class CacheEntry:
+    """
+    A cached value with its expiry time and, if the server sent one, its ETag.
+    """
+
+    __slots__ = ("value", "etag", "expires_at")
+
+    def __init__(self, value: Any, etag: Optional[Text], expires_at: float):
+        self.value = value
+        self.etag = etag
+        self.expires_at = expires_at
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def copy_value(self) -> Any:
+        """
+        Get a deep copy of the value, so that callers can change it without changing the cache.
+
+        :return: Copy of the value.
+        """
+
+        return copy.deepcopy(self.value)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time to live.
+
+    Expired entries that carry an ETag are kept until they are evicted, so that they can be revalidated with a
+    conditional request instead of being downloaded again.
+
+    Values are copied when they are stored and when they are read, so callers never share them with the cache. Every
+    deletion increments the cache's generation. A lookup that was started before a deletion passes the generation it
+    read to set or revalidate, which then drop its possibly stale value.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+
+        :param maxsize: Maximum number of entries. The least recently used entry is evicted first.
+        :param ttl: Number of seconds an entry stays fresh.
+        """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Look up an entry, fresh or not, and count the lookup as a hit or a miss.
+
+        :param key: Cache key.
+        :return: Cache entry, or None if there is no fresh entry and no stale entry that can be revalidated.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.is_fresh and entry.etag is None:
+                del self._entries[key]
+                entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+            if entry is not None and entry.is_fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get a fresh value.
+
+        :param key: Cache key.
+        :return: Cached value, or None if there is no fresh entry.
+        """
+
+        entry = self.lookup(key)
+        return entry.copy_value() if entry is not None and entry.is_fresh else None
+
+    def set(self, key: Hashable, value: Any, etag: Text = None, generation: int = None):
+        """
+        Store a copy of a value.
+
+        :param key: Cache key.
+        :param value: Value.
+        :param etag: ETag of the response the value was parsed from.
+        :param generation: Generation read before the value was requested. The value is dropped if entries were deleted since.
+        """
+
+        value = copy.deepcopy(value)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = CacheEntry(value, etag, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def revalidate(self, key: Hashable, entry: CacheEntry, generation: int = None):
+        """
+        Mark an entry as fresh again after the server confirmed it has not changed.
+
+        :param key: Cache key.
+        :param entry: Cache entry.
+        :param generation: Generation read before the entry was revalidated. The entry is not stored again if entries were deleted since.
+        """
+
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            entry.expires_at = time.monotonic() + self.ttl
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+            self.generation += 1
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]):
+        """
+        Delete all entries whose key matches a predicate.
+
+        :param predicate: Function called with each key.
+        """
+
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+            self.generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def get_stats(self) -> Dict[Text, int]:
+        return {"hits": self.hits, "misses": self.misses, "revalidations": self.revalidations, "size": len(self)}
+
+
+class ResponseCache:
+    """
+    Caches of parsed API responses, one per kind of resource, each with its own time to live.
+
+    The resources consult it before sending requests and invalidate the affected entries after local writes.
+    """
+
+    def __init__(self, ttls: Dict[Text, float] = None, maxsize: int = None):
+        """
+        Initialize the response cache.
+
+        :param ttls: Time to live in seconds per cache name ("index", "index_list", "task"). Defaults to settings.CACHE_TTLS.
+        :param maxsize: Maximum number of entries per cache. Defaults to settings.CACHE_MAXSIZE.
+        """
+
+        ttls = {**settings.CACHE_TTLS, **(ttls or {})}
+        maxsize = maxsize if maxsize is not None else settings.CACHE_MAXSIZE
+        self._caches = {name: TTLCache(maxsize, ttl) for name, ttl in ttls.items()}
+
+    def __getitem__(self, name: Text) -> TTLCache:
+        return self._caches[name]
+
+    def get_stats(self) -> Dict[Text, Dict[Text, int]]:
+        """
+        Get hit, miss and revalidation counters and the size of every cache.
+
+        :return: Statistics per cache name.
+        """
+
+        return {name: cache.get_stats() for name, cache in self._caches.items()}
+
+    def clear(self):
+        for cache in self._caches.values():
+            cache.clear()
+
+    def invalidate_index(self, index_id: Text = None):
+        """
+        Invalidate the entries affected by a change to an index.
+
+        :param index_id: ID of the changed index, or None if an index was created.
+        """
+
+        if index_id is not None:
+            self._caches['index'].delete(index_id)
+        self._caches['index_list'].clear()
+
+    def invalidate_task(self, task_id: Text):
+        """
+        Invalidate the entries affected by a change to a task.
+
+        :param task_id: ID of the changed task.
+        """
+
+        self._caches['task'].delete(task_id)
+
+    @staticmethod
+    def get_conditional_headers(entry: Optional[CacheEntry]) -> Optional[Dict]:
+        """
+        Get the headers for revalidating a stale entry with a conditional request.
+
+        :param entry: Cache entry.
+        :return: Request headers, or None if the entry cannot be revalidated.
+        """
+
+        if entry is None or entry.etag is None:
+            return None
+        return {"If-None-Match": entry.etag}
+
+    @staticmethod
+    def get_key(params: Dict) -> Hashable:
+        """
+        Get a cache key for request parameters.
+
+        :param params: Request parameters.
+        :return: Cache key.
+        """
+
+        return tuple(sorted((key, tuple(value) if isinstance(value, list) else value) for key, value in params.items()))
@@ -0,0 +1,75 @@
+import os
+import json
+from typing import Text, Dict
+
+from py_twelvelabs.utilities.logger import get_logger
+
+
+class BatchCheckpoint:
+    """
+    Append-only JSON Lines file recording the result of every query of a batch that completed successfully.
+
+    Each line holds the position of a query in the batch, the query and its result, so a batch that is run again with
+    the same checkpoint file reuses the recorded results of unchanged queries instead of sending them again.
+    """
+
+    def __init__(self, path: Text):
+        """
+        Initialize the checkpoint.
+
+        :param path: Path of the checkpoint file.
+        """
+
+        self.path = path
+        self.logger = get_logger(__name__)
+        self._file = None
+
+    def load(self) -> Dict[int, Dict]:
+        """
+        Load the recorded results. A truncated last line, left by a crash while it was written, is ignored.
+
+        :return: Recorded queries and results by position.
+        """
+
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+
+        with open(self.path) as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                entries[entry['position']] = entry
+
+        self.logger.info("Resuming batch from %s: %d queries already completed.", self.path, len(entries))
+        return entries
+
+    def write(self, position: int, query: Dict, result: Dict):
+        """
+        Record the result of a query.
+
+        :param position: Position of the query in the batch.
+        :param query: Query.
+        :param result: Result.
+        """
+
+        if self._file is None:
+            self._file = open(self.path, "a+b")
+            if self._file.tell() > 0:
+                self._file.seek(-1, os.SEEK_END)
+                if self._file.read(1) != b"\n":
+                    self._file.write(b"\n")
+        self._file.write(json.dumps({"position": position, "query": query, "result": result}).encode() + b"\n")
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Text
+
+
+DATE_FORMATS = ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"]
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: Text) -> datetime:
+    """
+    Parse a UTC timestamp returned by the API, such as 2024-01-01T00:00:00.000Z, into a naive datetime.
+
+    datetime.fromisoformat is tried first because it is several times faster than strptime. Results are cached, since
+    the tasks of a listing often share timestamps and datetimes are immutable.
+
+    :param value: Timestamp.
+    :return: Datetime.
+    """
+
+    try:
+        parsed = datetime.fromisoformat(value[:-1] if value.endswith("Z") else value)
+    except ValueError:
+        pass
+    else:
+        return parsed if parsed.tzinfo is None else parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"time data '{value}' does not match any of the formats {DATE_FORMATS}")
@@ -0,0 +1,278 @@
+import time
+import asyncio
+import threading
+import concurrent.futures
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, List, Callable, Iterator, Awaitable, Optional
+
+from py_twelvelabs.exceptions import DeadlineExceededError, RequestCancelledError
+
+
+class CancelToken:
+    """
+    Cooperative cancellation of client calls, which can be triggered from any thread.
+
+    Calls made within a deadline scope that holds the token stop before their next request attempt, retry backoff or
+    task poll once the token is cancelled, and raise RequestCancelledError. In-flight asynchronous requests are
+    cancelled immediately, while in-flight synchronous requests are left to complete within their timeouts.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self):
+        """
+        Cancel the calls using the token.
+        """
+
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]):
+        """
+        Register a function to be called when the token is cancelled. It is called at once if the token is already cancelled.
+
+        :param callback: Function to call.
+        """
+
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]):
+        """
+        Unregister a function added with add_callback.
+
+        :param callback: Function to unregister.
+        """
+
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Wait until the token is cancelled.
+
+        :param timeout: Maximum number of seconds to wait.
+        :return: True if the token is cancelled.
+        """
+
+        return self._event.wait(timeout)
+
+
+class Deadline:
+    """
+    Overall time limit and cancel token of a client call, spanning all of its requests, retries and polls.
+    """
+
+    __slots__ = ("expires_at", "cancel_token")
+
+    def __init__(self, expires_at: float = None, cancel_token: CancelToken = None):
+        """
+        Initialize the deadline.
+
+        :param expires_at: time.monotonic() value after which the call fails, or None for no time limit.
+        :param cancel_token: Token that cancels the call.
+        """
+
+        self.expires_at = expires_at
+        self.cancel_token = cancel_token
+
+    def remaining(self) -> Optional[float]:
+        """
+        Get the time left.
+
+        :return: Number of seconds left, or None if there is no time limit.
+        """
+
+        return None if self.expires_at is None else self.expires_at - time.monotonic()
+
+    def get_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """
+        Cap a timeout to the time left.
+
+        :param timeout: Timeout in seconds, or None for no timeout.
+        :return: The smaller of the timeout and the time left.
+        """
+
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        remaining = max(remaining, 0.0)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def allows(self, seconds: float) -> bool:
+        """
+        Whether waiting for a number of seconds leaves time for another attempt.
+
+        :param seconds: Number of seconds.
+        :return: True if the deadline is further away than the given number of seconds.
+        """
+
+        remaining = self.remaining()
+        return remaining is None or seconds < remaining
+
+    def check(self):
+        """
+        Raise if the call was cancelled or ran out of time.
+        """
+
+        if self.cancel_token is not None and self.cancel_token.is_cancelled:
+            raise RequestCancelledError("The call was cancelled.")
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceededError("The call did not complete before its deadline.")
+
+    def sleep(self, seconds: float):
+        """
+        Sleep, waking up early if the call is cancelled.
+
+        :param seconds: Number of seconds to sleep.
+        """
+
+        seconds = self.get_timeout(seconds)
+        if self.cancel_token is not None:
+            self.cancel_token.wait(seconds)
+        else:
+            time.sleep(seconds)
+        self.check()
+
+    def wait(self, future: concurrent.futures.Future) -> Any:
+        """
+        Wait for the result of a future within the time left, cancelling the future if the call is cancelled.
+
+        :param future: Future.
+        :return: Result of the future.
+        """
+
+        if self.cancel_token is not None:
+            self.cancel_token.add_callback(future.cancel)
+        try:
+            return future.result(timeout=self.get_timeout(None))
+        except concurrent.futures.TimeoutError:
+            raise DeadlineExceededError("The call did not complete before its deadline.")
+        except concurrent.futures.CancelledError:
+            self.check()
+            raise
+        finally:
+            if self.cancel_token is not None:
+                self.cancel_token.remove_callback(future.cancel)
+
+    async def run_async(self, awaitable: Awaitable) -> Any:
+        """
+        Await within the time left, cancelling the awaitable if the call is cancelled.
+
+        :param awaitable: Coroutine or future.
+        :return: Result of the awaitable.
+        """
+
+        self.check()
+        if self.expires_at is None and self.cancel_token is None:
+            return await awaitable
+
+        future = asyncio.ensure_future(awaitable)
+        callback = None
+        if self.cancel_token is not None:
+            loop = asyncio.get_running_loop()
+            callback = lambda: loop.call_soon_threadsafe(future.cancel)
+            self.cancel_token.add_callback(callback)
+        try:
+            return await asyncio.wait_for(future, self.get_timeout(None))
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError("The call did not complete before its deadline.")
+        except asyncio.CancelledError:
+            if future.cancelled() and self.cancel_token is not None and self.cancel_token.is_cancelled:
+                raise RequestCancelledError("The call was cancelled.")
+            raise
+        finally:
+            if callback is not None:
+                self.cancel_token.remove_callback(callback)
+
+    async def sleep_async(self, seconds: float):
+        """
+        Sleep without blocking the event loop, waking up early if the call is cancelled.
+
+        :param seconds: Number of seconds to sleep.
+        """
+
+        seconds = self.get_timeout(seconds)
+        if self.cancel_token is not None:
+            await self.run_async(asyncio.sleep(seconds))
+        else:
+            await asyncio.sleep(seconds)
+        self.check()
+
+
+_NO_DEADLINE = Deadline()
+_current_deadline: ContextVar[Deadline] = ContextVar("current_deadline", default=_NO_DEADLINE)
+
+
+def get_deadline() -> Deadline:
+    """
+    Get the deadline of the current context.
+
+    :return: Deadline, with no time limit and no cancel token outside of any deadline scope.
+    """
+
+    return _current_deadline.get()
+
+
+def clear_deadline():
+    """
+    Remove the deadline of the current context, e.g. in a background task that must outlive the call that started it.
+    """
+
+    _current_deadline.set(_NO_DEADLINE)
+
+
+@contextmanager
+def deadline(timeout: float = None, cancel_token: CancelToken = None) -> Iterator[Deadline]:
+    """
+    Limit the duration of all client calls made within the scope and make them cancellable.
+
+    The deadline applies to every request, retry and task poll made from the current thread or coroutine, as well as
+    from the threads the client starts for them. Nested scopes keep the earliest deadline and are cancelled by either
+    token.
+
+    :param timeout: Number of seconds the calls may take in total, or None for no time limit.
+    :param cancel_token: Token that cancels the calls.
+    :return: Deadline of the scope.
+    """
+
+    parent = get_deadline()
+    expires_at = time.monotonic() + timeout if timeout is not None else None
+    if parent.expires_at is not None:
+        expires_at = parent.expires_at if expires_at is None else min(expires_at, parent.expires_at)
+
+    token = cancel_token if cancel_token is not None else parent.cancel_token
+    link = None
+    if cancel_token is not None and parent.cancel_token is not None and cancel_token is not parent.cancel_token:
+        token = CancelToken()
+        link = token.cancel
+        parent.cancel_token.add_callback(link)
+        cancel_token.add_callback(link)
+
+    scope = Deadline(expires_at, token)
+    reset_token = _current_deadline.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_deadline.reset(reset_token)
+        if link is not None:
+            parent.cancel_token.remove_callback(link)
+            cancel_token.remove_callback(link)
@@ -0,0 +1,177 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Text, Dict, Optional
+
+from py_twelvelabs.settings import settings
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    index_id TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    video_id TEXT,
+    size INTEGER,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (index_id, content_hash)
+);
+CREATE INDEX IF NOT EXISTS uploads_task_id ON uploads (task_id);
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+"""
+
+
+def hash_file(path: Text, chunk_size: int = None) -> Text:
+    """
+    Hash the content of a file with BLAKE2b, reading it in fixed-size chunks into a reused buffer.
+
+    :param path: Path to the file.
+    :param chunk_size: Number of bytes read at a time. Defaults to settings.DEDUP_HASH_CHUNK_SIZE.
+    :return: Hex digest of the content.
+    """
+
+    digest = hashlib.blake2b(digest_size=32)
+    buffer = bytearray(chunk_size or settings.DEDUP_HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as file:
+        while True:
+            size = file.readinto(buffer)
+            if not size:
+                break
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+class UploadRegistry:
+    """
+    Persistent record of the videos uploaded to each index, by content hash, kept in a local SQLite database.
+
+    Before a video file is uploaded, its hash is looked up for the target index, so that a file whose content was already
+    uploaded there is not sent again. Hashes are cached by path, size and modification time, so a file that is ingested
+    again unchanged is not read again either. The database can be shared by several processes.
+    """
+
+    def __init__(self, path: Text = None, chunk_size: int = None):
+        """
+        Initialize the registry.
+
+        :param path: Path of the SQLite database, or ":memory:". Defaults to settings.DEDUP_DATABASE, or to uploads.sqlite3 in the py_twelvelabs directory of the user's cache directory.
+        :param chunk_size: Number of bytes read at a time when hashing files. Defaults to settings.DEDUP_HASH_CHUNK_SIZE.
+        """
+
+        self.path = path or settings.DEDUP_DATABASE or os.path.join(os.path.expanduser("~"), ".cache", "py_twelvelabs", "uploads.sqlite3")
+        self.chunk_size = chunk_size or settings.DEDUP_HASH_CHUNK_SIZE
+        if self.path != ":memory:" and os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        with self._lock:
+            if self.path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "UploadRegistry":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM uploads").fetchone()[0]
+
+    def get_hash(self, video_file: Text) -> Text:
+        """
+        Get the content hash of a file, hashing it only if it changed since it was last hashed.
+
+        :param video_file: Path to the file.
+        :return: Content hash.
+        """
+
+        path = os.path.abspath(video_file)
+        stat = os.stat(path)
+        with self._lock:
+            row = self._connection.execute("SELECT content_hash FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ?", (path, stat.st_size, stat.st_mtime_ns)).fetchone()
+        if row is not None:
+            return row[0]
+
+        content_hash = hash_file(path, self.chunk_size)
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)", (path, stat.st_size, stat.st_mtime_ns, content_hash))
+        return content_hash
+
+    def lookup(self, index_id: Text, content_hash: Text) -> Optional[Dict]:
+        """
+        Look up the task created for some content in an index.
+
+        :param index_id: Index ID.
+        :param content_hash: Content hash.
+        :return: Task ID, video ID, size and creation time of the upload, or None if the content was not uploaded to the index.
+        """
+
+        with self._lock:
+            row = self._connection.execute("SELECT task_id, video_id, size, created_at FROM uploads WHERE index_id = ? AND content_hash = ?", (index_id, content_hash)).fetchone()
+        if row is None:
+            return None
+        return {"task_id": row[0], "video_id": row[1], "size": row[2], "created_at": row[3]}
+
+    def record(self, index_id: Text, content_hash: Text, task_id: Text, video_id: Text = None, size: int = None):
+        """
+        Record the task created for some content in an index.
+
+        :param index_id: Index ID.
+        :param content_hash: Content hash.
+        :param task_id: Task ID.
+        :param video_id: Video ID, once known.
+        :param size: Size of the content in bytes.
+        """
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO uploads (index_id, content_hash, task_id, video_id, size, created_at) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (index_id, content_hash) DO UPDATE SET task_id = excluded.task_id, video_id = COALESCE(excluded.video_id, uploads.video_id), size = COALESCE(excluded.size, uploads.size)",
+                (index_id, content_hash, task_id, video_id, size, time.time()),
+            )
+
+    def remove(self, index_id: Text, content_hash: Text):
+        """
+        Forget the upload of some content to an index.
+
+        :param index_id: Index ID.
+        :param content_hash: Content hash.
+        """
+
+        with self._lock:
+            self._connection.execute("DELETE FROM uploads WHERE index_id = ? AND content_hash = ?", (index_id, content_hash))
+
+    def remove_task(self, task_id: Text):
+        """
+        Forget the uploads that created a task, e.g. after the task was deleted.
+
+        :param task_id: Task ID.
+        """
+
+        with self._lock:
+            self._connection.execute("DELETE FROM uploads WHERE task_id = ?", (task_id,))
+
+    def remove_index(self, index_id: Text):
+        """
+        Forget all uploads to an index, e.g. after the index was deleted.
+
+        :param index_id: Index ID.
+        """
+
+        with self._lock:
+            self._connection.execute("DELETE FROM uploads WHERE index_id = ?", (index_id,))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
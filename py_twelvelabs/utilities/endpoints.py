@@ -0,0 +1,28 @@
+from typing import Text
+
+
+def get_endpoint_class(endpoint: Text) -> Text:
+    """
+    Get the class of an API endpoint, i.e. its first path segment.
+
+    For example, "tasks/status?index_id=..." and "tasks/{task_id}" both belong to the "tasks" class.
+
+    :param endpoint: API endpoint.
+    :return: Endpoint class.
+    """
+
+    return endpoint.split("?", 1)[0].split("/", 1)[0]
+
+
+def get_endpoint_route(endpoint: Text) -> Text:
+    """
+    Get the route of an API endpoint, with IDs and page tokens replaced by a placeholder to keep metric tags bounded.
+
+    For example, "tasks/{task_id}" becomes "tasks/{id}" and "tasks/status?index_id=..." becomes "tasks/status".
+
+    :param endpoint: API endpoint.
+    :return: Endpoint route.
+    """
+
+    segments = endpoint.split("?", 1)[0].split("/")
+    return "/".join([segments[0]] + [segment if segment == "status" else "{id}" for segment in segments[1:]])
@@ -1,6 +1,15 @@
 import os
+import json
+import time
+import queue
+import atexit
 import logging
-from logging.config import dictConfig
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Text, Dict, Tuple, List
+
+from py_twelvelabs.settings import settings
 
 
 class ColorFormatter(logging.Formatter):
@@ -29,39 +38,171 @@ class ColorFormatter(logging.Formatter):
         return log_fmt.format(record)
 
 
+# Extra fields of records that RateLimitFilter may drop, e.g. logger.debug("Polling %s.", task_id, extra=RATE_LIMITED).
+RATE_LIMITED = {"rate_limited": True}
+
+# Attributes of every log record, which are not copied to JSON records as extra fields.
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName", "rate_limited"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    A logging formatter that writes every record as one JSON object.
+
+    Fields passed through the extra argument of a logging call, e.g. the task ID and status of task polling messages,
+    are added to the object as they are.
+    """
+
+    def format(self, record: logging.LogRecord) -> Text:
+        payload = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.processName,
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    A logging filter that lets through at most one record per logger and message template in every interval.
+
+    Only records logged with the extra fields of RATE_LIMITED, such as the ones logged every time a task is polled, are
+    rate-limited, so that distinct events sharing a template, such as task completions, are all written. Dropped records
+    are dropped before they are formatted or written. The next record let through for the same template gets a
+    suppressed attribute with the number of records dropped since the previous one. Records at or above the given level
+    are never dropped.
+    """
+
+    def __init__(self, interval: float, level: int = logging.WARNING):
+        """
+        Initialize the filter.
+
+        :param interval: Minimum number of seconds between two records with the same template.
+        :param level: Level from which records are always let through.
+        """
+
+        super().__init__()
+        self.interval = interval
+        self.level = level
+        self._last: Dict[Tuple[Text, Text], List] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.level or not getattr(record, "rate_limited", False):
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            state = self._last.get(key)
+            if state is not None and now - state[0] < self.interval:
+                state[1] += 1
+                return False
+            self._last[key] = [now, 0]
+
+        if state is not None and state[1]:
+            record.suppressed = state[1]
+        return True
+
+
+class _LazyQueueHandler(QueueHandler):
+    """
+    A queue handler that leaves formatting to the listener thread, and drops records instead of blocking when the queue
+    is full.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records stay in this process, so the message and arguments do not need to be merged before being queued.
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def create_queue_handler(*handlers: logging.Handler, maxsize: int = None) -> QueueHandler:
+    """
+    Create a handler that passes records to the given handlers on a background thread.
+
+    Logging calls only put records on a queue, while a listener thread formats and writes them. The listener is stopped,
+    after writing the remaining records, when the interpreter exits.
+
+    :param handlers: Handlers that format and write the records.
+    :param maxsize: Maximum number of queued records, after which records are dropped. Defaults to settings.LOG_QUEUE_MAXSIZE.
+    :return: Queue handler.
+    """
+
+    records = queue.Queue(maxsize if maxsize is not None else settings.LOG_QUEUE_MAXSIZE)
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return _LazyQueueHandler(records)
+
+
+_rate_limit_filter = None
+
+
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def _root_has_no_handlers(record: logging.LogRecord) -> bool:
+    return not logging.getLogger().handlers
+
+
 def configure_logging():
     """
     Configure logging.
 
     The log level can be set by setting the environment variable PY_TWELVE_LABS_LOG_LEVEL.
+
+    Logging is configured once per process, and only the py_twelvelabs logger is configured. The root logger, the
+    __main__ logger and the handlers of the application are left untouched. A console handler is only added to the
+    py_twelvelabs logger if no handler would otherwise receive its records, and it stops writing once the application
+    configures the root logger, so that records are not written twice.
+
+    The console handler writes colored text, or JSON records if settings.LOG_FORMAT is "json", and writes them from a
+    background thread if settings.LOG_QUEUE_ENABLED is set. If settings.LOG_RATE_LIMIT_INTERVAL is set, repetitive
+    messages below the WARNING level, such as task polling messages, are rate-limited on the loggers of the package.
     """
 
-    log_level = os.environ.get("PY_TWELVE_LABS_LOG_LEVEL", None)
-    if log_level is not None:
-        log_level = getattr(logging, log_level)
-    else:
-        log_level = logging.INFO
-
-    logging_config = dict(
-        version=1,
-        formatters={"f": {"()": ColorFormatter}},
-        handlers={
-            "console": {
-                "class": "logging.StreamHandler",
-                "formatter": "f",
-            }
-        },
-        loggers={
-            "": {
-                "handlers": ["console"],
-                "level": logging.WARNING,
-            },
-            "__main__": {
-                "level": log_level,
-            }
-        },
-    )
-    dictConfig(logging_config)
+    global _configured
+    if _configured:
+        return
+
+    with _configure_lock:
+        if _configured:
+            return
+
+        package_logger = logging.getLogger("py_twelvelabs")
+        log_level = os.environ.get("PY_TWELVE_LABS_LOG_LEVEL", None)
+        if log_level is not None:
+            package_logger.setLevel(getattr(logging, log_level))
+
+        if not package_logger.hasHandlers():
+            handler = logging.StreamHandler()
+            handler.setFormatter(JsonFormatter() if settings.LOG_FORMAT == "json" else ColorFormatter())
+            if settings.LOG_QUEUE_ENABLED:
+                handler = create_queue_handler(handler)
+            handler.addFilter(_root_has_no_handlers)
+            package_logger.addHandler(handler)
+
+        global _rate_limit_filter
+        if settings.LOG_RATE_LIMIT_INTERVAL > 0:
+            _rate_limit_filter = RateLimitFilter(settings.LOG_RATE_LIMIT_INTERVAL)
+        _configured = True
 
 
 def get_logger(name=None):
@@ -73,4 +214,7 @@ def get_logger(name=None):
     """
     configure_logging()
 
-    return logging.getLogger(name)
+    logger = logging.getLogger(name)
+    if _rate_limit_filter is not None and name is not None and name.startswith("py_twelvelabs") and _rate_limit_filter not in logger.filters:
+        logger.addFilter(_rate_limit_filter)
+    return logger
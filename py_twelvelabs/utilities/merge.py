@@ -0,0 +1,33 @@
+import heapq
+from typing import Any, List, Callable, AsyncIterator
+
+
+async def amerge(iterators: List[AsyncIterator], key: Callable[[Any], Any]) -> AsyncIterator:
+    """
+    Merge asynchronous iterators that are each sorted by a key into a single sorted iterator, like heapq.merge.
+
+    Only the head of every iterator is held in a heap, so an iterator is only advanced when its head has been yielded.
+
+    :param iterators: Sorted asynchronous iterators.
+    :param key: Function returning the sort key of an item.
+    :return: Merged asynchronous iterator.
+    """
+
+    heap = []
+    for position, iterator in enumerate(iterators):
+        try:
+            item = await iterator.__anext__()
+        except StopAsyncIteration:
+            continue
+        heap.append((key(item), position, item))
+    heapq.heapify(heap)
+
+    while heap:
+        _, position, item = heap[0]
+        yield item
+        try:
+            item = await iterators[position].__anext__()
+        except StopAsyncIteration:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (key(item), position, item))
@@ -0,0 +1,436 @@
+import time
+import bisect
+import weakref
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Text, Dict, List, Tuple, Callable, Iterator, Optional
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.logger import get_logger
+from py_twelvelabs.utilities.endpoints import get_endpoint_route
+from py_twelvelabs.exceptions import MissingDependencyError
+
+
+_current_phases: ContextVar[Optional[Dict[Text, float]]] = ContextVar("current_phases", default=None)
+
+
+class MetricEvent:
+    """
+    Timing of one step of an API call: a request attempt, the decoding of a response body or the parsing of a model.
+
+    Request events break their duration down into phases: the wait for the rate limiter (queue), the TCP connection
+    including DNS resolution (connect), the TLS handshake (tls), the wait for the response headers (ttfb) and the body
+    download (download). Connection phases are only present when a new connection was opened.
+    """
+
+    __slots__ = ("name", "endpoint", "method", "status_code", "duration", "phases", "attempt", "error", "started_at")
+
+    def __init__(self, name: Text, endpoint: Text, method: Text, duration: float, status_code: int = None, phases: Dict[Text, float] = None, attempt: int = 1, error: BaseException = None, started_at: int = None):
+        """
+        Initialize the event.
+
+        :param name: Step name: "request", "decode" or "parse".
+        :param endpoint: Endpoint route, e.g. "tasks/{id}".
+        :param method: HTTP method.
+        :param duration: Duration in seconds.
+        :param status_code: Response status code, or None if the request failed without a response.
+        :param phases: Duration of each phase of a request in seconds.
+        :param attempt: Attempt number of a retried request.
+        :param error: Exception raised by a request that failed without a response.
+        :param started_at: Wall clock time at which the step started, in nanoseconds since the epoch.
+        """
+
+        self.name = name
+        self.endpoint = endpoint
+        self.method = method
+        self.duration = duration
+        self.status_code = status_code
+        self.phases = phases or {}
+        self.attempt = attempt
+        self.error = error
+        self.started_at = started_at if started_at is not None else time.time_ns() - int(duration * 1e9)
+
+    @property
+    def status(self) -> Text:
+        """
+        Status tag of the event: the status code of a request, "error" for a request that failed without a response, and
+        an empty string for other steps.
+        """
+
+        if self.name != "request":
+            return ""
+        return str(self.status_code) if self.status_code is not None else "error"
+
+    def __repr__(self) -> Text:
+        return f"MetricEvent({self.name} {self.method} {self.endpoint} {self.status or '-'} {self.duration * 1e3:.2f} ms)"
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets: List[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile by linear interpolation within the bucket that contains it, as Prometheus does.
+        """
+
+        rank = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                if i == len(self.buckets):
+                    return self.max
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                return min(lower + (self.buckets[i] - lower) * (rank - cumulative) / count, self.max)
+            cumulative += count
+        return 0.0
+
+
+class RequestTimer:
+    """
+    Times the phases of a single request attempt and emits its event when finished.
+    """
+
+    __slots__ = ("metrics", "endpoint", "method", "attempt", "phases", "_started_at", "_marked_at", "_started_at_ns", "_trace_started_at", "_token")
+
+    def __init__(self, metrics: "Metrics", endpoint: Text, method: Text, attempt: int):
+        self.metrics = metrics
+        self.endpoint = endpoint
+        self.method = method
+        self.attempt = attempt
+        self.phases: Dict[Text, float] = {}
+        self._started_at = self._marked_at = time.perf_counter()
+        self._started_at_ns = time.time_ns()
+        self._trace_started_at: Dict[Text, float] = {}
+        self._token = _current_phases.set(self.phases)
+
+    def mark(self, phase: Text):
+        """
+        Record the time elapsed since the previous mark as a phase.
+
+        :param phase: Phase name.
+        """
+
+        now = time.perf_counter()
+        self.phases[phase] = now - self._marked_at
+        self._marked_at = now
+
+    def mark_response(self, elapsed: float = None):
+        """
+        Record the phases of a response received since the previous mark.
+
+        :param elapsed: Seconds from sending the request to receiving the response headers, including any new connection.
+        When given, the rest of the time is recorded as the download, unless the trace already recorded it.
+        """
+
+        now = time.perf_counter()
+        if elapsed is not None and "ttfb" not in self.phases:
+            self.phases['ttfb'] = max(0.0, elapsed - self.phases.get("connect", 0.0) - self.phases.get("tls", 0.0))
+            self.phases['download'] = max(0.0, now - self._marked_at - elapsed)
+        self._marked_at = now
+
+    async def trace(self, event_name: Text, info: Dict):
+        """
+        Record connection and response phases from the trace events of an httpx request.
+
+        :param event_name: Trace event name, e.g. "connection.connect_tcp.started".
+        :param info: Trace event information.
+        """
+
+        step, _, state = event_name.rpartition(".")
+        now = time.perf_counter()
+        if state == "started":
+            self._trace_started_at[step.rpartition(".")[2]] = now
+            return
+        if state != "complete":
+            return
+
+        step = step.rpartition(".")[2]
+        phase = {"connect_tcp": "connect", "start_tls": "tls", "receive_response_body": "download"}.get(step)
+        if phase is not None and step in self._trace_started_at:
+            self.phases[phase] = now - self._trace_started_at[step]
+        elif step == "receive_response_headers" and "send_request_headers" in self._trace_started_at:
+            self.phases['ttfb'] = now - self._trace_started_at['send_request_headers']
+
+    def finish(self, status_code: int = None, error: BaseException = None):
+        """
+        Emit the event of the request.
+
+        :param status_code: Response status code.
+        :param error: Exception raised by a request that failed without a response.
+        """
+
+        _current_phases.reset(self._token)
+        self.metrics.emit(MetricEvent("request", self.endpoint, self.method, time.perf_counter() - self._started_at, status_code, self.phases, self.attempt, error, self._started_at_ns))
+
+
+class Metrics:
+    """
+    Instrumentation of the client's API calls.
+
+    Every request attempt, response body decoding and model parsing is emitted as a MetricEvent tagged with the endpoint
+    route, the method and the status code. Events are passed to the registered hooks and aggregated in memory into
+    Prometheus-style request counters and duration histograms, which can be read with get_stats or exported in the
+    Prometheus text format with render.
+    """
+
+    def __init__(self, hooks: List[Callable[[MetricEvent], None]] = None, buckets: List[float] = None, enabled: bool = True):
+        """
+        Initialize the metrics.
+
+        :param hooks: Functions called with every event.
+        :param buckets: Upper bounds of the histogram buckets in seconds. Defaults to settings.METRICS_BUCKETS.
+        :param enabled: Whether events are recorded and passed to hooks.
+        """
+
+        self.hooks = list(hooks or [])
+        self.buckets = sorted(buckets if buckets is not None else settings.METRICS_BUCKETS)
+        self.enabled = enabled
+        self.logger = get_logger(__name__)
+
+        self._counters: Dict[Tuple, int] = {}
+        self._histograms: Dict[Tuple, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[MetricEvent], None]):
+        """
+        Register a function to be called with every event.
+
+        :param hook: Function called with the event.
+        """
+
+        self.hooks.append(hook)
+
+    def start_request(self, endpoint: Text, method: Text, attempt: int = 1) -> RequestTimer:
+        """
+        Start timing a request attempt.
+
+        :param endpoint: API endpoint.
+        :param method: HTTP method.
+        :param attempt: Attempt number.
+        :return: Request timer.
+        """
+
+        return RequestTimer(self, get_endpoint_route(endpoint), method, attempt)
+
+    @contextmanager
+    def time(self, name: Text, endpoint: Text, method: Text = "GET") -> Iterator[None]:
+        """
+        Time a block of code as a step of an API call.
+
+        :param name: Step name, e.g. "parse".
+        :param endpoint: API endpoint.
+        :param method: HTTP method.
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.emit(MetricEvent(name, get_endpoint_route(endpoint), method, time.perf_counter() - started_at))
+
+    def instrument_response(self, response, endpoint: Text, method: Text):
+        """
+        Time the decoding of a response's JSON body when it is requested.
+
+        :param response: Response whose json method is wrapped.
+        :param endpoint: API endpoint.
+        :param method: HTTP method.
+        """
+
+        if not self.enabled:
+            return
+
+        decode = type(response).json
+        response_ref = weakref.ref(response)
+
+        def json(**kwargs):
+            with self.time("decode", endpoint, method):
+                return decode(response_ref(), **kwargs)
+
+        # The wrapper refers to the response weakly, so that the response is not kept in a reference cycle and its
+        # connection is released as soon as it is no longer used.
+        response.json = json
+
+    def emit(self, event: MetricEvent):
+        """
+        Record an event and pass it to the hooks. Exceptions raised by hooks are logged and ignored.
+
+        :param event: Event.
+        """
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if event.name == "request":
+                key = (event.endpoint, event.method, event.status)
+                self._counters[key] = self._counters.get(key, 0) + 1
+            for phase, duration in [("total", event.duration), *event.phases.items()]:
+                key = (event.name, event.endpoint, event.method, event.status, phase)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = _Histogram(self.buckets)
+                histogram.observe(duration)
+
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                self.logger.warning("Metrics hook %r failed: %r", hook, e)
+
+    def get_stats(self) -> Dict[Tuple[Text, Text, Text, Text, Text], Dict[Text, float]]:
+        """
+        Get the aggregated durations.
+
+        :return: Count, sum, maximum and estimated 50th and 99th percentiles of the durations, keyed by step name,
+        endpoint route, method, status and phase. The status is only set for requests, and the phase of the whole step is
+        "total".
+        """
+
+        with self._lock:
+            return {key: {"count": histogram.count, "sum": histogram.sum, "max": histogram.max, "p50": histogram.quantile(0.5), "p99": histogram.quantile(0.99)} for key, histogram in self._histograms.items()}
+
+    def render(self) -> Text:
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        :return: Metrics text.
+        """
+
+        lines = ["# TYPE twelvelabs_requests_total counter"]
+        with self._lock:
+            for (endpoint, method, status), count in sorted(self._counters.items()):
+                lines.append(f'twelvelabs_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}')
+
+            for name in sorted({key[0] for key in self._histograms}):
+                metric = f"twelvelabs_{name}_duration_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                for (_, endpoint, method, status, phase), histogram in sorted(item for item in self._histograms.items() if item[0][0] == name):
+                    labels = f'endpoint="{endpoint}",method="{method}",' + (f'status="{status}",' if status else "") + f'phase="{phase}"'
+                    cumulative = 0
+                    for bound, count in zip([*self.buckets, "+Inf"], histogram.counts):
+                        cumulative += count
+                        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f"{metric}_sum{{{labels}}} {histogram.sum}")
+                    lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        """
+        Reset the aggregated metrics.
+        """
+
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+class OpenTelemetryHook:
+    """
+    Metrics hook that reports every event as an OpenTelemetry span, with its phases as attributes.
+
+    Spans are created in the current trace context, so API calls show up under the caller's spans. It requires the
+    opentelemetry-api package, available through the `otel` extra.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        Initialize the hook.
+
+        :param tracer: OpenTelemetry tracer. Defaults to the tracer of the global tracer provider.
+        """
+
+        if trace is None:
+            raise MissingDependencyError("The OpenTelemetry hook requires the opentelemetry-api package. Install it with `pip install py_twelvelabs[otel]`.")
+        self.tracer = tracer if tracer is not None else trace.get_tracer("py_twelvelabs")
+
+    def __call__(self, event: MetricEvent):
+        attributes = {
+            "http.request.method": event.method,
+            "twelvelabs.endpoint": event.endpoint,
+            "twelvelabs.attempt": event.attempt,
+            **{f"twelvelabs.phase.{phase}": duration for phase, duration in event.phases.items()},
+        }
+        if event.status_code is not None:
+            attributes['http.response.status_code'] = event.status_code
+
+        span = self.tracer.start_span(f"twelvelabs.{event.name} {event.method} {event.endpoint}", start_time=event.started_at, attributes=attributes)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        span.end(end_time=event.started_at + int(event.duration * 1e9))
+
+
+def _record_phase(phase: Text, started_at: float):
+    phases = _current_phases.get()
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0.0) + time.perf_counter() - started_at
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def _new_conn(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _record_phase("connect", started_at)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def _new_conn(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            _record_phase("connect", started_at)
+
+    def connect(self):
+        started_at = time.perf_counter()
+        phases = _current_phases.get()
+        connect = phases.get("connect", 0.0) if phases is not None else 0.0
+        try:
+            super().connect()
+        finally:
+            if phases is not None:
+                phases['tls'] = max(0.0, time.perf_counter() - started_at - (phases.get("connect", 0.0) - connect))
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """
+    Connection pool whose new connections record their connect time in the phases of the current request.
+    """
+
+    ConnectionCls = _TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """
+    Connection pool whose new connections record their connect and TLS handshake times in the phases of the current request.
+    """
+
+    ConnectionCls = _TimedHTTPSConnection
@@ -0,0 +1,114 @@
+import asyncio
+from collections import deque
+from contextvars import copy_context
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Callable, Iterator, Awaitable, AsyncIterator, Optional
+
+
+def _should_fetch(result: Dict, page: int, page_limit: int, last_page: Optional[int]) -> bool:
+    """
+    Whether a page should be requested, given the latest page received.
+
+    :param result: Latest page received.
+    :param page: Page number.
+    :param page_limit: Number of items per page.
+    :param last_page: Last page needed, or None if all pages are needed.
+    :return: True if the page may exist and is needed.
+    """
+
+    if len(result['data']) < page_limit or (last_page is not None and page > last_page):
+        return False
+    total_pages = result['page_info'].get('total_page')
+    return total_pages is None or page <= total_pages
+
+
+def iter_items(get_page: Callable[[Dict], Dict], params: Dict, max_items: Optional[int] = None, prefetch: int = 0) -> Iterator[Dict]:
+    """
+    Lazily yield the items of a paginated listing, page by page.
+
+    The first page is fetched to learn the total number of pages, after which up to prefetch of the following pages are
+    fetched concurrently in the background while the caller consumes the current one.
+
+    :param get_page: Function returning the response of a listing request for the given parameters.
+    :param params: Listing parameters, including page_limit.
+    :param max_items: Maximum number of items to yield. No more pages than needed for it are requested.
+    :param prefetch: Number of pages to fetch ahead of the caller.
+    :return: Iterator of items.
+    """
+
+    page_limit = params['page_limit']
+    last_page = -(-max_items // page_limit) if max_items is not None else None
+    count = 0
+
+    result = get_page({**params, "page": 1})
+    next_page = 2
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=prefetch) if prefetch > 0 else None
+    try:
+        while True:
+            if executor is not None:
+                while len(pending) < prefetch and _should_fetch(result, next_page, page_limit, last_page):
+                    pending.append(executor.submit(copy_context().run, get_page, {**params, "page": next_page}))
+                    next_page += 1
+
+            for item in result['data']:
+                if max_items is not None and count >= max_items:
+                    return
+                yield item
+                count += 1
+
+            if pending:
+                result = pending.popleft().result()
+            elif executor is None and _should_fetch(result, next_page, page_limit, last_page):
+                result = get_page({**params, "page": next_page})
+                next_page += 1
+            else:
+                return
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_items(get_page: Callable[[Dict], Awaitable[Dict]], params: Dict, max_items: Optional[int] = None, prefetch: int = 0) -> AsyncIterator[Dict]:
+    """
+    Lazily yield the items of a paginated listing, page by page, fetching up to prefetch pages ahead as concurrent tasks.
+
+    :param get_page: Coroutine function returning the response of a listing request for the given parameters.
+    :param params: Listing parameters, including page_limit.
+    :param max_items: Maximum number of items to yield. No more pages than needed for it are requested.
+    :param prefetch: Number of pages to fetch ahead of the caller.
+    :return: Asynchronous iterator of items.
+    """
+
+    page_limit = params['page_limit']
+    last_page = -(-max_items // page_limit) if max_items is not None else None
+    count = 0
+
+    result = await get_page({**params, "page": 1})
+    next_page = 2
+    pending = deque()
+    try:
+        while True:
+            if prefetch > 0:
+                while len(pending) < prefetch and _should_fetch(result, next_page, page_limit, last_page):
+                    pending.append(asyncio.ensure_future(get_page({**params, "page": next_page})))
+                    next_page += 1
+
+            for item in result['data']:
+                if max_items is not None and count >= max_items:
+                    return
+                yield item
+                count += 1
+
+            if pending:
+                result = await pending.popleft()
+            elif prefetch <= 0 and _should_fetch(result, next_page, page_limit, last_page):
+                result = await get_page({**params, "page": next_page})
+                next_page += 1
+            else:
+                return
+    finally:
+        for task in pending:
+            task.cancel()
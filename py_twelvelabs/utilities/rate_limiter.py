@@ -0,0 +1,189 @@
+import os
+import json
+import time
+import asyncio
+import hashlib
+import tempfile
+import threading
+from typing import Text, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.deadline import get_deadline
+from py_twelvelabs.utilities.endpoints import get_endpoint_class
+from py_twelvelabs.exceptions import MissingDependencyError
+
+
+class TokenBucket:
+    """
+    Token bucket shared by the threads and coroutines of one process.
+
+    Every request reserves a token, letting the balance go negative when the bucket is empty. The caller then waits for
+    the time it takes to refill the deficit, so concurrent callers are spaced out in the order they arrived.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the token bucket.
+
+        :param rate: Tokens added per second.
+        :param capacity: Maximum number of tokens, i.e. the largest burst allowed.
+        """
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve a token.
+
+        :return: Number of seconds to wait before the token may be used.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate) - 1
+            self._updated_at = now
+            return max(0.0, -self._tokens / self.rate)
+
+
+class FileTokenBucket:
+    """
+    Token bucket whose state is kept in a file, shared by all processes on a host that use the same path.
+
+    Updates are serialized with an exclusive file lock, so the bucket is only available on platforms with fcntl.
+    """
+
+    def __init__(self, path: Text, rate: float, capacity: float):
+        """
+        Initialize the token bucket.
+
+        :param path: Path of the state file.
+        :param rate: Tokens added per second.
+        :param capacity: Maximum number of tokens, i.e. the largest burst allowed.
+        """
+
+        if fcntl is None:
+            raise MissingDependencyError("The file rate limit backend requires fcntl, which is not available on this platform.")
+
+        self.path = path
+        self.rate = rate
+        self.capacity = capacity
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserve a token.
+
+        :return: Number of seconds to wait before the token may be used.
+        """
+
+        with self._lock, open(self.path, "a+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                content = file.read()
+                now = time.time()
+                state = json.loads(content) if content else {"tokens": self.capacity, "updated_at": now}
+
+                tokens = min(self.capacity, state["tokens"] + max(0.0, now - state["updated_at"]) * self.rate) - 1
+
+                file.seek(0)
+                file.truncate()
+                json.dump({"tokens": tokens, "updated_at": now}, file)
+                file.flush()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+        return max(0.0, -tokens / self.rate)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with one token bucket per endpoint class (e.g. search, tasks, indexes).
+
+    Endpoint classes without a configured rate are not limited.
+    """
+
+    def __init__(self, rates: Dict[Text, float] = None, burst: float = None, backend: Text = None, directory: Text = None, namespace: Text = ""):
+        """
+        Initialize the rate limiter. Arguments default to the corresponding RATE_LIMIT_* settings.
+
+        :param rates: Requests per second allowed per endpoint class.
+        :param burst: Number of seconds worth of requests that may be sent in a burst. Must allow at least one request.
+        :param backend: "memory" to limit the current process, or "file" to share the limit between processes on this host.
+        :param directory: Directory of the state files of the file backend. Defaults to a directory in the system temporary directory.
+        :param namespace: Name that separates the buckets of different API keys in the file backend.
+        """
+
+        self.rates = rates if rates is not None else settings.RATE_LIMITS
+        self.burst = burst if burst is not None else settings.RATE_LIMIT_BURST
+        self.backend = backend or settings.RATE_LIMIT_BACKEND
+        self.directory = directory or settings.RATE_LIMIT_DIRECTORY or os.path.join(tempfile.gettempdir(), "py_twelvelabs_rate_limits")
+        self.namespace = hashlib.sha256(namespace.encode()).hexdigest()[:16]
+
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, endpoint_class: Text) -> Optional[object]:
+        rate = self.rates.get(endpoint_class)
+        if not rate:
+            return None
+
+        with self._lock:
+            bucket = self._buckets.get(endpoint_class)
+            if bucket is None:
+                capacity = max(1.0, rate * self.burst)
+                if self.backend == "file":
+                    os.makedirs(self.directory, exist_ok=True)
+                    bucket = FileTokenBucket(os.path.join(self.directory, f"{self.namespace}-{endpoint_class}.json"), rate, capacity)
+                else:
+                    bucket = TokenBucket(rate, capacity)
+                self._buckets[endpoint_class] = bucket
+            return bucket
+
+    def reserve(self, endpoint: Text) -> float:
+        """
+        Reserve a request to an endpoint.
+
+        :param endpoint: API endpoint.
+        :return: Number of seconds to wait before sending the request.
+        """
+
+        bucket = self._get_bucket(get_endpoint_class(endpoint))
+        if bucket is None:
+            return 0.0
+        return bucket.reserve()
+
+    def acquire(self, endpoint: Text):
+        """
+        Block until a request to an endpoint may be sent, or until the deadline of the current call.
+
+        :param endpoint: API endpoint.
+        """
+
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            get_deadline().sleep(wait)
+
+    async def acquire_async(self, endpoint: Text):
+        """
+        Wait without blocking the event loop until a request to an endpoint may be sent, or until the deadline of the current call.
+
+        :param endpoint: API endpoint.
+        """
+
+        if self.backend == "file":
+            # The file backend locks its state file, which blocks while another process holds the lock.
+            wait = await asyncio.get_running_loop().run_in_executor(None, self.reserve, endpoint)
+        else:
+            wait = self.reserve(endpoint)
+        if wait > 0:
+            await get_deadline().sleep_async(wait)
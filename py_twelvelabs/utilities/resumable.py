@@ -0,0 +1,158 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Text, Dict, List, Tuple, Union, Callable, Optional
+
+import requests
+
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.logger import get_logger
+from py_twelvelabs.exceptions import ResumableUploadError
+
+
+class ResumableUpload:
+    """
+    Uploads a file in parts and records every part that was sent successfully in a local state file.
+
+    Each part is sent as a PUT request with a Content-Range header, either to a single upload URL or to a URL per part
+    (e.g. pre-signed part URLs of an object store). Parts that fail are retried on their own, and an upload interrupted
+    by a process restart resumes from the state file, so only the parts that were never acknowledged are sent again.
+    """
+
+    def __init__(self, video_file: Text, upload_url: Union[Text, Callable[[int], Text]], state_file: Text = None, part_size: int = None, max_retries: int = None, max_workers: int = None, headers: Dict = None, session: requests.Session = None, timeout: Tuple[Optional[float], Optional[float]] = None):
+        """
+        Initialize the upload.
+
+        :param video_file: Path to the file to upload.
+        :param upload_url: URL that receives every part, or a function returning the URL for a part number (starting at 1).
+        :param state_file: Path of the state file. Defaults to the video file path with an .upload.json suffix.
+        :param part_size: Size of each part in bytes. Defaults to settings.RESUMABLE_UPLOAD_PART_SIZE.
+        :param max_retries: Number of times a failed part is retried. Defaults to settings.RESUMABLE_UPLOAD_MAX_RETRIES.
+        :param max_workers: Number of parts sent concurrently. Defaults to settings.RESUMABLE_UPLOAD_MAX_WORKERS.
+        :param headers: Extra headers sent with every part.
+        :param session: HTTP session to send the parts with.
+        :param timeout: Connect and read timeouts of every part request in seconds.
+        """
+
+        self.video_file = video_file
+        self.upload_url = upload_url
+        self.state_file = state_file or f"{video_file}.upload.json"
+        self.part_size = part_size or settings.RESUMABLE_UPLOAD_PART_SIZE
+        self.max_retries = max_retries if max_retries is not None else settings.RESUMABLE_UPLOAD_MAX_RETRIES
+        self.max_workers = max_workers or settings.RESUMABLE_UPLOAD_MAX_WORKERS
+        self.headers = headers or {}
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.logger = get_logger(__name__)
+
+        self._state_lock = threading.Lock()
+        self._state = None
+
+    @property
+    def part_count(self) -> int:
+        size = os.path.getsize(self.video_file)
+        return max(1, -(-size // self.part_size))
+
+    def _get_part_url(self, part_number: int) -> Text:
+        if callable(self.upload_url):
+            return self.upload_url(part_number)
+        return self.upload_url
+
+    def _get_file_signature(self) -> Dict:
+        stat = os.stat(self.video_file)
+        return {"video_file": os.path.abspath(self.video_file), "size": stat.st_size, "mtime": stat.st_mtime, "part_size": self.part_size}
+
+    def _load_state(self) -> Dict:
+        """
+        Load the upload state, discarding it if the file has changed since it was written.
+
+        :return: Upload state.
+        """
+
+        signature = self._get_file_signature()
+        if os.path.exists(self.state_file):
+            with open(self.state_file) as file:
+                state = json.load(file)
+            if all(state.get(key) == value for key, value in signature.items()):
+                self.logger.info("Resuming upload of %s: %d parts already sent.", self.video_file, len(state['completed_parts']))
+                return state
+            self.logger.warning("Discarding upload state %s because %s has changed.", self.state_file, self.video_file)
+
+        return {**signature, "completed_parts": {}}
+
+    def _save_state(self):
+        temporary_file = f"{self.state_file}.tmp"
+        with open(temporary_file, "w") as file:
+            json.dump(self._state, file)
+        os.replace(temporary_file, self.state_file)
+
+    def _upload_part(self, part_number: int):
+        """
+        Send a single part and record it in the state file.
+
+        :param part_number: Part number, starting at 1.
+        """
+
+        size = self._state['size']
+        start = (part_number - 1) * self.part_size
+        end = min(start + self.part_size, size) - 1
+
+        with open(self.video_file, "rb") as file:
+            file.seek(start)
+            body = file.read(end - start + 1)
+
+        headers = {**self.headers, "Content-Range": f"bytes {start}-{end}/{size}" if size else "bytes */0"}
+        response = self.session.put(self._get_part_url(part_number), data=body, headers=headers, timeout=self.timeout)
+        if response.status_code >= 300:
+            raise ResumableUploadError(f"Failed to upload part {part_number} of {self.video_file}: HTTP {response.status_code}.")
+
+        with self._state_lock:
+            self._state['completed_parts'][str(part_number)] = response.headers.get("ETag")
+            self._save_state()
+
+    def get_pending_parts(self) -> List[int]:
+        """
+        Get the parts that have not been sent successfully yet.
+
+        :return: Part numbers.
+        """
+
+        if self._state is None:
+            self._state = self._load_state()
+        return [part_number for part_number in range(1, self.part_count + 1) if str(part_number) not in self._state['completed_parts']]
+
+    def upload(self) -> List[Dict]:
+        """
+        Send every pending part, retrying failed parts individually with exponential backoff.
+
+        The state file is removed once all parts have been sent.
+
+        :return: Part numbers and ETags of all parts, in order.
+        """
+
+        self._state = self._load_state()
+        pending_parts = self.get_pending_parts()
+
+        for attempt in range(self.max_retries + 1):
+            if not pending_parts:
+                break
+            if attempt > 0:
+                self.logger.info("Retrying %d failed parts of %s (attempt %d).", len(pending_parts), self.video_file, attempt)
+                time.sleep(min(settings.RESUMABLE_UPLOAD_BACKOFF_FACTOR * 2 ** (attempt - 1), 30))
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {part_number: executor.submit(self._upload_part, part_number) for part_number in pending_parts}
+
+            failures = {part_number: future.exception() for part_number, future in futures.items() if future.exception() is not None}
+            for part_number, error in failures.items():
+                self.logger.warning("Failed to upload part %d of %s: %s", part_number, self.video_file, error)
+            pending_parts = sorted(failures)
+
+        if pending_parts:
+            raise ResumableUploadError(f"Failed to upload parts {pending_parts} of {self.video_file}. Run the upload again to resume.")
+
+        parts = [{"part_number": int(part_number), "etag": etag} for part_number, etag in sorted(self._state['completed_parts'].items(), key=lambda item: int(item[0]))]
+        os.remove(self.state_file)
+        return parts
@@ -0,0 +1,132 @@
+import time
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Text, Dict, List, Optional
+
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.endpoints import get_endpoint_class
+
+
+IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Only idempotent methods and POSTs to endpoints known to be safe (such as search queries) are retried. Waits grow
+    exponentially with full jitter, a Retry-After header sent by the server takes precedence, and no retry is started
+    once the maximum elapsed time would be exceeded.
+    """
+
+    def __init__(self, max_retries: int = None, backoff_factor: float = None, max_backoff: float = None, max_elapsed_time: float = None, status_codes: List[int] = None, safe_post_endpoints: List[Text] = None, endpoint_overrides: Dict[Text, Dict] = None):
+        """
+        Initialize the retry policy. Arguments default to the corresponding RETRY_* settings.
+
+        :param max_retries: Maximum number of retries after the first attempt.
+        :param backoff_factor: Base wait in seconds, doubled on every retry.
+        :param max_backoff: Maximum wait in seconds between two attempts.
+        :param max_elapsed_time: Maximum number of seconds from the first attempt after which no retry is started.
+        :param status_codes: Response status codes that are retried.
+        :param safe_post_endpoints: Endpoint classes whose POST requests can safely be retried.
+        :param endpoint_overrides: Arguments of this constructor to override per endpoint class, e.g. {"search": {"max_retries": 5}}.
+        """
+
+        self.max_retries = max_retries if max_retries is not None else settings.RETRY_MAX_RETRIES
+        self.backoff_factor = backoff_factor if backoff_factor is not None else settings.RETRY_BACKOFF_FACTOR
+        self.max_backoff = max_backoff if max_backoff is not None else settings.RETRY_MAX_BACKOFF
+        self.max_elapsed_time = max_elapsed_time if max_elapsed_time is not None else settings.RETRY_MAX_ELAPSED_TIME
+        self.status_codes = status_codes if status_codes is not None else settings.RETRY_STATUS_CODES
+        self.safe_post_endpoints = safe_post_endpoints if safe_post_endpoints is not None else settings.RETRY_SAFE_POST_ENDPOINTS
+        self.endpoint_overrides = endpoint_overrides if endpoint_overrides is not None else settings.RETRY_ENDPOINT_OVERRIDES
+
+    def for_endpoint(self, endpoint: Text) -> "RetryPolicy":
+        """
+        Get the policy that applies to an endpoint, taking per-endpoint overrides into account.
+
+        :param endpoint: API endpoint.
+        :return: Retry policy.
+        """
+
+        overrides = self.endpoint_overrides.get(get_endpoint_class(endpoint))
+        if not overrides:
+            return self
+
+        arguments = {
+            "max_retries": self.max_retries,
+            "backoff_factor": self.backoff_factor,
+            "max_backoff": self.max_backoff,
+            "max_elapsed_time": self.max_elapsed_time,
+            "status_codes": self.status_codes,
+            "safe_post_endpoints": self.safe_post_endpoints,
+            "endpoint_overrides": {},
+        }
+        arguments.update(overrides)
+        return RetryPolicy(**arguments)
+
+    def is_retryable_request(self, method: Text, endpoint: Text) -> bool:
+        """
+        Whether a request can be sent more than once without side effects.
+
+        :param method: HTTP method.
+        :param endpoint: API endpoint.
+        :return: True if the request can be retried.
+        """
+
+        if method in IDEMPOTENT_METHODS:
+            return True
+        return method == "POST" and get_endpoint_class(endpoint) in self.safe_post_endpoints
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.status_codes
+
+    def get_backoff(self, retry_number: int, retry_after: Optional[Text] = None) -> float:
+        """
+        Get the number of seconds to wait before a retry.
+
+        :param retry_number: Number of the upcoming retry, starting at 1.
+        :param retry_after: Value of the Retry-After response header, in seconds or as an HTTP date.
+        :return: Wait in seconds. A Retry-After wait is returned as is, even beyond max_backoff, so that can_retry rejects it rather than retrying early.
+        """
+
+        retry_after_seconds = self.parse_retry_after(retry_after)
+        if retry_after_seconds is not None:
+            return retry_after_seconds
+
+        return random.uniform(0, min(self.backoff_factor * 2 ** (retry_number - 1), self.max_backoff))
+
+    def can_retry(self, retry_number: int, started_at: float, backoff: float) -> bool:
+        """
+        Whether another retry is allowed.
+
+        :param retry_number: Number of the upcoming retry, starting at 1.
+        :param started_at: Monotonic time of the first attempt.
+        :param backoff: Wait before the upcoming retry.
+        :return: True if the retry is allowed, i.e. retries are left and the wait fits within max_backoff and the remaining max_elapsed_time.
+        """
+
+        return retry_number <= self.max_retries and backoff <= self.max_backoff and time.monotonic() + backoff - started_at <= self.max_elapsed_time
+
+    @staticmethod
+    def parse_retry_after(retry_after: Optional[Text]) -> Optional[float]:
+        """
+        Parse a Retry-After header.
+
+        :param retry_after: Header value, in seconds or as an HTTP date.
+        :return: Wait in seconds, or None if the header is missing or invalid.
+        """
+
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
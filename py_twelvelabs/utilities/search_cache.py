@@ -0,0 +1,223 @@
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Text, Dict, Tuple, Optional
+
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.cache import TTLCache
+
+
+class MemorySearchCacheBackend:
+    """
+    Search cache backend that keeps results in an in-process LRU cache.
+    """
+
+    def __init__(self, ttl: float, maxsize: int):
+        self._cache = TTLCache(maxsize, ttl)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get(self, index_id: Text, digest: Text) -> Optional[Tuple[float, Dict]]:
+        return self._cache.get((index_id, digest))
+
+    def set(self, index_id: Text, digest: Text, result: Dict):
+        self._cache.set((index_id, digest), (time.time(), result))
+
+    def invalidate(self, index_id: Text):
+        self._cache.delete_where(lambda key: key[0] == index_id)
+
+    def clear(self):
+        self._cache.clear()
+
+
+class DiskSearchCacheBackend:
+    """
+    Search cache backend that keeps results as JSON files in a directory, with one sub-directory per index.
+
+    The cache survives process restarts and can be shared by processes on the same host. The least recently used files
+    are removed once there are more than maxsize of them.
+    """
+
+    def __init__(self, ttl: float, maxsize: int, directory: Text):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._list_files())
+
+    def _get_index_directory(self, index_id: Text) -> Text:
+        return os.path.join(self.directory, re.sub(r"[^\w-]", "_", index_id))
+
+    def _list_files(self):
+        if not os.path.isdir(self.directory):
+            return []
+        return [entry for index_directory in os.scandir(self.directory) if index_directory.is_dir() for entry in os.scandir(index_directory.path) if entry.name.endswith(".json")]
+
+    def get(self, index_id: Text, digest: Text) -> Optional[Tuple[float, Dict]]:
+        path = os.path.join(self._get_index_directory(index_id), f"{digest}.json")
+        try:
+            with open(path) as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() >= entry['expires_at']:
+            self._remove(path)
+            return None
+
+        os.utime(path)
+        return entry.get('written_at', 0.0), entry['value']
+
+    def set(self, index_id: Text, digest: Text, result: Dict):
+        index_directory = self._get_index_directory(index_id)
+        os.makedirs(index_directory, exist_ok=True)
+
+        file_descriptor, temporary_file = tempfile.mkstemp(dir=index_directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w") as file:
+            now = time.time()
+            json.dump({"written_at": now, "expires_at": now + self.ttl, "value": result}, file)
+        os.replace(temporary_file, os.path.join(index_directory, f"{digest}.json"))
+
+        with self._lock:
+            files = self._list_files()
+            if len(files) > self.maxsize:
+                files.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in files[:len(files) - self.maxsize]:
+                    self._remove(entry.path)
+
+    def invalidate(self, index_id: Text):
+        shutil.rmtree(self._get_index_directory(index_id), ignore_errors=True)
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    @staticmethod
+    def _remove(path: Text):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class SearchCache:
+    """
+    Cache of search results keyed by the index ID and a digest of the canonical form of the search request.
+
+    Requests that only differ in parameter order, the order of the search options, whitespace in the query or omitted
+    optional parameters share an entry. All entries of an index are invalidated when a task watcher or a task
+    notification reports that a task of the index became ready. A ready task seen by getting or listing tasks only
+    invalidates the entries that were cached before the task was last updated, so listing tasks that were ready long ago
+    keeps the cache. Cached results are returned as copies, so callers may modify them.
+    """
+
+    def __init__(self, backend: Text = None, ttl: float = None, maxsize: int = None, directory: Text = None):
+        """
+        Initialize the search cache. Arguments default to the corresponding SEARCH_CACHE_* settings.
+
+        :param backend: "memory" to cache results in this process, or "disk" to cache them in a directory.
+        :param ttl: Number of seconds a result stays fresh.
+        :param maxsize: Maximum number of cached results.
+        :param directory: Directory of the disk backend. Defaults to a directory in the system temporary directory.
+        """
+
+        backend = backend or settings.SEARCH_CACHE_BACKEND
+        ttl = ttl if ttl is not None else settings.SEARCH_CACHE_TTL
+        maxsize = maxsize if maxsize is not None else settings.SEARCH_CACHE_MAXSIZE
+
+        if backend == "disk":
+            directory = directory or settings.SEARCH_CACHE_DIRECTORY or os.path.join(tempfile.gettempdir(), "py_twelvelabs_search_cache")
+            self.backend = DiskSearchCacheBackend(ttl, maxsize, directory)
+        else:
+            self.backend = MemorySearchCacheBackend(ttl, maxsize)
+
+        self.hits = 0
+        self.misses = 0
+
+        self._ready_at: Dict[Text, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, data: Dict) -> Optional[Dict]:
+        """
+        Get the cached result of a search request.
+
+        :param data: Search request body.
+        :return: Search result, or None if it is not cached.
+        """
+
+        index_id, digest = self.get_key(data)
+        entry = self.backend.get(index_id, digest)
+        with self._lock:
+            # Results cached before a task of the index became ready do not include the task's video.
+            if entry is not None and entry[0] < self._ready_at.get(index_id, 0.0):
+                entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry[1] if entry is not None else None
+
+    def set(self, data: Dict, result: Dict):
+        """
+        Cache the result of a search request.
+
+        :param data: Search request body.
+        :param result: Search result.
+        """
+
+        self.backend.set(*self.get_key(data), result)
+
+    def invalidate(self, index_id: Text):
+        """
+        Remove all cached results of an index.
+
+        :param index_id: Index ID.
+        """
+
+        self.backend.invalidate(index_id)
+
+    def observe_ready_task(self, index_id: Text, updated_at: datetime):
+        """
+        Invalidate the results of an index that were cached before one of its tasks became ready.
+
+        :param index_id: Index ID of the ready task.
+        :param updated_at: Time the task was last updated, as a naive UTC datetime.
+        """
+
+        ready_at = updated_at.replace(tzinfo=timezone.utc).timestamp()
+        with self._lock:
+            if ready_at > self._ready_at.get(index_id, 0.0):
+                self._ready_at[index_id] = ready_at
+
+    def clear(self):
+        self.backend.clear()
+
+    def get_stats(self) -> Dict[Text, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.backend)}
+
+    @staticmethod
+    def get_key(data: Dict) -> Tuple[Text, Text]:
+        """
+        Get the cache key of a search request.
+
+        :param data: Search request body.
+        :return: Index ID and digest of the canonical request body.
+        """
+
+        body = {key: value for key, value in data.items() if value is not None}
+        if isinstance(body.get('query'), str):
+            body['query'] = " ".join(body['query'].split())
+        if isinstance(body.get('search_options'), list):
+            body['search_options'] = sorted(set(body['search_options']))
+
+        canonical_body = json.dumps(body, sort_keys=True, separators=(",", ":"))
+        return data['index_id'], hashlib.sha256(canonical_body.encode()).hexdigest()
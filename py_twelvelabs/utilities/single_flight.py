@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import contextvars
+from concurrent.futures import Future, InvalidStateError
+from typing import Any, Dict, Hashable, Callable, Awaitable
+
+from py_twelvelabs.exceptions import DeadlineExceededError, RequestCancelledError
+from py_twelvelabs.utilities.deadline import get_deadline
+
+
+# Result shared with the waiting callers when the first caller ran out of time or was cancelled. Its deadline is its
+# own, so the waiting callers run the function again instead of failing with it.
+_RETRY = object()
+
+
+def _chain(source: Future, target: Future):
+    if target.cancelled():
+        return
+    try:
+        if source.exception() is not None:
+            target.set_exception(source.exception())
+        else:
+            target.set_result(source.result())
+    except InvalidStateError:
+        pass
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key from different threads into a single call.
+
+    The first caller runs the function and every caller that arrives while it is in flight receives the same result, or
+    the same exception. Calls made after the function returned run it again. Each waiting caller waits within its own
+    deadline, and if the first caller's deadline expires or it is cancelled, one of the waiting callers runs the function
+    again.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Run a function, or wait for the in-flight call with the same key.
+
+        :param key: Key identifying identical calls.
+        :param function: Function to run.
+        :return: Result of the function.
+        """
+
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                is_leader = future is None
+                if is_leader:
+                    future = self._calls[key] = Future()
+
+            if is_leader:
+                break
+
+            # Wait on a future of this caller's own, so that its deadline or cancel token never cancels the shared call.
+            waiter = Future()
+            future.add_done_callback(lambda done, waiter=waiter: _chain(done, waiter))
+            result = get_deadline().wait(waiter)
+            if result is not _RETRY:
+                return result
+
+        try:
+            result = function()
+        except (DeadlineExceededError, RequestCancelledError):
+            future.set_result(_RETRY)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent calls with the same key from different coroutines into a single call.
+
+    The call runs as a task of its own, outside of the context of the coroutine that started it, so it is bound by none
+    of the callers' deadlines. Each caller waits for it within its own deadline, and cancelling one of them does not
+    cancel it for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable]) -> Any:
+        """
+        Run a coroutine function, or wait for the in-flight call with the same key.
+
+        :param key: Key identifying identical calls.
+        :param function: Coroutine function to run.
+        :return: Result of the coroutine.
+        """
+
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = contextvars.Context().run(asyncio.ensure_future, function())
+            task.add_done_callback(lambda done: self._calls.pop(key) if self._calls.get(key) is done else None)
+
+        return await get_deadline().run_async(asyncio.shield(task))
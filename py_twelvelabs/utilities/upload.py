@@ -0,0 +1,103 @@
+import os
+import mmap
+import mimetypes
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Text, Callable, Iterator, Tuple, Optional
+
+if TYPE_CHECKING:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+
+
+class UploadStream:
+    """
+    File-like view of a multi-part body that is read in fixed-size chunks.
+
+    Only one chunk of the body is held in memory at a time, and a progress callback is called after every chunk with the
+    number of bytes read so far and the total size of the body.
+    """
+
+    def __init__(self, encoder: "MultipartEncoder", chunk_size: int, progress_callback: Optional[Callable[[int, int], None]] = None):
+        """
+        Initialize the upload stream.
+
+        :param encoder: Multi-part encoder.
+        :param chunk_size: Number of bytes read from the body at a time.
+        :param progress_callback: Function called with the number of bytes read and the total number of bytes.
+        """
+
+        self.encoder = encoder
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+        self.bytes_read = 0
+
+    @property
+    def content_type(self) -> Text:
+        return self.encoder.content_type
+
+    @property
+    def len(self) -> int:
+        return self.encoder.len
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read the next chunk of the body.
+
+        The requested size is ignored in favour of the configured chunk size, so that the HTTP library's default block size
+        does not dictate how much is read from disk at a time.
+
+        :param size: Requested number of bytes.
+        :return: Next chunk, or an empty byte string at the end of the body.
+        """
+
+        chunk = self.encoder.read(self.chunk_size)
+        if chunk:
+            self.bytes_read += len(chunk)
+            if self.progress_callback is not None:
+                self.progress_callback(self.bytes_read, self.encoder.len)
+        return chunk
+
+
+class MemoryMappedFile:
+    """
+    Read-only file object backed by a memory map of an open file.
+    """
+
+    def __init__(self, file):
+        self._file = file
+        self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def tell(self) -> int:
+        return self._mmap.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._mmap.read(size)
+
+    def close(self):
+        self._mmap.close()
+
+
+@contextmanager
+def open_video_file(video_file: Text, use_mmap: bool = False) -> Iterator[Tuple]:
+    """
+    Open a video file for a multi-part upload and close it when the upload is done.
+
+    With use_mmap the file is read through a read-only memory map, so pages are loaded by the operating system on demand
+    and can be shared between concurrent uploads of the same file instead of being copied into process memory.
+
+    :param video_file: Path to the video file.
+    :param use_mmap: Read the file through a memory map.
+    :return: Multi-part field tuple of file name, file object and content type.
+    """
+
+    with open(video_file, "rb") as file:
+        file_object = file
+        if use_mmap and os.fstat(file.fileno()).st_size > 0:
+            file_object = MemoryMappedFile(file)
+        try:
+            yield (video_file, file_object, mimetypes.guess_type(video_file)[0])
+        finally:
+            if file_object is not file:
+                file_object.close()
@@ -0,0 +1,594 @@
+import time
+import random
+import asyncio
+import threading
+from datetime import datetime, timezone
+from concurrent.futures import Future, ThreadPoolExecutor, InvalidStateError
+from typing import Text, Dict, List, Tuple, Callable, Optional, AsyncIterator
+
+from py_twelvelabs.models import Task
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.logger import RATE_LIMITED, get_logger
+from py_twelvelabs.utilities.deadline import clear_deadline
+from py_twelvelabs.exceptions import TaskFailedError
+
+
+RUNNING_TASK_STATUSES = ('pending', 'indexing', 'validating')
+
+
+def get_polling_interval(task: Task) -> float:
+    """
+    Get the number of seconds to wait before polling a task again.
+
+    The interval is taken from the task's remaining processing time or estimated completion time when the API reports them,
+    clamped to the configured bounds and spread by a random jitter so that many tasks do not poll in lockstep.
+
+    :param task: Task.
+    :return: Polling interval in seconds.
+    """
+
+    if task.process is not None and task.process.get('remain_seconds') is not None:
+        interval = float(task.process['remain_seconds'])
+    elif task.estimated_time is not None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        interval = (task.estimated_time - now).total_seconds()
+    else:
+        interval = settings.TASK_STATUS_POLLING_INTERVAL
+
+    interval = min(max(interval, settings.TASK_WATCHER_MIN_POLLING_INTERVAL), settings.TASK_WATCHER_MAX_POLLING_INTERVAL)
+    jitter = settings.TASK_WATCHER_POLLING_JITTER
+    return interval * random.uniform(1 - jitter, 1 + jitter)
+
+
+class _WatchedTask:
+    """
+    A task tracked by a watcher, with the future and callback of every caller waiting for it.
+    """
+
+    def __init__(self, task_id: Text, index_id: Optional[Text]):
+        self.task_id = task_id
+        self.index_id = index_id
+        self.waiters: List[Tuple[object, Optional[Callable]]] = []
+        self.next_poll_at = time.monotonic()
+        self.notified = False
+        self.errors = 0
+
+
+class _BaseTaskWatcher:
+    """
+    Scheduling logic shared by the threaded and asynchronous task watchers.
+
+    Due tasks are grouped by index. Indexes with several due tasks are polled with a single task listing sorted by last update,
+    and only the tasks missing from it are fetched one by one.
+
+    When the client has a callback receiver, tasks are first polled after settings.CALLBACK_FALLBACK_TIMEOUT, or as soon
+    as a notification that they completed or failed arrives.
+
+    Each group is polled as soon as it is due, without waiting for the polls of other groups to finish, so that a slow
+    poll only delays the tasks of its own index. Tasks of an index that become due while the index is being polled are
+    polled together once that poll finishes. A task watched by several callers is polled once, and each caller gets a future of its own, so that cancelling or
+    unwatching it only detaches that caller. Failed polls are retried with a backoff, and only the
+    settings.TASK_WATCHER_MAX_POLL_ERRORS-th consecutive failure fails the futures.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.callback_receiver = getattr(client, "callback_receiver", None)
+        self.logger = get_logger(__name__)
+        self._watched: Dict[Text, _WatchedTask] = {}
+        self._polling: Dict[Text, int] = {}
+        self._is_listening = False
+
+    def _add_waiter(self, task_id: Text, index_id: Optional[Text], future, callback: Optional[Callable]):
+        """
+        Add a caller waiting for a task, and start watching the task if it is not watched yet.
+
+        A new task's first poll is deferred while a notification for it may still arrive.
+
+        :param task_id: Task ID.
+        :param index_id: Index ID of the task.
+        :param future: Future resolved once the task completes or fails.
+        :param callback: Function called with the future once the task completes or fails.
+        """
+
+        watched_task = self._watched.get(task_id)
+        if watched_task is None:
+            watched_task = self._watched[task_id] = _WatchedTask(task_id, index_id)
+            if self.callback_receiver is not None and self.callback_receiver.get_status(task_id) in (None, *RUNNING_TASK_STATUSES):
+                watched_task.next_poll_at += settings.CALLBACK_FALLBACK_TIMEOUT
+        elif watched_task.index_id is None:
+            watched_task.index_id = index_id
+        watched_task.waiters.append((future, callback))
+
+    def _remove_waiters(self, task_id: Text, future=None) -> List:
+        """
+        Detach one or all of the callers waiting for a task, and stop watching the task once none is left.
+
+        :param task_id: Task ID.
+        :param future: Future of the caller to detach, or None to detach all of them.
+        :return: Futures of the detached callers.
+        """
+
+        watched_task = self._watched.get(task_id)
+        if watched_task is None:
+            return []
+        detached = [waiter for waiter in watched_task.waiters if future is None or waiter[0] is future]
+        watched_task.waiters = [waiter for waiter in watched_task.waiters if waiter not in detached]
+        if not watched_task.waiters:
+            self._watched.pop(task_id, None)
+        return [waiter[0] for waiter in detached]
+
+    def _notify(self, task_id: Text) -> bool:
+        """
+        Poll a watched task as soon as possible after a notification that it completed or failed.
+
+        :param task_id: Task ID.
+        :return: True if the task is being watched.
+        """
+
+        watched_task = self._watched.get(task_id)
+        if watched_task is None:
+            return False
+        watched_task.notified = True
+        if watched_task.next_poll_at != float("inf"):
+            watched_task.next_poll_at = time.monotonic()
+        return True
+
+    def _get_due_groups(self, now: float) -> List[List[_WatchedTask]]:
+        """
+        Group the tasks that are due for a poll.
+
+        :param now: Current monotonic time.
+        :return: Groups of due tasks. Each group is polled as a unit.
+        """
+
+        groups = {}
+        for watched_task in self._watched.values():
+            key = self._get_group_key(watched_task)
+            if watched_task.next_poll_at <= now and key not in self._polling:
+                groups.setdefault(key, []).append(watched_task)
+
+        due_groups = []
+        for group in groups.values():
+            if group[0].index_id is not None and len(group) >= settings.TASK_WATCHER_LIST_THRESHOLD:
+                due_groups.append(group)
+            else:
+                due_groups.extend([watched_task] for watched_task in group)
+        return due_groups
+
+    def _get_next_poll_at(self) -> Optional[float]:
+        next_poll_at = min((watched_task.next_poll_at for watched_task in self._watched.values() if self._get_group_key(watched_task) not in self._polling), default=float("inf"))
+        return next_poll_at if next_poll_at != float("inf") else None
+
+    @staticmethod
+    def _get_group_key(watched_task: _WatchedTask) -> Text:
+        return watched_task.index_id or watched_task.task_id
+
+    def _start_polls(self) -> List[Tuple[Text, List[_WatchedTask]]]:
+        """
+        Take the groups that are due for a poll and mark them as being polled.
+
+        :return: Group keys and groups to poll.
+        """
+
+        polls = []
+        for group in self._get_due_groups(time.monotonic()):
+            key = self._get_group_key(group[0])
+            self._polling[key] = self._polling.get(key, 0) + 1
+            for watched_task in group:
+                watched_task.next_poll_at = float("inf")
+            polls.append((key, group))
+        return polls
+
+    def _finish_poll(self, key: Text):
+        self._polling[key] -= 1
+        if not self._polling[key]:
+            del self._polling[key]
+
+    def _is_current(self, watched_task: _WatchedTask) -> bool:
+        """
+        Check that a watched task is still the one tracked for its task ID. A poll that was running when the task was
+        unwatched, and possibly watched again, holds an object that is no longer tracked.
+
+        :param watched_task: Watched task.
+        :return: True if the watched task is tracked and has callers waiting for it.
+        """
+
+        return self._watched.get(watched_task.task_id) is watched_task and bool(watched_task.waiters)
+
+    def _discard(self, watched_task: _WatchedTask):
+        if self._watched.get(watched_task.task_id) is watched_task:
+            del self._watched[watched_task.task_id]
+
+    def _handle_task(self, watched_task: _WatchedTask, task: Task):
+        """
+        Resolve or reschedule a watched task from its latest state.
+
+        :param watched_task: Watched task.
+        :param task: Latest state of the task.
+        """
+
+        if not self._is_current(watched_task):
+            self._discard(watched_task)
+            return
+
+        watched_task.errors = 0
+        if task.status in RUNNING_TASK_STATUSES:
+            # A notification received while the task was being polled is newer than the state that was polled.
+            interval = settings.TASK_WATCHER_MIN_POLLING_INTERVAL if watched_task.notified else get_polling_interval(task)
+            watched_task.notified = False
+            self.logger.debug("Task %s is in the %s state and will be polled again in %.1f seconds.", task.id, task.status, interval, extra={"task_id": task.id, "status": task.status, "interval": interval, **RATE_LIMITED})
+            watched_task.next_poll_at = time.monotonic() + interval
+
+        elif task.status == 'ready':
+            self.logger.info("Task %s completed successfully.", task.id, extra={"task_id": task.id, "status": task.status})
+            if self.client.search_cache is not None:
+                self.client.search_cache.invalidate(task.index_id)
+            self._resolve(watched_task, task, None)
+
+        else:
+            self._resolve(watched_task, None, TaskFailedError(f"Task {task.id} failed with status {task.status}."))
+
+    def _handle_error(self, watched_task: _WatchedTask, error: Exception):
+        """
+        Reschedule a watched task whose poll failed, or fail it after too many consecutive failures.
+
+        :param watched_task: Watched task.
+        :param error: Exception raised by the poll.
+        """
+
+        if not self._is_current(watched_task):
+            self._discard(watched_task)
+            return
+
+        watched_task.errors += 1
+        if watched_task.errors >= settings.TASK_WATCHER_MAX_POLL_ERRORS:
+            self._resolve(watched_task, None, error)
+            return
+
+        interval = min(settings.TASK_WATCHER_MIN_POLLING_INTERVAL * 2 ** watched_task.errors, settings.TASK_WATCHER_MAX_POLLING_INTERVAL)
+        self.logger.warning("Failed to poll task %s, polling it again in %.1f seconds: %s", watched_task.task_id, interval, error, extra={"task_id": watched_task.task_id, "interval": interval})
+        watched_task.next_poll_at = time.monotonic() + interval
+
+    def _resolve(self, watched_task: _WatchedTask, task: Optional[Task], error: Optional[Exception]):
+        self._discard(watched_task)
+        waiters, watched_task.waiters = watched_task.waiters, []
+
+        for future, callback in waiters:
+            try:
+                if error is None:
+                    future.set_result(task)
+                else:
+                    future.set_exception(error)
+            except (InvalidStateError, asyncio.InvalidStateError):
+                # The caller cancelled its future.
+                continue
+
+            if callback is not None:
+                try:
+                    callback(future)
+                except Exception:
+                    self.logger.exception("Callback for task %s raised an exception.", watched_task.task_id)
+
+    @staticmethod
+    def _get_list_params(index_id: Text, page: int) -> Dict:
+        return {
+            "index_id": index_id,
+            "page": page,
+            "page_limit": settings.TASK_WATCHER_LIST_PAGE_LIMIT,
+            "sort_by": "updated_at",
+            "sort_option": "desc",
+        }
+
+
+class TaskWatcher(_BaseTaskWatcher):
+    """
+    Watches many tasks from a single background thread and resolves a future for each one when it completes.
+
+    Polling starts on the first call to watch and stops when the watcher is closed.
+    """
+
+    def __init__(self, client):
+        super().__init__(client)
+        self._condition = threading.Condition()
+        self._thread = None
+        self._executor = None
+        self._is_closed = False
+
+    def watch(self, task_id: Text, index_id: Text = None, callback: Callable[[Future], None] = None) -> Future:
+        """
+        Start watching a task.
+
+        :param task_id: Task ID.
+        :param index_id: Index ID of the task. When given, tasks of the same index are polled together with a single listing.
+        :param callback: Function called with the future once the task completes or fails.
+        :return: Future of this caller, that resolves to the completed Task, or raises TaskFailedError if the task fails. Cancelling it stops watching the task for this caller only.
+        """
+
+        future = Future()
+        with self._condition:
+            if self._is_closed:
+                raise RuntimeError("The task watcher is closed.")
+
+            self._add_waiter(task_id, index_id, future, callback)
+
+            if self.callback_receiver is not None and not self._is_listening:
+                self.callback_receiver.add_listener(self._on_callback)
+                self._is_listening = True
+
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=settings.TASK_WATCHER_MAX_WORKERS)
+                self._thread = threading.Thread(target=self._run, name="py-twelvelabs-task-watcher", daemon=True)
+                self._thread.start()
+
+            self._condition.notify()
+
+        future.add_done_callback(lambda done: self.unwatch(task_id, done) if done.cancelled() else None)
+        return future
+
+    def unwatch(self, task_id: Text, future: Future = None):
+        """
+        Stop waiting for a task and cancel the future of the caller. The task stays watched for the other callers.
+
+        :param task_id: Task ID.
+        :param future: Future returned by watch, or None to cancel the futures of all callers and stop watching the task.
+        """
+
+        with self._condition:
+            futures = self._remove_waiters(task_id, future)
+        for detached in futures:
+            detached.cancel()
+
+    def close(self):
+        """
+        Stop polling and cancel the futures of all tasks still being watched.
+        """
+
+        if self._is_listening:
+            self.callback_receiver.remove_listener(self._on_callback)
+            self._is_listening = False
+
+        with self._condition:
+            self._is_closed = True
+            futures = [future for watched_task in self._watched.values() for future, _ in watched_task.waiters]
+            self._watched.clear()
+            self._condition.notify()
+
+        for future in futures:
+            future.cancel()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._executor.shutdown()
+
+    def _on_callback(self, task_id: Text, status: Text):
+        if status in RUNNING_TASK_STATUSES:
+            return
+        with self._condition:
+            if self._notify(task_id):
+                self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._is_closed:
+                    next_poll_at = self._get_next_poll_at()
+                    now = time.monotonic()
+                    if next_poll_at is not None and next_poll_at <= now:
+                        break
+                    self._condition.wait(None if next_poll_at is None else next_poll_at - now)
+
+                if self._is_closed:
+                    return
+                polls = self._start_polls()
+
+            for key, group in polls:
+                self._executor.submit(self._poll_group, group).add_done_callback(lambda poll, key=key: self._on_poll_done(key, poll))
+
+    def _on_poll_done(self, key: Text, poll: Future):
+        if poll.exception() is not None:
+            self.logger.error("Polling watched tasks raised an exception.", exc_info=poll.exception())
+        # Wake up the scheduler to pick up the next poll times of the group.
+        with self._condition:
+            self._finish_poll(key)
+            self._condition.notify()
+
+    def _poll_group(self, group: List[_WatchedTask]):
+        """
+        Poll a group of tasks, resolving or rescheduling each one.
+
+        :param group: Tasks of one index, or a single task.
+        """
+
+        remaining = {watched_task.task_id: watched_task for watched_task in group}
+
+        if len(group) > 1:
+            try:
+                for page in range(1, settings.TASK_WATCHER_LIST_MAX_PAGES + 1):
+                    tasks = self.client.task.list(**self._get_list_params(group[0].index_id, page))
+                    with self._condition:
+                        for task in tasks:
+                            if task.id in remaining:
+                                self._handle_task(remaining.pop(task.id), task)
+                    if not remaining or len(tasks) < settings.TASK_WATCHER_LIST_PAGE_LIMIT:
+                        break
+            except Exception as e:
+                self.logger.warning("Failed to list tasks of index %s, polling them one by one: %s", group[0].index_id, e)
+
+        for watched_task in remaining.values():
+            try:
+                task = self.client.task.get(watched_task.task_id)
+            except Exception as e:
+                with self._condition:
+                    self._handle_error(watched_task, e)
+                continue
+            with self._condition:
+                self._handle_task(watched_task, task)
+
+
+class AsyncTaskWatcher(_BaseTaskWatcher):
+    """
+    Watches many tasks from a single asyncio task and resolves a future for each one when it completes.
+
+    Polling starts on the first call to watch and stops when the watcher is closed.
+    """
+
+    def __init__(self, client):
+        super().__init__(client)
+        self._wakeup = None
+        self._runner = None
+        self._loop = None
+        self._polls = set()
+
+    def watch(self, task_id: Text, index_id: Text = None, callback: Callable[[asyncio.Future], None] = None) -> asyncio.Future:
+        """
+        Start watching a task. Must be called from a running event loop.
+
+        :param task_id: Task ID.
+        :param index_id: Index ID of the task. When given, tasks of the same index are polled together with a single listing.
+        :param callback: Function called with the future once the task completes or fails.
+        :return: Future of this caller, that resolves to the completed Task, or raises TaskFailedError if the task fails. Cancelling it stops watching the task for this caller only.
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._add_waiter(task_id, index_id, future, callback)
+        future.add_done_callback(lambda done: self.unwatch(task_id, done) if done.cancelled() else None)
+
+        self._loop = loop
+        if self.callback_receiver is not None and not self._is_listening:
+            self.callback_receiver.add_listener(self._on_callback)
+            self._is_listening = True
+
+        if self._runner is None or self._runner.done():
+            self._wakeup = asyncio.Event()
+            self._runner = asyncio.ensure_future(self._run())
+
+        self._wakeup.set()
+        return future
+
+    def unwatch(self, task_id: Text, future: asyncio.Future = None):
+        """
+        Stop waiting for a task and cancel the future of the caller. The task stays watched for the other callers.
+
+        :param task_id: Task ID.
+        :param future: Future returned by watch, or None to cancel the futures of all callers and stop watching the task.
+        """
+
+        for detached in self._remove_waiters(task_id, future):
+            detached.cancel()
+
+    async def as_completed(self) -> AsyncIterator[Task]:
+        """
+        Yield watched tasks as they complete, until no tasks are left to watch.
+
+        Tasks that fail raise TaskFailedError from the iterator.
+
+        :return: Async iterator of completed tasks.
+        """
+
+        while self._watched:
+            # One future per task, so that a task watched by several callers is yielded once.
+            futures = [next(future for future, _ in watched_task.waiters if not future.done()) for watched_task in self._watched.values() if any(not future.done() for future, _ in watched_task.waiters)]
+            if not futures:
+                await asyncio.sleep(0)
+                continue
+            done, _ = await asyncio.wait(futures, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                if not future.cancelled():
+                    yield future.result()
+
+    async def close(self):
+        """
+        Stop polling and cancel the futures of all tasks still being watched.
+        """
+
+        if self._is_listening:
+            self.callback_receiver.remove_listener(self._on_callback)
+            self._is_listening = False
+
+        futures = [future for watched_task in self._watched.values() for future, _ in watched_task.waiters]
+        self._watched.clear()
+        for future in futures:
+            future.cancel()
+
+        polls, self._polls = list(self._polls), set()
+        for poll in polls:
+            poll.cancel()
+        await asyncio.gather(*polls, return_exceptions=True)
+
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+    def _on_callback(self, task_id: Text, status: Text):
+        # Called from a thread of the callback receiver.
+        if status in RUNNING_TASK_STATUSES or self._loop is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._handle_callback, task_id)
+        except RuntimeError:
+            pass
+
+    def _handle_callback(self, task_id: Text):
+        if self._notify(task_id) and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self):
+        clear_deadline()
+        while self._watched or self._polls:
+            next_poll_at = self._get_next_poll_at()
+            delay = None if next_poll_at is None else next_poll_at - time.monotonic()
+            if delay is None or delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            for key, group in self._start_polls():
+                poll = asyncio.ensure_future(self._poll_group(group))
+                self._polls.add(poll)
+                poll.add_done_callback(lambda done, key=key: self._on_poll_done(key, done))
+
+    def _on_poll_done(self, key: Text, poll: asyncio.Future):
+        self._polls.discard(poll)
+        self._finish_poll(key)
+        if not poll.cancelled() and poll.exception() is not None:
+            self.logger.error("Polling watched tasks raised an exception.", exc_info=poll.exception())
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _poll_group(self, group: List[_WatchedTask]):
+        """
+        Poll a group of tasks, resolving or rescheduling each one.
+
+        :param group: Tasks of one index, or a single task.
+        """
+
+        remaining = {watched_task.task_id: watched_task for watched_task in group}
+
+        if len(group) > 1:
+            try:
+                for page in range(1, settings.TASK_WATCHER_LIST_MAX_PAGES + 1):
+                    tasks = await self.client.task.list(**self._get_list_params(group[0].index_id, page))
+                    for task in tasks:
+                        if task.id in remaining:
+                            self._handle_task(remaining.pop(task.id), task)
+                    if not remaining or len(tasks) < settings.TASK_WATCHER_LIST_PAGE_LIMIT:
+                        break
+            except Exception as e:
+                self.logger.warning("Failed to list tasks of index %s, polling them one by one: %s", group[0].index_id, e)
+
+        for watched_task in remaining.values():
+            try:
+                task = await self.client.task.get(watched_task.task_id)
+            except Exception as e:
+                self._handle_error(watched_task, e)
+                continue
+            self._handle_task(watched_task, task)
@@ -0,0 +1,129 @@
+import re
+import json
+import threading
+from typing import Callable, Dict, List, Text, Tuple
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+class StubRequest:
+    """
+    A request received by the stub server.
+    """
+
+    def __init__(self, method: Text, path: Text, headers: Dict, body: bytes, client_port: int, match: re.Match):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.body = body
+        self.client_port = client_port
+        self.match = match
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        for method, pattern, handler in self.server.routes:
+            match = pattern.fullmatch(self.path)
+            if method == self.command and match is not None:
+                request = StubRequest(self.command, self.path, dict(self.headers), body, self.client_address[1], match)
+                self.server.requests.append(request)
+                status, payload, headers = self._unpack(handler(request))
+                break
+        else:
+            status, payload, headers = 404, {"message": f"No route for {self.command} {self.path}"}, {}
+
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def _unpack(result: Tuple) -> Tuple:
+        if len(result) == 2:
+            return result[0], result[1], {}
+        return result
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """
+    Minimal local HTTP server for exercising the client without the real API.
+
+    Routes map a method and a path regular expression to a handler that receives a StubRequest and returns a
+    (status, payload) or (status, payload, headers) tuple.
+    """
+
+    def __init__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self._server.routes = []
+        self._server.requests = []
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    @property
+    def requests(self) -> List[StubRequest]:
+        return self._server.requests
+
+    def route(self, method: Text, path: Text, handler: Callable):
+        """
+        Register a route.
+
+        :param method: HTTP method.
+        :param path: Regular expression matched against the full request path.
+        :param handler: Request handler.
+        """
+
+        self._server.routes.append((method, re.compile(path), handler))
+
+    def reset(self):
+        """
+        Remove all routes and recorded requests.
+        """
+
+        self._server.routes.clear()
+        self._server.requests.clear()
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+TASK = {
+    "_id": "task_1",
+    "index_id": "index_1",
+    "status": "ready",
+    "metadata": {"filename": "test.mp4"},
+    "created_at": "2024-01-01T00:00:00.000Z",
+    "updated_at": "2024-01-01T00:00:00.000Z",
+}
+
+INDEX = {
+    "_id": "index_1",
+    "index_name": "test",
+    "index_options": ["visual"],
+    "created_at": "2024-01-01T00:00:00.000Z",
+    "updated_at": "2024-01-01T00:00:00.000Z",
+    "expires_at": "2024-04-01T00:00:00.000Z",
+    "engine_id": "marengo2.5",
+    "video_count": 1,
+    "total_duration": 10.0,
+    "addons": None,
+}
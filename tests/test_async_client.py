@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from py_twelvelabs import AsyncTwelveLabsAPIClient
+from py_twelvelabs.models import Index, Task
+from py_twelvelabs.settings import settings
+from tests.stub_server import StubServer, TASK, INDEX
+
+
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the asynchronous client against a local stub server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up test fixtures: start the stub server.
+        """
+
+        cls.server = StubServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Tear down test fixtures: stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        """
+        Set up test fixtures for each test: register routes and point the client at the stub server.
+        """
+
+        self.server.reset()
+        self.server.route("GET", r"/v1.1/tasks/\w+", lambda request: (200, TASK))
+        self.server.route("GET", r"/v1.1/indexes.*", lambda request: (200, {"data": [INDEX]}))
+        self.server.route("POST", r"/v1.1/search", lambda request: (200, {"data": [], "page_info": {}, "query": request.json()["query"]}))
+        self.server.route("POST", r"/v1.1/tasks", lambda request: (201, {"_id": "task_1"}))
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_1_get_task(self):
+        """
+        Test get task.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            task = await client.task.get("task_1")
+
+        self.assertIsInstance(task, Task)
+        self.assertEqual(task.index_id, "index_1")
+
+    async def test_2_list_indexes(self):
+        """
+        Test list indexes.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            indexes = await client.index.list()
+
+        self.assertEqual(len(indexes), 1)
+        self.assertIsInstance(indexes[0], Index)
+
+    async def test_3_concurrent_requests_share_pool(self):
+        """
+        Test that concurrent requests are bounded by the shared connection pool.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test", pool_maxsize=4) as client:
+            results = await asyncio.gather(*(client.search.query("index_1", f"query {i}", ["visual"]) for i in range(50)))
+
+        self.assertEqual([result["query"] for result in results], [f"query {i}" for i in range(50)])
+        self.assertLessEqual(len({request.client_port for request in self.server.requests}), 4)
+
+    async def test_4_create_task_from_file(self):
+        """
+        Test create task with a multi-part file upload.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            task_id = await client.task.create_async(index_id="index_1", video_file="tests/data/test.mp4")
+
+        self.assertEqual(task_id, "task_1")
+        self.assertIn(b"Content-Disposition", self.server.requests[-1].body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import time
+import tempfile
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from tests.stub_server import StubServer
+
+
+def _search(request):
+    query = request.json()['query']
+    if query == "fail":
+        return 400, {"message": "Invalid query."}
+    time.sleep(0.2 if query == "slow" else 0.01)
+    return 200, {"data": [{"video_id": query, "score": 90.0, "start": 0.0, "end": 1.0}], "page_info": {"page": 1}}
+
+
+class TestBatchSearch(unittest.IsolatedAsyncioTestCase):
+    """
+    Test running many queries against an index in one batch.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a stub server that echoes each query as a video ID, answers "slow" slowly and rejects "fail".
+        """
+
+        cls.server = StubServer()
+        cls.server.route("POST", r"/v1.1/search", _search)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_1_results_in_completion_order(self):
+        """
+        Test that results are yielded as they complete and that a failed query does not stop the others.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            results = list(client.search.query_batch("index_1", ["slow", "a", "fail", {"search_query": "b", "threshold": "high"}], search_options=["visual"], max_workers=4))
+
+        self.assertEqual(results[-1].query['search_query'], "slow")
+        failed = [result for result in results if not result.is_successful]
+        self.assertEqual([result.position for result in failed], [2])
+        self.assertIn("Invalid query", failed[0].error)
+        self.assertEqual(next(result for result in results if result.position == 3).query['threshold'], "high")
+
+    def test_2_ordered_results(self):
+        """
+        Test that ordered batches yield results in the order of the queries.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            results = list(client.search.query_batch("index_1", ["slow"] + [f"q{i}" for i in range(10)], search_options=["visual"], max_workers=3, ordered=True))
+
+        self.assertEqual([result.position for result in results], list(range(11)))
+        self.assertEqual(results[5].result['data'][0]['video_id'], "q4")
+
+    def test_3_checkpoint_resumes(self):
+        """
+        Test that a batch run again with its checkpoint only sends the queries that did not succeed.
+        """
+
+        with tempfile.TemporaryDirectory() as directory, TwelveLabsAPIClient(api_key="test") as client:
+            checkpoint_file = os.path.join(directory, "batch.jsonl")
+            queries = ["a", "fail", "b"]
+            list(client.search.query_batch("index_1", queries, search_options=["visual"], checkpoint_file=checkpoint_file))
+            with open(checkpoint_file, "a") as file:
+                file.write('{"position": 1, "que')
+
+            self.server.requests.clear()
+            queries[1] = "c"
+            results = list(client.search.query_batch("index_1", queries, search_options=["visual"], checkpoint_file=checkpoint_file, ordered=True))
+
+            self.assertEqual([request.json()['query'] for request in self.server.requests], ["c"])
+            self.assertEqual([result.result['data'][0]['video_id'] for result in results], ["a", "c", "b"])
+            self.assertFalse(os.path.exists(checkpoint_file))
+
+    async def test_4_async_query_batch(self):
+        """
+        Test the asynchronous batch search.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            results = [result async for result in client.search.query_batch("index_1", ["slow", "a", "b"], search_options=["visual"], ordered=True)]
+
+        self.assertEqual([result.query['search_query'] for result in results], ["slow", "a", "b"])
+        self.assertTrue(all(result.is_successful for result in results))
+
+    def test_5_closing_early_does_not_wait(self):
+        """
+        Test that closing a batch early returns without waiting for the queries still in flight.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            results = client.search.query_batch("index_1", ["a", "slow", "slow", "slow"], search_options=["visual"], max_workers=4)
+            self.assertEqual(next(results).query['search_query'], "a")
+            started_at = time.monotonic()
+            results.close()
+            self.assertLess(time.monotonic() - started_at, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
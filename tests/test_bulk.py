@@ -0,0 +1,103 @@
+import time
+import threading
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.models import BulkTaskResult
+from py_twelvelabs.settings import settings
+from tests.stub_server import StubServer
+
+
+class TestBulk(unittest.IsolatedAsyncioTestCase):
+    """
+    Test bulk task creation against a local stub server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up test fixtures: start a stub server that tracks how many uploads per video host run at once.
+        """
+
+        cls.lock = threading.Lock()
+        cls.server = StubServer()
+        cls.server.route("POST", r"/v1.1/tasks", cls._create_task)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Tear down test fixtures: stop the stub server.
+        """
+
+        cls.server.stop()
+
+    @classmethod
+    def _create_task(cls, request):
+        host = b"a.example.com" if b"a.example.com" in request.body else b"other"
+        with cls.lock:
+            cls.created += 1
+            task_id = f"task_{cls.created}"
+            cls.running[host] = cls.running.get(host, 0) + 1
+            cls.peak[host] = max(cls.peak.get(host, 0), cls.running[host])
+        time.sleep(0.02)
+        with cls.lock:
+            cls.running[host] -= 1
+        return 201, {"_id": task_id}
+
+    def setUp(self):
+        """
+        Set up test fixtures for each test: reset counters and point the client at the stub server.
+        """
+
+        self.server.requests.clear()
+        TestBulk.created = 0
+        TestBulk.running = {}
+        TestBulk.peak = {}
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_1_create_bulk(self):
+        """
+        Test that every video gets a result and that failures are reported per video.
+        """
+
+        videos = ["tests/data/test.mp4"] + [f"https://a.example.com/{i}.mp4" for i in range(5)] + [{"language": "en"}]
+        with TwelveLabsAPIClient(api_key="test") as client:
+            results = list(client.task.create_bulk("index_1", videos, max_workers=4))
+
+        self.assertEqual(len(results), 7)
+        self.assertTrue(all(isinstance(result, BulkTaskResult) for result in results))
+        self.assertEqual(len([result for result in results if result.is_successful]), 6)
+        self.assertEqual(len({result.task_id for result in results if result.is_successful}), 6)
+
+    def test_2_per_host_limit(self):
+        """
+        Test that uploads from one host never exceed the per-host limit.
+        """
+
+        videos = [f"https://a.example.com/{i}.mp4" for i in range(8)] + [f"https://b.example.com/{i}.mp4" for i in range(8)]
+        with TwelveLabsAPIClient(api_key="test") as client:
+            results = list(client.task.create_bulk("index_1", iter(videos), max_workers=6, max_per_host=2))
+
+        self.assertTrue(all(result.is_successful for result in results))
+        self.assertLessEqual(self.peak[b"a.example.com"], 2)
+
+    async def test_3_async_create_bulk(self):
+        """
+        Test bulk task creation with the asynchronous client.
+        """
+
+        videos = [f"https://a.example.com/{i}.mp4" for i in range(6)]
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            results = [result async for result in client.task.create_bulk("index_1", videos, max_workers=4, max_per_host=3)]
+
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(result.is_successful for result in results))
+        self.assertLessEqual(self.peak[b"a.example.com"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import time
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.cache import TTLCache, ResponseCache
+from tests.stub_server import StubServer, TASK, INDEX
+
+
+class TestCache(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the response cache.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a stub server that serves an index with an ETag and a running and a finished task.
+        """
+
+        cls.server = StubServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.reset()
+        self.server.route("GET", r"/v1.1/indexes/\w+", self._get_index)
+        self.server.route("GET", r"/v1.1/indexes\?.*", lambda request: (200, {"data": [INDEX]}))
+        self.server.route("PUT", r"/v1.1/indexes/\w+", lambda request: (200, None))
+        self.server.route("GET", r"/v1.1/tasks/(\w+)", lambda request: (200, {**TASK, "_id": request.match.group(1), "status": "indexing" if request.match.group(1) == "running" else "ready"}))
+        self.server.route("DELETE", r"/v1.1/tasks/\w+", lambda request: (204, None))
+
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _get_index(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, None, {"ETag": '"v1"'}
+        return 200, INDEX, {"ETag": '"v1"'}
+
+    def _count_requests(self, method, path):
+        return len([request for request in self.server.requests if request.method == method and request.path.startswith(path)])
+
+    def test_1_ttl_and_lru(self):
+        """
+        Test that entries expire after their time to live and that the least recently used entry is evicted first.
+        """
+
+        cache = TTLCache(maxsize=2, ttl=0.05)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.get_stats(), {"hits": 2, "misses": 2, "revalidations": 0, "size": 1})
+
+    def test_2_get_index_is_cached(self):
+        """
+        Test that repeated index lookups are served from the cache and that stale entries are revalidated with their ETag.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", cache=ResponseCache(ttls={"index": 0.05})) as client:
+            first = client.index.get("index_1")
+            self.assertEqual(client.index.get("index_1"), first)
+            self.assertEqual(self._count_requests("GET", "/v1.1/indexes/"), 1)
+
+            time.sleep(0.06)
+            self.assertEqual(client.index.get("index_1"), first)
+            self.assertEqual(self._count_requests("GET", "/v1.1/indexes/"), 2)
+            self.assertEqual(self.server.requests[-1].headers.get("If-None-Match"), '"v1"')
+            self.assertEqual(client.cache.get_stats()['index'], {"hits": 1, "misses": 2, "revalidations": 1, "size": 1})
+
+    def test_3_update_invalidates_index(self):
+        """
+        Test that updating an index invalidates the index and all cached index lists.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", cache=ResponseCache()) as client:
+            client.index.get("index_1")
+            client.index.list()
+            client.index.list()
+            self.assertEqual(self._count_requests("GET", "/v1.1/indexes?"), 1)
+
+            client.index.update("index_1", "renamed")
+            self.assertEqual(len(client.cache['index']), 0)
+            self.assertEqual(len(client.cache['index_list']), 0)
+
+    def test_4_only_finished_tasks_are_cached(self):
+        """
+        Test that running tasks are always fetched and that deleting a task invalidates it.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", cache=ResponseCache()) as client:
+            for _ in range(2):
+                client.task.get("running")
+                client.task.get("finished")
+            self.assertEqual(self._count_requests("GET", "/v1.1/tasks/running"), 2)
+            self.assertEqual(self._count_requests("GET", "/v1.1/tasks/finished"), 1)
+
+            client.task.delete("finished")
+            client.task.get("finished")
+            self.assertEqual(self._count_requests("GET", "/v1.1/tasks/finished"), 2)
+
+    def test_5_cache_is_opt_in(self):
+        """
+        Test that clients do not cache responses unless a cache is configured.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            self.assertIsNone(client.cache)
+            client.index.get("index_1")
+            client.index.get("index_1")
+        self.assertEqual(self._count_requests("GET", "/v1.1/indexes/"), 2)
+
+        with mock.patch.object(settings, "CACHE_ENABLED", True), TwelveLabsAPIClient(api_key="test") as client:
+            self.assertIsInstance(client.cache, ResponseCache)
+
+    async def test_6_async_get_index_is_cached(self):
+        """
+        Test that the asynchronous client shares the same caching behavior.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test", cache=ResponseCache()) as client:
+            first = await client.index.get("index_1")
+            self.assertEqual(await client.index.get("index_1"), first)
+            await client.index.update("index_1", "renamed")
+            await client.index.get("index_1")
+
+        self.assertEqual(self._count_requests("GET", "/v1.1/indexes/"), 2)
+
+    def test_7_cached_values_are_copies(self):
+        """
+        Test that changing a returned index or list does not change the cache.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", cache=ResponseCache()) as client:
+            client.index.get("index_1").index_name = "changed"
+            client.index.list().clear()
+
+            self.assertEqual(client.index.get("index_1").index_name, INDEX['index_name'])
+            self.assertEqual(len(client.index.list()), 1)
+            self.assertEqual(self._count_requests("GET", "/v1.1/indexes"), 2)
+
+    def test_8_stale_lookup_is_not_stored(self):
+        """
+        Test that a lookup that was in flight when the index was updated does not store its stale result.
+        """
+
+        def get_index(request):
+            client.index.update("index_1", "renamed")
+            return 200, INDEX, {"ETag": '"v1"'}
+
+        self.server.reset()
+        self.server.route("GET", r"/v1.1/indexes/\w+", get_index)
+        self.server.route("PUT", r"/v1.1/indexes/\w+", lambda request: (200, None))
+        with TwelveLabsAPIClient(api_key="test", cache=ResponseCache()) as client:
+            client.index.get("index_1")
+            self.assertEqual(len(client.cache['index']), 0)
+
+        cache = TTLCache(maxsize=2, ttl=60)
+        generation = cache.generation
+        cache.delete("a")
+        cache.set("a", 1, generation=generation)
+        self.assertIsNone(cache.get("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import json
+import time
+import asyncio
+import unittest
+from unittest import mock
+from http.client import HTTPConnection
+from urllib.parse import urlparse
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.testing import MockServer
+from py_twelvelabs.callbacks import CallbackReceiver, SIGNATURE_HEADER, sign_callback, verify_callback, send_callback
+from py_twelvelabs.exceptions import InsufficientParametersError
+
+
+SECRET = "test-secret"
+
+
+class TestCallbacks(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the callback receiver, its signature checks, and task watching driven by notifications from the mock server.
+    """
+
+    def setUp(self):
+        self.receiver = CallbackReceiver(secret=SECRET).start()
+        self.addCleanup(self.receiver.stop)
+        for name, value in (("TASK_WATCHER_MIN_POLLING_INTERVAL", 0.05), ("CALLBACK_FALLBACK_TIMEOUT", 60.0)):
+            patcher = mock.patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _start_server(self, **kwargs) -> MockServer:
+        server = MockServer(**kwargs).start()
+        self.addCleanup(server.stop)
+        patcher = mock.patch.object(settings, "BASE_API_URL", server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return server
+
+    def test_1_signatures(self):
+        """
+        Test that only signatures made with the secret, over the same body and recently, are valid.
+        """
+
+        body = b'{"data": {"_id": "task_1", "status": "ready"}}'
+        signature = sign_callback(body, SECRET)
+
+        self.assertTrue(verify_callback(body, signature, SECRET, max_age=60))
+        self.assertFalse(verify_callback(body + b" ", signature, SECRET, max_age=60))
+        self.assertFalse(verify_callback(body, signature, "other-secret", max_age=60))
+        self.assertFalse(verify_callback(body, sign_callback(body, SECRET, int(time.time()) - 120), SECRET, max_age=60))
+        self.assertFalse(verify_callback(body, None, SECRET, max_age=60))
+        self.assertFalse(verify_callback(body, "garbage", SECRET, max_age=60))
+        with self.assertRaises(InsufficientParametersError):
+            CallbackReceiver(secret="")
+
+    def test_2_receiver(self):
+        """
+        Test that the receiver accepts signed notifications, tells its listeners, and rejects everything else.
+        """
+
+        notifications = []
+        self.receiver.add_listener(lambda task_id, status: notifications.append((task_id, status)))
+
+        self.assertEqual(send_callback(self.receiver.url, {"_id": "task_1", "status": "ready"}, SECRET), 204)
+        self.assertEqual(send_callback(self.receiver.url, {"_id": "task_2", "status": "ready"}, "other-secret"), 401)
+        self.assertEqual(send_callback(self.receiver.url.replace("/callbacks/tasks", "/other"), {"_id": "task_3", "status": "ready"}, SECRET), 404)
+
+        body = json.dumps({"data": {}}).encode()
+        self.assertEqual(self.receiver.handle(self.receiver.path, {SIGNATURE_HEADER: sign_callback(body, SECRET)}, body), 400)
+
+        self.assertEqual(notifications, [("task_1", "ready")])
+        self.assertEqual(self.receiver.get_status("task_1"), "ready")
+        self.assertIsNone(self.receiver.get_status("task_2"))
+        self.assertEqual((self.receiver.notification_count, self.receiver.rejected_count), (1, 1))
+
+    def test_3_create_sync_without_polling(self):
+        """
+        Test that a task waited on with a callback receiver is fetched once, when its notification arrives.
+        """
+
+        server = self._start_server(task_duration=0.5, callback_url=self.receiver.url, callback_secret=SECRET)
+        index_id = server.add_index()
+
+        with TwelveLabsAPIClient(api_key="test", callback_receiver=self.receiver) as client:
+            started_at = time.monotonic()
+            task = client.task.create_sync(index_id, video_url="https://example.com/video.mp4", timeout=10)
+
+        self.assertEqual(task.status, "ready")
+        self.assertLess(time.monotonic() - started_at, 5)
+        self.assertEqual(server.callback_count, 1)
+        self.assertEqual(server.request_count, 2)
+
+    def test_4_fallback_to_polling(self):
+        """
+        Test that tasks are polled once the fallback timeout passes without a notification.
+        """
+
+        server = self._start_server(task_duration=0.5)
+        index_id = server.add_index()
+
+        with mock.patch.object(settings, "CALLBACK_FALLBACK_TIMEOUT", 0.2), TwelveLabsAPIClient(api_key="test", callback_receiver=self.receiver) as client:
+            task = client.task.create_sync(index_id, video_url="https://example.com/video.mp4", timeout=10)
+
+        self.assertEqual(task.status, "ready")
+        self.assertEqual(server.callback_count, 0)
+        self.assertGreater(server.request_count, 2)
+
+    def test_5_notification_before_watch(self):
+        """
+        Test that a task notified before it is watched is polled at once instead of waiting for the fallback timeout.
+        """
+
+        server = self._start_server()
+        task_id = server.add_task(server.add_index(), status="ready")
+        send_callback(self.receiver.url, {"_id": task_id, "status": "ready"}, SECRET)
+
+        with TwelveLabsAPIClient(api_key="test", callback_receiver=self.receiver) as client:
+            task = client.task_watcher.watch(task_id).result(timeout=5)
+
+        self.assertEqual(task.id, task_id)
+
+    async def test_6_async_watch(self):
+        """
+        Test that the asynchronous watcher is woken up by notifications received on another thread.
+        """
+
+        server = self._start_server(task_duration=0.5, callback_url=self.receiver.url, callback_secret=SECRET)
+        index_id = server.add_index()
+
+        async with AsyncTwelveLabsAPIClient(api_key="test", callback_receiver=self.receiver) as client:
+            tasks = [await client.task.create_async(index_id, video_url=f"https://example.com/{i}.mp4") for i in range(3)]
+            futures = [client.task_watcher.watch(task_id, index_id=index_id) for task_id in tasks]
+            results = await asyncio.wait_for(asyncio.gather(*futures), 10)
+
+        self.assertEqual([task.status for task in results], ["ready"] * 3)
+        self.assertEqual(server.callback_count, 3)
+        self.assertLessEqual(server.request_count, 6)
+
+    def test_7_invalid_content_length(self):
+        """
+        Test that notifications with an invalid, negative or too large Content-Length are rejected without being read.
+        """
+
+        url = urlparse(self.receiver.url)
+        body = json.dumps({"data": {"_id": "task_1", "status": "ready"}}).encode()
+
+        def post(content_length: str) -> int:
+            connection = HTTPConnection(url.hostname, url.port, timeout=10)
+            try:
+                connection.putrequest("POST", url.path)
+                connection.putheader("Content-Length", content_length)
+                connection.putheader(SIGNATURE_HEADER, sign_callback(body, SECRET))
+                connection.endheaders(body)
+                return connection.getresponse().status
+            finally:
+                connection.close()
+
+        with mock.patch.object(settings, "CALLBACK_MAX_BODY_SIZE", 16):
+            self.assertEqual(post("abc"), 400)
+            self.assertEqual(post("-1"), 400)
+            self.assertEqual(post(str(len(body))), 413)
+            self.assertEqual(post("16"), 401)
+
+        self.assertEqual(post(str(len(body))), 204)
+        self.assertEqual(self.receiver.notification_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
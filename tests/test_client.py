@@ -0,0 +1,95 @@
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from tests.stub_server import StubServer
+
+
+class TestClient(unittest.TestCase):
+    """
+    Test the HTTP transport of the client against a local stub server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up test fixtures: start the stub server.
+        """
+
+        cls.server = StubServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Tear down test fixtures: stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        """
+        Set up test fixtures for each test: register routes and point the client at the stub server.
+        """
+
+        self.server.reset()
+        self.server.route("GET", r"/v1.1/indexes", lambda request: (200, {}))
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _client_ports(self):
+        return {request.client_port for request in self.server.requests}
+
+    def test_1_connections_are_reused(self):
+        """
+        Test that consecutive requests reuse a single pooled connection.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            for _ in range(5):
+                response = client.submit_request("indexes")
+                self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(len(self._client_ports()), 1)
+
+    def test_2_keep_alive_disabled(self):
+        """
+        Test that disabling keep-alive opens a new connection per request.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", keep_alive=False) as client:
+            for _ in range(3):
+                client.submit_request("indexes")
+
+        self.assertEqual(len(self._client_ports()), 3)
+
+    def test_3_close(self):
+        """
+        Test that closing the client releases the session and that the client can be used again afterwards.
+        """
+
+        client = TwelveLabsAPIClient(api_key="test")
+        client.submit_request("indexes")
+        client.close()
+        self.assertIsNone(client._session)
+
+        response = client.submit_request("indexes")
+        self.assertEqual(response.status_code, 200)
+        client.close()
+
+    def test_4_idle_timeout(self):
+        """
+        Test that connections idle for longer than the idle timeout are discarded.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", idle_timeout=0) as client:
+            client.submit_request("indexes")
+            session = client._session
+            client._last_used_at -= 1
+            client.submit_request("indexes")
+            self.assertIsNot(client._session, session)
+
+
+if __name__ == "__main__":
+    unittest.main()
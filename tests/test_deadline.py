@@ -0,0 +1,156 @@
+import gc
+import time
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+import requests
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.testing import MockServer
+from py_twelvelabs.utilities.retry import RetryPolicy
+from py_twelvelabs.utilities.rate_limiter import RateLimiter
+from py_twelvelabs.utilities.deadline import CancelToken, deadline, get_deadline
+from py_twelvelabs.exceptions import DeadlineExceededError, RequestCancelledError
+from tests.stub_server import StubServer, TASK
+
+
+class TestDeadline(unittest.IsolatedAsyncioTestCase):
+    """
+    Test request timeouts, call deadlines and cancellation against local stub and mock servers.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a stub server with a slow route and a route that asks to be retried in 5 seconds, and a mock server whose
+        tasks take 10 seconds to become ready.
+        """
+
+        cls.release = threading.Event()
+        cls.server = StubServer()
+        cls.server.route("GET", r"/v1.1/tasks/slow", lambda request: (cls.release.wait(1), (200, TASK))[1])
+        cls.server.route("GET", r"/v1.1/tasks/busy", lambda request: (503, {"message": "Try again later"}, {"Retry-After": "5"}))
+        cls.server.start()
+        cls.mock_server = MockServer(task_duration=10).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Release the slow requests, stop the servers once they are answered and collect the responses kept alive by the
+        raised exceptions, so that their connections are closed.
+        """
+
+        cls.release.set()
+        cls.server.stop()
+        cls.mock_server.stop()
+        gc.collect()
+
+    def setUp(self):
+        self.retry_policy = RetryPolicy(max_retries=10, max_backoff=10)
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_1_nested_deadlines(self):
+        """
+        Test that nested scopes keep the earliest deadline and are cancelled by either token.
+        """
+
+        outer_token, inner_token = CancelToken(), CancelToken()
+        with deadline(1, outer_token) as outer:
+            with deadline(10, inner_token) as inner:
+                self.assertEqual(inner.expires_at, outer.expires_at)
+                self.assertIs(get_deadline(), inner)
+                outer_token.cancel()
+                self.assertRaises(RequestCancelledError, inner.check)
+        self.assertIsNone(get_deadline().expires_at)
+
+    def test_2_read_timeout(self):
+        """
+        Test that a stalled response fails after the read timeout.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", read_timeout=0.2, retry_policy=RetryPolicy(max_retries=0)) as client:
+            self.assertRaises(requests.Timeout, client.task.get, "slow")
+
+    def test_3_deadline_caps_request(self):
+        """
+        Test that a deadline shorter than the read timeout ends the request at the deadline.
+        """
+
+        started_at = time.monotonic()
+        with TwelveLabsAPIClient(api_key="test", retry_policy=self.retry_policy) as client, deadline(0.2):
+            self.assertRaises(DeadlineExceededError, client.task.get, "slow")
+        self.assertLess(time.monotonic() - started_at, 0.8)
+
+    def test_4_cancel_during_backoff(self):
+        """
+        Test that cancelling the token wakes up a request waiting to be retried.
+        """
+
+        token = CancelToken()
+        threading.Timer(0.2, token.cancel).start()
+        started_at = time.monotonic()
+        with TwelveLabsAPIClient(api_key="test", retry_policy=self.retry_policy) as client, deadline(cancel_token=token):
+            self.assertRaises(RequestCancelledError, client.task.get, "busy")
+        self.assertLess(time.monotonic() - started_at, 2)
+
+    def test_5_create_sync_timeout(self):
+        """
+        Test that create_sync stops waiting at its timeout and stops watching the task.
+        """
+
+        index_id = self.mock_server.add_index()
+        with mock.patch.object(settings, "BASE_API_URL", self.mock_server.base_url), TwelveLabsAPIClient(api_key="test") as client:
+            self.assertRaises(DeadlineExceededError, client.task.create_sync, index_id, video_url="https://example.com/video.mp4", timeout=0.3)
+            self.assertEqual(client.task_watcher._watched, {})
+
+    async def test_6_async_cancellation(self):
+        """
+        Test that cancelling the token aborts an in-flight asynchronous request and an asynchronous create_sync.
+        """
+
+        token = CancelToken()
+        asyncio.get_running_loop().call_later(0.2, token.cancel)
+        started_at = time.monotonic()
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            with deadline(cancel_token=token):
+                with self.assertRaises(RequestCancelledError):
+                    await client.task.get("slow")
+        self.assertLess(time.monotonic() - started_at, 0.8)
+
+        token = CancelToken()
+        asyncio.get_running_loop().call_later(0.3, token.cancel)
+        index_id = self.mock_server.add_index()
+        with mock.patch.object(settings, "BASE_API_URL", self.mock_server.base_url):
+            async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+                with self.assertRaises(RequestCancelledError):
+                    await client.task.create_sync(index_id, video_url="https://example.com/video.mp4", cancel_token=token)
+                self.assertEqual(client.task_watcher._watched, {})
+
+    def test_7_rate_limiter_wait(self):
+        """
+        Test that waiting for the rate limiter stops at the deadline, and is woken up by the cancel token.
+        """
+
+        task_id = self.mock_server.add_task(self.mock_server.add_index(), status="ready")
+        with mock.patch.object(settings, "BASE_API_URL", self.mock_server.base_url), TwelveLabsAPIClient(api_key="test", rate_limiter=RateLimiter(rates={"tasks": 0.5}, burst=1)) as client:
+            client.task.get(task_id)
+
+            started_at = time.monotonic()
+            with deadline(0.1):
+                self.assertRaises(DeadlineExceededError, client.task.get, task_id)
+            self.assertLess(time.monotonic() - started_at, 0.5)
+
+            token = CancelToken()
+            threading.Timer(0.1, token.cancel).start()
+            with deadline(cancel_token=token):
+                self.assertRaises(RequestCancelledError, client.task.get, task_id)
+            self.assertLess(time.monotonic() - started_at, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import shutil
+import hashlib
+import tempfile
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.testing import MockServer
+from py_twelvelabs.utilities import dedup
+from py_twelvelabs.utilities.dedup import UploadRegistry, hash_file
+
+
+class TestDedup(unittest.IsolatedAsyncioTestCase):
+    """
+    Test that video files whose content was already uploaded to an index are not uploaded again.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a mock server whose tasks are ready as soon as they are created.
+        """
+
+        cls.server = MockServer().start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the mock server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.video_file = self._write("video.mp4", os.urandom(300 * 1024))
+        self.registry = UploadRegistry(os.path.join(self.directory, "uploads.sqlite3"), chunk_size=64 * 1024)
+        self.addCleanup(self.registry.close)
+        self.index_id = self.server.add_index()
+
+    def _write(self, name: str, content: bytes) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def _count_tasks(self, index_id: str) -> int:
+        return sum(task['index_id'] == index_id for task in self.server.tasks.values())
+
+    def test_1_hashing(self):
+        """
+        Test that files are hashed in chunks, and only hashed again when they change.
+        """
+
+        with open(self.video_file, "rb") as file:
+            expected = hashlib.blake2b(file.read(), digest_size=32).hexdigest()
+        self.assertEqual(hash_file(self.video_file, chunk_size=4096), expected)
+
+        with mock.patch.object(dedup, "hash_file", wraps=hash_file) as hash_function:
+            self.assertEqual(self.registry.get_hash(self.video_file), expected)
+            self.assertEqual(self.registry.get_hash(self.video_file), expected)
+            self.assertEqual(hash_function.call_count, 1)
+
+            with open(self.video_file, "ab") as file:
+                file.write(b"more")
+            self.assertNotEqual(self.registry.get_hash(self.video_file), expected)
+            self.assertEqual(hash_function.call_count, 2)
+
+    def test_2_duplicate_uploads_are_skipped(self):
+        """
+        Test that a copy of an uploaded file returns the existing task, while another index or content is uploaded.
+        """
+
+        copy = shutil.copy(self.video_file, os.path.join(self.directory, "copy.mp4"))
+        other_index_id = self.server.add_index()
+
+        with TwelveLabsAPIClient(api_key="test", upload_registry=self.registry) as client:
+            task_id = client.task.create_async(self.index_id, video_file=self.video_file)
+            self.assertEqual(client.task.create_async(self.index_id, video_file=copy), task_id)
+            self.assertNotEqual(client.task.create_async(other_index_id, video_file=copy), task_id)
+            self.assertNotEqual(client.task.create_async(self.index_id, video_file=self._write("other.mp4", b"other")), task_id)
+
+        self.assertEqual(self._count_tasks(self.index_id), 2)
+        self.assertEqual(self._count_tasks(other_index_id), 1)
+        self.assertEqual(len(self.registry), 3)
+
+    def test_3_deleted_and_missing_tasks_are_uploaded_again(self):
+        """
+        Test that the upload is forgotten when its task is deleted, or when the API no longer knows the task.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", upload_registry=self.registry) as client:
+            task_id = client.task.create_async(self.index_id, video_file=self.video_file)
+            client.task.delete(task_id)
+            second_task_id = client.task.create_async(self.index_id, video_file=self.video_file)
+            self.assertNotEqual(second_task_id, task_id)
+
+            del self.server.tasks[second_task_id]
+            third_task_id = client.task.create_async(self.index_id, video_file=self.video_file)
+
+        self.assertNotIn(third_task_id, (task_id, second_task_id))
+        self.assertEqual(self.registry.lookup(self.index_id, self.registry.get_hash(self.video_file))['task_id'], third_task_id)
+
+    def test_4_persistence_and_bulk(self):
+        """
+        Test that uploads are remembered across registries, and that concurrent uploads of the same content are coalesced.
+        """
+
+        copies = [shutil.copy(self.video_file, os.path.join(self.directory, f"copy_{i}.mp4")) for i in range(4)]
+
+        with TwelveLabsAPIClient(api_key="test", upload_registry=self.registry) as client:
+            results = list(client.task.create_bulk(self.index_id, [self.video_file, *copies], max_workers=5))
+        self.assertEqual(len({result.task_id for result in results}), 1)
+        self.assertEqual(self._count_tasks(self.index_id), 1)
+
+        with UploadRegistry(self.registry.path) as registry, TwelveLabsAPIClient(api_key="test", upload_registry=registry) as client:
+            self.assertEqual(client.task.create_async(self.index_id, video_file=copies[0]), results[0].task_id)
+        self.assertEqual(self._count_tasks(self.index_id), 1)
+
+    async def test_5_async_create_async(self):
+        """
+        Test deduplication with the asynchronous client.
+        """
+
+        copy = shutil.copy(self.video_file, os.path.join(self.directory, "copy.mp4"))
+
+        async with AsyncTwelveLabsAPIClient(api_key="test", upload_registry=self.registry) as client:
+            task_id = await client.task.create_async(self.index_id, video_file=self.video_file)
+            self.assertEqual(await client.task.create_async(self.index_id, video_file=copy), task_id)
+
+        self.assertEqual(self._count_tasks(self.index_id), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
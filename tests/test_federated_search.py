@@ -0,0 +1,103 @@
+import time
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from tests.stub_server import StubServer
+
+
+SCORES = {
+    "index_a": [[95.0, 90.0], [70.0, 60.0]],
+    "index_b": [[93.0, 80.0], [79.0, 50.0]],
+    "index_c": [[85.0, 84.0], [83.0, 82.0]],
+}
+
+
+def _page(index_id: str, page_number: int):
+    pages = SCORES[index_id]
+    page_info = {"page": page_number}
+    if page_number < len(pages):
+        page_info["next_page_token"] = f"{index_id}-{page_number + 1}"
+    clips = [{"video_id": f"{index_id}_{page_number}_{i}", "score": score, "start": 0.0, "end": 1.0} for i, score in enumerate(pages[page_number - 1])]
+    return {"data": clips, "page_info": page_info}
+
+
+def _search(request):
+    time.sleep(0.1)
+    return 200, _page(request.json()['index_id'], 1)
+
+
+class TestFederatedSearch(unittest.IsolatedAsyncioTestCase):
+    """
+    Test searching several indexes at once.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a stub server that serves two pages of results for each of three indexes, answering first pages slowly.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("POST", r"/v1.1/search", _search)
+        cls.server.route("GET", r"/v1.1/search/(\w+)-(\d+)", lambda request: (200, _page(request.match.group(1), int(request.match.group(2)))))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_1_results_are_merged_by_score(self):
+        """
+        Test that clips of all indexes are merged by descending score and that first pages are requested concurrently.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            started_at = time.monotonic()
+            iterator = client.search.federated_query(list(SCORES), "query", ["visual"])
+            clips = [next(iterator)]
+            elapsed = time.monotonic() - started_at
+            clips.extend(iterator)
+
+        scores = [clip.score for clip in clips]
+        self.assertEqual(scores, sorted((score for pages in SCORES.values() for page in pages for score in page), reverse=True))
+        self.assertEqual(clips[0].index_id, "index_a")
+        self.assertLess(elapsed, 0.25)
+
+    def test_2_top_k(self):
+        """
+        Test that top_k yields the best clips only and does not consume pages that cannot contain them.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            clips = list(client.search.federated_query(list(SCORES), "query", ["visual"], top_k=3))
+
+        self.assertEqual([(clip.index_id, clip.score) for clip in clips], [("index_a", 95.0), ("index_b", 93.0), ("index_a", 90.0)])
+        self.assertEqual([request.method for request in self.server.requests], ["POST"] * 3)
+
+    async def test_3_async_federated_query(self):
+        """
+        Test the asynchronous federated query.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            clips = [clip async for clip in client.search.federated_query(list(SCORES), "query", ["visual"], top_k=5)]
+
+        self.assertEqual([clip.score for clip in clips], [95.0, 93.0, 90.0, 85.0, 84.0])
+        self.assertEqual(clips[-1].index_id, "index_c")
+        self.assertEqual([request.path for request in self.server.requests if request.method == "GET"], ["/v1.1/search/index_a-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
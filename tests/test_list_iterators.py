@@ -0,0 +1,102 @@
+import unittest
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from tests.stub_server import StubServer, TASK, INDEX
+
+
+TOTAL_ITEMS = 20
+
+
+def _list(item):
+    def handler(request):
+        query = parse_qs(urlparse(request.path).query)
+        page, page_limit = int(query['page'][0]), int(query['page_limit'][0])
+        items = [{**item, "_id": f"{item['_id']}_{i}"} for i in range((page - 1) * page_limit, min(page * page_limit, TOTAL_ITEMS))]
+        return 200, {"data": items, "page_info": {"page": page, "limit_per_page": page_limit, "total_page": -(-TOTAL_ITEMS // page_limit), "total_results": TOTAL_ITEMS}}
+    return handler
+
+
+class TestListIterators(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the auto-paginating index and task iterators against a local stub server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a stub server that lists 20 indexes and 20 tasks.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("GET", r"/v1.1/indexes\?.*", _list(INDEX))
+        cls.server.route("GET", r"/v1.1/tasks\?.*", _list(TASK))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_1_iter_all_yields_every_item_in_order(self):
+        """
+        Test that every task is yielded in order, with and without prefetching.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            for prefetch in (0, 3):
+                tasks = list(client.task.iter_all(page_limit=3, prefetch=prefetch, index_id="index_1"))
+                self.assertEqual([task.id for task in tasks], [f"task_1_{i}" for i in range(TOTAL_ITEMS)])
+
+        self.assertEqual(len(self.server.requests), 14)
+        self.assertTrue(all("index_id=index_1" in request.path for request in self.server.requests))
+
+    def test_2_max_items(self):
+        """
+        Test that max_items bounds the number of indexes yielded and of pages requested.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            indexes = list(client.index.iter_all(page_limit=3, max_items=7, prefetch=5))
+
+        self.assertEqual([index.id for index in indexes], [f"index_1_{i}" for i in range(7)])
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_3_stopping_early(self):
+        """
+        Test that stopping iteration early does not request pages beyond the prefetch window.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            iterator = client.task.iter_all(page_limit=3, prefetch=2)
+            next(iterator)
+            iterator.close()
+
+        self.assertLessEqual(len(self.server.requests), 3)
+
+    async def test_4_async_iter_all(self):
+        """
+        Test the asynchronous iterator with prefetching.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            tasks = [task async for task in client.task.iter_all(page_limit=6, prefetch=2)]
+            indexes = [index async for index in client.index.iter_all(page_limit=6, max_items=10)]
+
+        self.assertEqual(len(tasks), TOTAL_ITEMS)
+        self.assertEqual(len(indexes), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+import unittest
+import subprocess
+
+from py_twelvelabs.utilities.logger import RATE_LIMITED, JsonFormatter, RateLimitFilter, create_queue_handler
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+        self.threads.add(threading.current_thread().name)
+
+
+class TestLogger(unittest.TestCase):
+    """
+    Test the JSON formatter, the rate-limiting filter and the queued logging path.
+    """
+
+    def setUp(self):
+        self.logger = logging.getLogger(f"tests.logger.{self.id()}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.handler = _ListHandler()
+        self.handler.setFormatter(JsonFormatter())
+
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        for log_filter in list(self.logger.filters):
+            self.logger.removeFilter(log_filter)
+
+    def test_1_json_records(self):
+        """
+        Test that records are written as JSON objects with their extra fields and exception.
+        """
+
+        self.logger.addHandler(self.handler)
+        self.logger.info("Task %s is %s.", "task_1", "indexing", extra={"task_id": "task_1", "interval": 2.5})
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            self.logger.exception("Callback failed.")
+
+        first, second = (json.loads(line) for line in self.handler.lines)
+        self.assertEqual(first['message'], "Task task_1 is indexing.")
+        self.assertEqual(first['level'], "INFO")
+        self.assertEqual(first['task_id'], "task_1")
+        self.assertEqual(first['interval'], 2.5)
+        self.assertNotIn("args", first)
+        self.assertIn("RuntimeError: boom", second['exc_info'])
+
+    def test_2_rate_limit(self):
+        """
+        Test that repeated rate-limited templates are dropped within the interval and counted, while warnings and
+        records that are not marked as rate-limited always pass.
+        """
+
+        self.logger.addHandler(self.handler)
+        log_filter = RateLimitFilter(interval=60)
+        self.logger.addFilter(log_filter)
+
+        for i in range(5):
+            self.logger.debug("Task %s will be polled again.", f"task_{i}", extra=RATE_LIMITED)
+        self.logger.debug("Another message.", extra=RATE_LIMITED)
+        self.logger.warning("Task %s will be polled again.", "task_5", extra=RATE_LIMITED)
+        self.logger.info("Task %s completed.", "task_6")
+        self.logger.info("Task %s completed.", "task_7")
+        self.assertEqual([json.loads(line)['message'] for line in self.handler.lines], ["Task task_0 will be polled again.", "Another message.", "Task task_5 will be polled again.", "Task task_6 completed.", "Task task_7 completed."])
+        self.assertNotIn("rate_limited", json.loads(self.handler.lines[0]))
+
+        log_filter.interval = 0
+        self.logger.debug("Task %s will be polled again.", "task_8", extra=RATE_LIMITED)
+        self.assertEqual(json.loads(self.handler.lines[-1])['suppressed'], 4)
+
+    def test_3_queue_handler(self):
+        """
+        Test that queued records are formatted and written by the listener thread, in order.
+        """
+
+        queue_handler = create_queue_handler(self.handler)
+        self.logger.addHandler(queue_handler)
+        for i in range(100):
+            self.logger.info("Message %d.", i, extra={"index": i})
+
+        self.logger.info("Last message.")
+        deadline = time.monotonic() + 5
+        while len(self.handler.lines) < 101 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertEqual([json.loads(line).get('index') for line in self.handler.lines], list(range(100)) + [None])
+        self.assertNotIn(threading.current_thread().name, self.handler.threads)
+
+    def test_4_configured_from_settings(self):
+        """
+        Test that the settings switch the console logging to queued JSON records, and rate-limit the package's repetitive messages.
+        """
+
+        script = (
+            "import logging\n"
+            "from py_twelvelabs.utilities.logger import RATE_LIMITED, get_logger\n"
+            "logger = get_logger('py_twelvelabs.watcher')\n"
+            "logging.getLogger('py_twelvelabs').setLevel(logging.INFO)\n"
+            "for i in range(50):\n"
+            "    logger.warning('Task %s will be polled again.', i, extra=RATE_LIMITED)\n"
+            "    logger.info('Task %s will be polled again.', i, extra={'task_id': str(i), **RATE_LIMITED})\n"
+            "    logger.info('Task %s completed.', i, extra={'task_id': str(i)})\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.getcwd(), "LOG_FORMAT": "json", "LOG_QUEUE_ENABLED": "true", "LOG_RATE_LIMIT_INTERVAL": "60"}
+        output = subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True).stderr
+
+        records = [json.loads(line) for line in output.strip().splitlines()]
+        warnings = [record for record in records if record['level'] == "WARNING"]
+        polls = [record for record in records if record['level'] == "INFO" and "polled" in record['message']]
+        completions = [record for record in records if record['level'] == "INFO" and "completed" in record['message']]
+        self.assertEqual(len(warnings), 50)
+        self.assertEqual([record['task_id'] for record in polls], ["0"])
+        self.assertEqual(len(completions), 50)
+        self.assertTrue(all(record['logger'] == "py_twelvelabs.watcher" for record in records))
+
+
+if __name__ == "__main__":
+    unittest.main()
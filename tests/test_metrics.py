@@ -0,0 +1,160 @@
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.retry import RetryPolicy
+from py_twelvelabs.utilities.metrics import Metrics, MetricEvent, OpenTelemetryHook, trace, _current_phases
+from py_twelvelabs.utilities.rate_limiter import RateLimiter
+from py_twelvelabs.utilities.deadline import deadline
+from py_twelvelabs.exceptions import DeadlineExceededError
+from py_twelvelabs.utilities.endpoints import get_endpoint_route
+from tests.stub_server import StubServer, TASK, INDEX
+
+
+class TestMetrics(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the timing events and aggregated metrics of API calls against a local stub server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a stub server that answers task and index requests, failing a configurable number of task requests first.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("GET", r"/v1.1/tasks/\w+", lambda request: cls._respond(TASK))
+        cls.server.route("GET", r"/v1.1/indexes\?.*", lambda request: (200, {"data": [INDEX] * 3, "page_info": {"page": 1, "total_page": 1}}))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the stub server.
+        """
+
+        cls.server.stop()
+
+    @classmethod
+    def _respond(cls, payload):
+        if cls.failures > 0:
+            cls.failures -= 1
+            return 503, {"message": "Try again later"}, {"Retry-After": "0"}
+        return 200, payload
+
+    def setUp(self):
+        TestMetrics.failures = 0
+        self.events = []
+        self.metrics = Metrics(hooks=[self.events.append])
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_1_endpoint_route(self):
+        """
+        Test that IDs are removed from endpoint routes.
+        """
+
+        self.assertEqual(get_endpoint_route("tasks/task_1"), "tasks/{id}")
+        self.assertEqual(get_endpoint_route("tasks/status?index_id=index_1"), "tasks/status")
+        self.assertEqual(get_endpoint_route("indexes"), "indexes")
+
+    def test_2_request_phases(self):
+        """
+        Test that a request emits its phases, decoding and parsing, with the connect phase only on a new connection.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", metrics=self.metrics) as client:
+            client.task.get("task_1")
+            client.task.get("task_1")
+
+        requests = [event for event in self.events if event.name == "request"]
+        self.assertEqual([event.name for event in self.events], ["request", "decode", "parse"] * 2)
+        self.assertTrue(all(event.endpoint == "tasks/{id}" and event.method == "GET" and event.status == "200" for event in requests))
+        self.assertEqual(set(requests[0].phases), {"queue", "connect", "ttfb", "download"})
+        self.assertEqual(set(requests[1].phases), {"queue", "ttfb", "download"})
+        self.assertLessEqual(sum(requests[0].phases.values()), requests[0].duration)
+
+    def test_3_retries_and_aggregates(self):
+        """
+        Test that every attempt of a retried request is counted under its status and exported.
+        """
+
+        TestMetrics.failures = 2
+        with TwelveLabsAPIClient(api_key="test", metrics=self.metrics, retry_policy=RetryPolicy(max_retries=3, backoff_factor=0)) as client:
+            client.task.get("task_1")
+            client.index.list()
+
+        self.assertEqual([(event.status, event.attempt) for event in self.events if event.name == "request" and event.endpoint == "tasks/{id}"], [("503", 1), ("503", 2), ("200", 3)])
+        stats = self.metrics.get_stats()
+        self.assertEqual(stats[("request", "tasks/{id}", "GET", "503", "total")]['count'], 2)
+        self.assertEqual(stats[("parse", "indexes", "GET", "", "total")]['count'], 1)
+
+        text = self.metrics.render()
+        self.assertIn('twelvelabs_requests_total{endpoint="tasks/{id}",method="GET",status="503"} 2', text)
+        self.assertIn('twelvelabs_request_duration_seconds_count{endpoint="indexes",method="GET",status="200",phase="ttfb"} 1', text)
+        self.assertIn('twelvelabs_parse_duration_seconds_bucket{endpoint="indexes",method="GET",phase="total",le="+Inf"} 1', text)
+
+    def test_4_failing_hooks_and_disabled_metrics(self):
+        """
+        Test that a failing hook does not fail the request, and that disabled metrics record nothing.
+        """
+
+        self.metrics.add_hook(mock.Mock(side_effect=ValueError("failed")))
+        with TwelveLabsAPIClient(api_key="test", metrics=self.metrics) as client:
+            client.task.get("task_1")
+        self.assertEqual(len(self.events), 3)
+
+        metrics = Metrics(hooks=[self.events.append], enabled=False)
+        with TwelveLabsAPIClient(api_key="test", metrics=metrics) as client:
+            client.task.get("task_1")
+        self.assertEqual(len(self.events), 3)
+        self.assertEqual(metrics.get_stats(), {})
+
+    async def test_5_async_request_phases(self):
+        """
+        Test that the asynchronous client records its phases from the httpx trace.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test", metrics=self.metrics) as client:
+            await client.task.get("task_1")
+
+        self.assertEqual(set(self.events[0].phases), {"queue", "connect", "ttfb", "download"})
+        self.assertEqual([event.name for event in self.events], ["request", "decode", "parse"])
+
+    @unittest.skipIf(trace is None, "opentelemetry-api is not installed")
+    def test_6_opentelemetry_hook(self):
+        """
+        Test that events are reported as spans with their timing.
+        """
+
+        tracer = mock.Mock()
+        OpenTelemetryHook(tracer)(MetricEvent("request", "tasks/{id}", "GET", 0.5, 200, {"ttfb": 0.4}, started_at=10 ** 9))
+
+        tracer.start_span.assert_called_once()
+        self.assertEqual(tracer.start_span.call_args.kwargs['attributes']['twelvelabs.phase.ttfb'], 0.4)
+        tracer.start_span.return_value.end.assert_called_once_with(end_time=15 * 10 ** 8)
+
+    async def test_7_deadline_while_queued(self):
+        """
+        Test that a request whose deadline passes while it waits for the rate limiter is still recorded, and leaves no phases behind.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", metrics=self.metrics, rate_limiter=RateLimiter(rates={"tasks": 0.5}, burst=1)) as client:
+            client.submit_request("tasks/task_1")
+            with deadline(0.05):
+                self.assertRaises(DeadlineExceededError, client.submit_request, "tasks/task_1")
+
+        async with AsyncTwelveLabsAPIClient(api_key="test", metrics=self.metrics, rate_limiter=RateLimiter(rates={"tasks": 0.5}, burst=1)) as client:
+            await client.submit_request("tasks/task_1")
+            with deadline(0.05):
+                with self.assertRaises(DeadlineExceededError):
+                    await client.submit_request("tasks/task_1")
+
+        self.assertIsNone(_current_phases.get())
+        self.assertEqual([(event.status_code, type(event.error)) for event in self.events], [(200, type(None)), (None, DeadlineExceededError)] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
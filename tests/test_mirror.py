@@ -0,0 +1,141 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.testing import MockServer
+from py_twelvelabs.mirror import MetadataMirror, AsyncMetadataMirror
+
+
+class TestMirror(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the local metadata mirror of indexes and tasks against the mock server.
+    """
+
+    def setUp(self):
+        self.server = MockServer().start()
+        self.addCleanup(self.server.stop)
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "mirror.sqlite3")
+
+        self.index_ids = [self.server.add_index(f"index_{i}") for i in range(2)]
+        self.task_ids = []
+        for i in range(30):
+            task_id = self.server.add_task(self.index_ids[i % 2], status="ready")
+            self.server.tasks[task_id]['metadata'] = {"filename": f"video_{i}.mp4", "duration": float(10 * i), "width": 1920 if i % 3 else 1280, "height": 1080 if i % 3 else 720}
+            self.server.tasks[task_id]['updated_at'] = self._format(datetime.utcnow() - timedelta(minutes=30 - i))
+            self.task_ids.append(task_id)
+
+    @staticmethod
+    def _format(value: datetime) -> str:
+        return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+    def _touch(self, task_id: str, **metadata):
+        task = self.server.tasks[task_id]
+        task['metadata'] = {**task['metadata'], **metadata}
+        task['updated_at'] = self._format(datetime.utcnow())
+
+    def test_1_full_sync_and_queries(self):
+        """
+        Test that a first sync mirrors every index and task, and that tasks can be filtered locally.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client, MetadataMirror(client, self.path) as mirror:
+            result = mirror.sync()
+
+            self.assertEqual((result.indexes, result.tasks, result.removed), (2, 30, 0))
+            self.assertEqual(mirror.get_task(self.task_ids[4]), client.task.get(self.task_ids[4]))
+            self.assertEqual(mirror.get_index(self.index_ids[1]).index_name, "index_1")
+            self.assertEqual([index.id for index in mirror.find_indexes(index_name="index_0")], [self.index_ids[0]])
+
+            self.assertEqual([task.id for task in mirror.find_tasks(filename="video_7.mp4")], [self.task_ids[7]])
+            self.assertEqual(mirror.count_tasks(index_id=self.index_ids[0]), 15)
+            self.assertEqual(mirror.count_tasks(width=1280, height=720), 10)
+            tasks = mirror.find_tasks(index_id=self.index_ids[1], min_duration=100, max_duration=200, sort_by="duration", sort_option="asc")
+            self.assertEqual([task.metadata['duration'] for task in tasks], [110.0, 130.0, 150.0, 170.0, 190.0])
+            self.assertEqual(len(mirror.find_tasks(limit=5, offset=28)), 2)
+            with self.assertRaises(ValueError):
+                mirror.find_tasks(sort_by="metadata")
+
+    def test_2_incremental_sync(self):
+        """
+        Test that a sync only lists what changed since the previous one.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client, MetadataMirror(client, self.path) as mirror:
+            mirror.sync()
+            requests_before = self.server.request_count
+
+            self._touch(self.task_ids[3], filename="renamed.mp4")
+            new_task_id = self.server.add_task(self.index_ids[0], status="ready")
+            self._touch(new_task_id)
+            result = mirror.sync()
+
+            self.assertEqual(result.tasks, 2)
+            self.assertLessEqual(self.server.request_count - requests_before, 2)
+            self.assertEqual(mirror.get_task(self.task_ids[3]).metadata['filename'], "renamed.mp4")
+            self.assertEqual(mirror.find_tasks(filename="video_3.mp4"), [])
+            self.assertIsNotNone(mirror.get_task(new_task_id))
+            self.assertEqual(mirror.count_tasks(), 31)
+
+    def test_3_full_sync_removes_deleted(self):
+        """
+        Test that only a full sync removes deleted indexes and tasks.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client, MetadataMirror(client, self.path) as mirror:
+            mirror.sync()
+            del self.server.tasks[self.task_ids[0]]
+            del self.server.indexes[self.index_ids[1]]
+            for task_id in self.task_ids[1::2]:
+                del self.server.tasks[task_id]
+
+            self.assertEqual(mirror.sync().removed, 0)
+            self.assertEqual(mirror.count_tasks(), 30)
+
+            result = mirror.sync(full=True)
+            self.assertEqual(result.removed, 17)
+            self.assertEqual(mirror.count_tasks(), 14)
+            self.assertIsNone(mirror.get_index(self.index_ids[1]))
+
+    def test_4_persistence(self):
+        """
+        Test that a reopened mirror keeps its data and resumes syncing from where it stopped.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            with MetadataMirror(client, self.path) as mirror:
+                mirror.sync()
+                watermark, synced_at = mirror.get_last_sync("tasks")
+
+            with MetadataMirror(client, self.path) as mirror:
+                self.assertEqual(mirror.count_tasks(), 30)
+                self.assertEqual(mirror.get_last_sync("tasks")[0], watermark)
+                self.assertEqual(mirror.sync().tasks, 0)
+
+    async def test_5_async_sync(self):
+        """
+        Test syncing with the asynchronous client.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client, AsyncMetadataMirror(client, ":memory:") as mirror:
+            result = await mirror.sync()
+            self._touch(self.task_ids[5], duration=5.0)
+            incremental = await mirror.sync()
+
+            self.assertEqual((result.indexes, result.tasks), (2, 30))
+            self.assertEqual(incremental.tasks, 1)
+            self.assertEqual(mirror.find_tasks(duration=5.0)[0].id, self.task_ids[5])
+
+
+if __name__ == "__main__":
+    unittest.main()
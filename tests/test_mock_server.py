@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.testing import MockServer
+from py_twelvelabs.utilities.retry import RetryPolicy
+
+
+class TestMockServer(unittest.TestCase):
+    """
+    Test the client against the local mock server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a mock server whose tasks take half a second to become ready.
+        """
+
+        cls.server = MockServer(task_duration=0.5, search_result_count=25, seed=0).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the mock server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.error_rate = 0.0
+        for name, value in (("BASE_API_URL", self.server.base_url), ("TASK_WATCHER_MIN_POLLING_INTERVAL", 0.05)):
+            patcher = mock.patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_1_indexes(self):
+        """
+        Test creating, getting, listing, updating and deleting an index.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            index_id = client.index.create(index_name="test_index", index_options=["visual"])
+            client.index.update(index_id, index_name="renamed_index")
+            self.assertEqual(client.index.get(index_id).index_name, "renamed_index")
+            self.assertIn(index_id, [index.id for index in client.index.iter_all(page_limit=1)])
+            client.index.delete(index_id)
+
+        self.assertNotIn(index_id, self.server.indexes)
+
+    def test_2_upload_and_poll(self):
+        """
+        Test that an uploaded video becomes a task that is polled until it is ready.
+        """
+
+        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as video_file:
+            video_file.write(os.urandom(256 * 1024))
+        self.addCleanup(os.remove, video_file.name)
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            index_id = client.index.create(index_name="test_index", index_options=["visual"])
+            task = client.task.create_sync(index_id, video_file=video_file.name)
+
+        self.assertEqual(task.status, "ready")
+        self.assertEqual(task.index_id, index_id)
+        self.assertEqual(task.metadata['filename'], os.path.basename(video_file.name))
+
+    def test_3_search_pagination(self):
+        """
+        Test that every search result is reached by following the page tokens.
+        """
+
+        index_id = self.server.add_index()
+        with TwelveLabsAPIClient(api_key="test") as client:
+            clips = list(client.search.iter_query(index_id, "query", ["visual"], page_limit=10, as_clips=True))
+
+        self.assertEqual(len(clips), 25)
+        self.assertEqual([clip.score for clip in clips], sorted((clip.score for clip in clips), reverse=True))
+
+    def test_4_injected_errors_are_retried(self):
+        """
+        Test that injected errors are retried until the request succeeds.
+        """
+
+        task_id = self.server.add_task(self.server.add_index(), status="ready")
+        self.server.error_rate = 0.5
+        with TwelveLabsAPIClient(api_key="test", retry_policy=RetryPolicy(max_retries=20, backoff_factor=0)) as client:
+            tasks = [client.task.get(task_id) for _ in range(10)]
+
+        self.assertTrue(all(task.id == task_id for task in tasks))
+
+
+if __name__ == "__main__":
+    unittest.main()
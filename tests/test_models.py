@@ -0,0 +1,51 @@
+import unittest
+from datetime import datetime
+
+from py_twelvelabs.models import Task, Index, Clip
+from py_twelvelabs.utilities.dates import parse_datetime
+from tests.stub_server import TASK, INDEX
+
+
+class TestModels(unittest.TestCase):
+    """
+    Test model construction from API responses.
+    """
+
+    def test_1_parse_datetime(self):
+        """
+        Test that API timestamps with and without fractional seconds, and with an offset, are parsed into naive UTC datetimes.
+        """
+
+        self.assertEqual(parse_datetime("2024-01-01T10:00:00.123Z"), datetime(2024, 1, 1, 10, 0, 0, 123000))
+        self.assertEqual(parse_datetime("2024-01-01T10:00:00Z"), datetime(2024, 1, 1, 10))
+        self.assertEqual(parse_datetime("2024-01-01T12:00:00+02:00"), datetime(2024, 1, 1, 10))
+        with self.assertRaises(ValueError):
+            parse_datetime("01/01/2024")
+
+    def test_2_models_parse_dates(self):
+        """
+        Test that tasks and indexes parse their timestamps and keep their IDs.
+        """
+
+        task = Task(**{**TASK, "estimated_time": "2024-01-01T00:05:00Z"})
+        index = Index(**INDEX)
+
+        self.assertEqual(task.estimated_time, datetime(2024, 1, 1, 0, 5))
+        self.assertEqual(index.expires_at, datetime(2024, 4, 1))
+        self.assertEqual((task.id, index.id), ("task_1", "index_1"))
+
+    def test_3_clip(self):
+        """
+        Test that clips are built from search results and have no per-instance dict.
+        """
+
+        data = {"video_id": "video_1", "score": 84.5, "start": 10.0, "end": 15.5, "confidence": "high"}
+        clip = Clip.from_api(data)
+
+        self.assertEqual((clip.video_id, clip.score, clip.start, clip.end, clip.confidence), ("video_1", 84.5, 10.0, 15.5, "high"))
+        self.assertEqual(Clip.from_api(clip.to_dict()), clip)
+        self.assertFalse(hasattr(clip, "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
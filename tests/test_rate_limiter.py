@@ -0,0 +1,111 @@
+import os
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.rate_limiter import TokenBucket, FileTokenBucket, RateLimiter, fcntl
+from tests.stub_server import StubServer, TASK
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the client-side rate limiter.
+    """
+
+    def test_1_token_bucket(self):
+        """
+        Test that reservations beyond the burst capacity are spaced out at the configured rate.
+        """
+
+        bucket = TokenBucket(rate=10, capacity=2)
+        waits = [bucket.reserve() for _ in range(5)]
+
+        self.assertEqual(waits[:2], [0, 0])
+        for expected, wait in zip([0.1, 0.2, 0.3], waits[2:]):
+            self.assertAlmostEqual(wait, expected, delta=0.01)
+
+    @unittest.skipIf(fcntl is None, "Requires fcntl.")
+    def test_2_file_token_bucket_is_shared(self):
+        """
+        Test that buckets backed by the same file, as in separate processes, share their tokens.
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bucket.json")
+            first, second = FileTokenBucket(path, rate=10, capacity=1), FileTokenBucket(path, rate=10, capacity=1)
+            waits = [first.reserve(), second.reserve(), first.reserve()]
+
+        self.assertEqual(waits[0], 0)
+        self.assertAlmostEqual(waits[1], 0.1, delta=0.01)
+        self.assertAlmostEqual(waits[2], 0.2, delta=0.01)
+
+    def test_3_endpoint_classes(self):
+        """
+        Test that endpoint classes are limited independently and that unconfigured classes are not limited.
+        """
+
+        rate_limiter = RateLimiter(rates={"search": 1, "tasks": 1}, burst=0)
+        self.assertEqual(rate_limiter.reserve("search"), 0)
+        self.assertEqual(rate_limiter.reserve("tasks/task_1"), 0)
+        self.assertGreater(rate_limiter.reserve("search/token"), 0)
+        self.assertEqual(rate_limiter.reserve("indexes"), 0)
+
+    def test_4_client_is_rate_limited(self):
+        """
+        Test that client requests wait for the rate limiter.
+        """
+
+        server = StubServer()
+        server.route("GET", r"/v1.1/tasks/\w+", lambda request: (200, TASK))
+        server.start()
+        self.addCleanup(server.stop)
+
+        with mock.patch.object(settings, "BASE_API_URL", server.base_url):
+            with TwelveLabsAPIClient(api_key="test", rate_limiter=RateLimiter(rates={"tasks": 50}, burst=0)) as client:
+                started_at = time.monotonic()
+                for _ in range(6):
+                    client.task.get("task_1")
+                elapsed = time.monotonic() - started_at
+
+        self.assertGreaterEqual(elapsed, 0.09)
+
+    async def test_5_acquire_async(self):
+        """
+        Test that asynchronous callers wait for their turn.
+        """
+
+        rate_limiter = RateLimiter(rates={"search": 50}, burst=0)
+        started_at = time.monotonic()
+        for _ in range(4):
+            await rate_limiter.acquire_async("search")
+
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.05)
+
+    @unittest.skipIf(fcntl is None, "Requires fcntl.")
+    async def test_6_acquire_async_file_backend(self):
+        """
+        Test that asynchronous callers lock the state files of the file backend outside the event loop thread.
+        """
+
+        threads = []
+        reserve = FileTokenBucket.reserve
+
+        def record_thread(bucket):
+            threads.append(threading.current_thread())
+            return reserve(bucket)
+
+        with tempfile.TemporaryDirectory() as directory, mock.patch.object(FileTokenBucket, "reserve", record_thread):
+            rate_limiter = RateLimiter(rates={"search": 50}, burst=0, backend="file", directory=directory)
+            for _ in range(2):
+                await rate_limiter.acquire_async("search")
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.current_thread(), threads)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.resumable import ResumableUpload
+from py_twelvelabs.exceptions import ResumableUploadError
+from tests.stub_server import StubServer
+
+
+PART_SIZE = 100 * 1024
+
+
+class TestResumableUpload(unittest.TestCase):
+    """
+    Test resumable uploads against a local stub staging server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up test fixtures: start a stub server that stores parts and can be told to fail some of them.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("PUT", r"/upload/(\d+)", cls._put_part)
+        cls.server.route("POST", r"/complete", lambda request: (200, {}))
+        cls.server.route("POST", r"/v1.1/tasks", lambda request: (201, {"_id": "task_1"}))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Tear down test fixtures: stop the stub server.
+        """
+
+        cls.server.stop()
+
+    @classmethod
+    def _put_part(cls, request):
+        part_number = int(request.match.group(1))
+        if cls.failures.get(part_number, 0) > 0:
+            cls.failures[part_number] -= 1
+            return 500, {"message": "Internal error"}
+        start = int(request.headers["Content-Range"].split(" ")[1].split("-")[0])
+        cls.parts[start] = request.body
+        return 200, None, {"ETag": f"etag-{part_number}"}
+
+    def setUp(self):
+        """
+        Set up test fixtures for each test: write a random file and point the client at the stub server.
+        """
+
+        self.server.requests.clear()
+        TestResumableUpload.parts = {}
+        TestResumableUpload.failures = {}
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.video_file = os.path.join(directory.name, "video.mp4")
+        self.video_bytes = os.urandom(PART_SIZE * 10 + 123)
+        with open(self.video_file, "wb") as file:
+            file.write(self.video_bytes)
+        self.state_file = f"{self.video_file}.upload.json"
+
+        for name, value in [("BASE_API_URL", self.server.base_url), ("RESUMABLE_UPLOAD_BACKOFF_FACTOR", 0)]:
+            patcher = mock.patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _part_url(self, part_number):
+        return f"{self.server.base_url}/upload/{part_number}"
+
+    def _uploaded_bytes(self):
+        return b"".join(body for _, body in sorted(self.parts.items()))
+
+    def _count_part_requests(self, part_number):
+        return len([request for request in self.server.requests if request.path == f"/upload/{part_number}"])
+
+    def test_1_failed_parts_are_retried_alone(self):
+        """
+        Test that only failed parts are sent again.
+        """
+
+        self.failures[3] = 2
+        parts = ResumableUpload(self.video_file, self._part_url, part_size=PART_SIZE).upload()
+
+        self.assertEqual(len(parts), 11)
+        self.assertEqual(parts[2], {"part_number": 3, "etag": "etag-3"})
+        self.assertEqual(self._uploaded_bytes(), self.video_bytes)
+        self.assertEqual(self._count_part_requests(3), 3)
+        self.assertEqual(self._count_part_requests(4), 1)
+        self.assertFalse(os.path.exists(self.state_file))
+
+    def test_2_resume_after_restart(self):
+        """
+        Test that an interrupted upload resumes from its state file with a new uploader.
+        """
+
+        self.failures[5] = 1
+        with self.assertRaises(ResumableUploadError):
+            ResumableUpload(self.video_file, self._part_url, part_size=PART_SIZE, max_retries=0).upload()
+
+        with open(self.state_file) as file:
+            self.assertNotIn("5", json.load(file)["completed_parts"])
+
+        upload = ResumableUpload(self.video_file, self._part_url, part_size=PART_SIZE)
+        self.assertEqual(upload.get_pending_parts(), [5])
+        upload.upload()
+
+        self.assertEqual(self._uploaded_bytes(), self.video_bytes)
+        self.assertEqual(self._count_part_requests(1), 1)
+
+    def test_3_create_resumable(self):
+        """
+        Test creating a task from a resumable upload.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            task_id = client.task.create_resumable("index_1", self.video_file, upload_url=self._part_url, video_url="https://example.com/video.mp4", complete_url=f"{self.server.base_url}/complete", part_size=PART_SIZE)
+
+        self.assertEqual(task_id, "task_1")
+        self.assertEqual(len(self.server.requests[-2].json()["parts"]), 11)
+        self.assertIn(b"https://example.com/video.mp4", self.server.requests[-1].body)
+
+
+if __name__ == "__main__":
+    unittest.main()
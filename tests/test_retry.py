@@ -0,0 +1,146 @@
+import time
+import unittest
+from unittest import mock
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.utilities.retry import RetryPolicy
+from tests.stub_server import StubServer, TASK
+
+
+class TestRetry(unittest.IsolatedAsyncioTestCase):
+    """
+    Test request retries against a local stub server that fails a configurable number of times.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up test fixtures: start the stub server.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("GET", r"/v1.1/tasks/\w+", lambda request: cls._respond(200, TASK))
+        cls.server.route("POST", r"/v1.1/indexes", lambda request: cls._respond(201, {"_id": "index_1"}))
+        cls.server.route("POST", r"/v1.1/search", lambda request: cls._respond(200, {"data": [], "page_info": {}}))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Tear down test fixtures: stop the stub server.
+        """
+
+        cls.server.stop()
+
+    @classmethod
+    def _respond(cls, status, payload):
+        if cls.failures > 0:
+            cls.failures -= 1
+            return cls.failure_status, {"message": "Try again later"}, {"Retry-After": cls.retry_after}
+        return status, payload
+
+    def setUp(self):
+        """
+        Set up test fixtures for each test: reset the failure count and point the client at the stub server.
+        """
+
+        self.server.requests.clear()
+        TestRetry.failures = 0
+        TestRetry.failure_status = 503
+        TestRetry.retry_after = "0"
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.retry_policy = RetryPolicy(max_retries=3, backoff_factor=0)
+
+    def test_1_backoff(self):
+        """
+        Test the backoff bounds and Retry-After parsing.
+        """
+
+        retry_policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+        self.assertTrue(all(0 <= retry_policy.get_backoff(retry_number) <= min(2 ** (retry_number - 1), 5) for retry_number in range(1, 10)))
+        self.assertEqual(retry_policy.get_backoff(1, "3"), 3)
+        self.assertEqual(retry_policy.get_backoff(1, "100"), 100)
+        self.assertFalse(retry_policy.can_retry(1, time.monotonic(), 100))
+
+        retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+        self.assertAlmostEqual(RetryPolicy.parse_retry_after(retry_at), 60, delta=2)
+        self.assertIsNone(RetryPolicy.parse_retry_after("soon"))
+
+    def test_2_get_is_retried(self):
+        """
+        Test that a GET failing with a retryable status succeeds after retries.
+        """
+
+        TestRetry.failures = 2
+        with TwelveLabsAPIClient(api_key="test", retry_policy=self.retry_policy) as client:
+            task = client.task.get("task_1")
+
+        self.assertEqual(task.id, "task_1")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_3_unsafe_post_is_not_retried(self):
+        """
+        Test that a POST that creates a resource is not retried, while a search POST is.
+        """
+
+        TestRetry.failures = 1
+        with TwelveLabsAPIClient(api_key="test", retry_policy=self.retry_policy) as client:
+            response = client.submit_request("indexes", method="POST", data={})
+            self.assertEqual(response.status_code, 503)
+
+            TestRetry.failures = 1
+            TestRetry.failure_status = 429
+            client.search.query("index_1", "query", ["visual"])
+
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_4_retries_are_bounded(self):
+        """
+        Test that the last failed response is returned once retries are exhausted, and that per-endpoint overrides apply.
+        """
+
+        TestRetry.failures = 10
+        with TwelveLabsAPIClient(api_key="test", retry_policy=self.retry_policy) as client:
+            self.assertEqual(client.submit_request("tasks/task_1").status_code, 503)
+        self.assertEqual(len(self.server.requests), 4)
+
+        self.server.requests.clear()
+        retry_policy = RetryPolicy(max_retries=3, backoff_factor=0, endpoint_overrides={"tasks": {"max_retries": 1}})
+        with TwelveLabsAPIClient(api_key="test", retry_policy=retry_policy) as client:
+            self.assertEqual(client.submit_request("tasks/task_1").status_code, 503)
+        self.assertEqual(len(self.server.requests), 2)
+
+    async def test_5_async_get_is_retried(self):
+        """
+        Test retries with the asynchronous client.
+        """
+
+        TestRetry.failures = 2
+        async with AsyncTwelveLabsAPIClient(api_key="test", retry_policy=self.retry_policy) as client:
+            task = await client.task.get("task_1")
+
+        self.assertEqual(task.id, "task_1")
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_6_long_retry_after_is_not_shortened(self):
+        """
+        Test that a Retry-After beyond the maximum backoff returns the response instead of retrying early.
+        """
+
+        TestRetry.failures = 10
+        TestRetry.failure_status = 429
+        TestRetry.retry_after = "120"
+        started_at = time.monotonic()
+        with TwelveLabsAPIClient(api_key="test", retry_policy=RetryPolicy(max_retries=3, max_backoff=30)) as client:
+            self.assertEqual(client.submit_request("tasks/task_1").status_code, 429)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertLess(time.monotonic() - started_at, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import time
+from datetime import datetime
+import tempfile
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.callbacks import CallbackReceiver, send_callback
+from py_twelvelabs.utilities.search_cache import SearchCache
+from tests.stub_server import StubServer, TASK
+
+
+RESULT = {"data": [{"video_id": "video_1", "score": 90.0}], "page_info": {"page": 1}}
+
+
+class TestSearchCache(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the search result cache.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a stub server that serves search results and a ready task.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("POST", r"/v1.1/search", lambda request: (200, RESULT))
+        cls.server.route("GET", r"/v1.1/tasks/\w+", lambda request: (200, cls.task))
+        cls.server.route("GET", r"/v1.1/tasks(\?.*)?", lambda request: (200, {"data": [cls.task], "page_info": {"page": 1, "total_page": 1}}))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        TestSearchCache.task = TASK
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _count_searches(self):
+        return len([request for request in self.server.requests if request.method == "POST"])
+
+    def test_1_equivalent_requests_share_a_key(self):
+        """
+        Test that parameter order, search option order, query whitespace and omitted parameters do not change the key.
+        """
+
+        key = SearchCache.get_key({"index_id": "index_1", "query": "a dog", "search_options": ["visual", "conversation"], "group_by": None})
+        self.assertEqual(key, SearchCache.get_key({"search_options": ["conversation", "visual"], "query": " a  dog ", "index_id": "index_1"}))
+        self.assertNotEqual(key, SearchCache.get_key({"index_id": "index_1", "query": "a cat", "search_options": ["visual", "conversation"]}))
+
+    def test_2_memory_backend(self):
+        """
+        Test that repeated queries are served from the cache until their time to live expires.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", search_cache=SearchCache(ttl=0.1)) as client:
+            self.assertEqual(client.search.query("index_1", "a dog", ["visual"]), RESULT)
+            self.assertEqual(client.search.query("index_1", "a dog ", ["visual"]), RESULT)
+            self.assertEqual(self._count_searches(), 1)
+
+            time.sleep(0.11)
+            client.search.query("index_1", "a dog", ["visual"])
+            self.assertEqual(self._count_searches(), 2)
+            self.assertEqual(client.search_cache.get_stats(), {"hits": 1, "misses": 2, "size": 1})
+
+    def test_3_disk_backend(self):
+        """
+        Test that the disk backend is shared between cache instances, invalidates per index and evicts the oldest files.
+        """
+
+        data = {"index_id": "index_1", "query": "a dog", "search_options": ["visual"]}
+        with tempfile.TemporaryDirectory() as directory:
+            SearchCache(backend="disk", directory=directory).set(data, RESULT)
+            cache = SearchCache(backend="disk", directory=directory, maxsize=2)
+            self.assertEqual(cache.get(data), RESULT)
+
+            cache.set({**data, "index_id": "index_2"}, RESULT)
+            cache.set({**data, "query": "a cat"}, RESULT)
+            self.assertEqual(cache.get_stats()['size'], 2)
+
+            cache.invalidate("index_1")
+            self.assertIsNone(cache.get(data))
+            self.assertEqual(cache.get_stats()['size'], 1)
+
+    def test_4_ready_task_invalidates_index(self):
+        """
+        Test that a task of the index becoming ready invalidates its cached results.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", search_cache=SearchCache()) as client:
+            client.search.query("index_1", "a dog", ["visual"])
+            client.task_watcher.watch("task_1", index_id="index_1").result(timeout=10)
+            client.search.query("index_1", "a dog", ["visual"])
+
+        self.assertEqual(self._count_searches(), 2)
+
+    async def test_5_async_query_is_cached(self):
+        """
+        Test that the asynchronous client uses the search cache.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test", search_cache=SearchCache()) as client:
+            await client.search.query("index_1", "a dog", ["visual"])
+            await client.search.query("index_1", "a dog", ["visual"])
+
+        self.assertEqual(self._count_searches(), 1)
+
+    def test_6_hits_are_copies(self):
+        """
+        Test that modifying a cached result does not change the result returned by the next hit.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", search_cache=SearchCache()) as client:
+            client.search.query("index_1", "a dog", ["visual"])['data'].clear()
+            client.search.query("index_1", "a dog", ["visual"])['data'].clear()
+            self.assertEqual(client.search.query("index_1", "a dog", ["visual"]), RESULT)
+
+        self.assertEqual(self._count_searches(), 1)
+
+    def test_7_getting_or_listing_a_ready_task_invalidates_older_results(self):
+        """
+        Test that getting or listing a ready task only invalidates the results of its index cached before the task was updated.
+        """
+
+        with TwelveLabsAPIClient(api_key="test", search_cache=SearchCache()) as client:
+            client.search.query("index_1", "a dog", ["visual"])
+            client.task.get("task_1")
+            client.task.list()
+            client.search.query("index_1", "a dog", ["visual"])
+            self.assertEqual(self._count_searches(), 1)
+
+            time.sleep(0.01)
+            TestSearchCache.task = {**TASK, "updated_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"}
+            client.task.get("task_1")
+            client.search.query("index_1", "a dog", ["visual"])
+            self.assertEqual(self._count_searches(), 2)
+
+            client.task.list()
+            client.search.query("index_1", "a dog", ["visual"])
+            self.assertEqual(self._count_searches(), 2)
+
+    def test_8_notification_invalidates_index(self):
+        """
+        Test that a notification of a ready task invalidates the results of its index, and that closing the client stops it.
+        """
+
+        with CallbackReceiver(secret="secret") as receiver:
+            client = TwelveLabsAPIClient(api_key="test", search_cache=SearchCache(), callback_receiver=receiver)
+            client.search.query("index_1", "a dog", ["visual"])
+            send_callback(receiver.url, {"_id": "task_2", "index_id": "index_1", "status": "indexing"}, "secret")
+            client.search.query("index_1", "a dog", ["visual"])
+            self.assertEqual(self._count_searches(), 1)
+
+            send_callback(receiver.url, {"_id": "task_2", "index_id": "index_1", "status": "ready"}, "secret")
+            client.search.query("index_1", "a dog", ["visual"])
+            self.assertEqual(self._count_searches(), 2)
+
+            client.close()
+            send_callback(receiver.url, {"_id": "task_3", "index_id": "index_1", "status": "ready"}, "secret")
+            client.search.query("index_1", "a dog", ["visual"])
+            self.assertEqual(self._count_searches(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.models import Clip
+from py_twelvelabs.settings import settings
+from tests.stub_server import StubServer
+
+
+def _page(page_number: int, page_count: int):
+    page_info = {"page": page_number}
+    if page_number < page_count:
+        page_info["next_page_token"] = f"token{page_number + 1}"
+    return {"data": [{"video_id": f"video_{page_number}_{i}", "score": 90.0 - page_number, "start": float(i), "end": float(i + 1)} for i in range(2)], "page_info": page_info}
+
+
+class TestSearchIterators(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the lazily-paginated search iterators against a local stub server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up test fixtures: start a stub server that serves four pages of search results.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("POST", r"/v1.1/search", lambda request: (200, _page(1, 4)))
+        cls.server.route("GET", r"/v1.1/search/token(\d+)", lambda request: (200, _page(int(request.match.group(1)), 4)))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Tear down test fixtures: stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        """
+        Set up test fixtures for each test: point the client at the stub server.
+        """
+
+        self.server.requests.clear()
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_1_query_all_includes_first_page(self):
+        """
+        Test that query_all returns every page, including the first one.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            pages = client.search.query_all("index_1", "query", ["visual"])
+
+        self.assertEqual([page["page_info"]["page"] for page in pages], [1, 2, 3, 4])
+
+    def test_2_iter_query(self):
+        """
+        Test that iter_query yields every clip in order, with and without prefetching.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            for prefetch in (False, True):
+                clips = list(client.search.iter_query("index_1", "query", ["visual"], prefetch=prefetch))
+                self.assertEqual([clip["video_id"] for clip in clips], [f"video_{page}_{i}" for page in range(1, 5) for i in range(2)])
+
+    def test_3_iter_query_stops_early(self):
+        """
+        Test that stopping iteration early does not fetch the remaining pages.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            for clip in client.search.iter_query("index_1", "query", ["visual"]):
+                break
+
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_4_iter_query_as_clips(self):
+        """
+        Test that iter_query can yield compact Clip objects.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            clips = list(client.search.iter_query("index_1", "query", ["visual"], as_clips=True))
+
+        self.assertTrue(all(isinstance(clip, Clip) for clip in clips))
+        self.assertEqual(clips[0].video_id, "video_1_0")
+
+    async def test_5_async_iter_query(self):
+        """
+        Test the asynchronous iterator with prefetching.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            clips = [clip async for clip in client.search.iter_query("index_1", "query", ["visual"], prefetch=True)]
+            pages = await client.search.query_all("index_1", "query", ["visual"])
+
+        self.assertEqual(len(clips), 8)
+        self.assertEqual(len(pages), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
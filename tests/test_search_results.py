@@ -0,0 +1,128 @@
+import unittest
+from array import array
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.models import Clip, SearchResult, ClipColumns
+from py_twelvelabs.settings import settings
+from py_twelvelabs.exceptions import MissingDependencyError
+from tests.stub_server import StubServer
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _page(page_number: int, page_count: int):
+    page_info = {"page": page_number}
+    if page_number < page_count:
+        page_info["next_page_token"] = f"token{page_number + 1}"
+    clips = [{"video_id": f"video_{page_number}", "score": 90.0 - page_number - i / 10, "start": float(i), "end": float(i + 5), "confidence": "high"} for i in range(3)]
+    return {"data": clips, "page_info": page_info, "search_pool": {"index_id": "index_1"}}
+
+
+class TestSearchResults(unittest.IsolatedAsyncioTestCase):
+    """
+    Test typed search result pages and the columnar clip export.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a stub server that serves three pages of three clips each.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("POST", r"/v1.1/search", lambda request: (200, _page(1, 3)))
+        cls.server.route("GET", r"/v1.1/search/token(\d+)", lambda request: (200, _page(int(request.match.group(1)), 3)))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_1_iter_results(self):
+        """
+        Test that pages are yielded as SearchResult objects of Clips.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            pages = list(client.search.iter_results("index_1", "query", ["visual"]))
+
+        self.assertEqual(len(pages), 3)
+        self.assertIsInstance(pages[0], SearchResult)
+        self.assertEqual(pages[0].next_page_token, "token2")
+        self.assertIsNone(pages[-1].next_page_token)
+        self.assertEqual([clip.video_id for clip in pages[1]], ["video_2"] * 3)
+
+    def test_2_query_columns(self):
+        """
+        Test that clips of all pages are collected into columns, stopping at max_clips.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            columns = client.search.query_columns("index_1", "query", ["visual"], use_numpy=False)
+            self.assertEqual(len(self.server.requests), 3)
+
+            self.server.requests.clear()
+            limited = client.search.query_columns("index_1", "query", ["visual"], max_clips=4, use_numpy=False)
+            self.assertEqual(len(self.server.requests), 2)
+
+        self.assertEqual(len(columns), 9)
+        self.assertIsInstance(columns.scores, array)
+        self.assertEqual(list(columns.starts[:3]), [0.0, 1.0, 2.0])
+        self.assertEqual(columns[3], Clip("video_2", 88.0, 0.0, 5.0, "high"))
+        self.assertEqual(len(limited), 4)
+
+    @unittest.skipIf(numpy is None, "Requires numpy.")
+    def test_3_numpy_columns(self):
+        """
+        Test that scores and timestamps can be ranked, thresholded and modified in place with NumPy.
+        """
+
+        columns = ClipColumns.from_clips([Clip("a", 80.0, 0.0, 1.0), Clip("b", 90.0, 1.0, 2.0), Clip("c", 70.0, 2.0, 3.0)], use_numpy=True)
+
+        self.assertEqual([columns.video_ids[i] for i in numpy.argsort(-columns.scores)], ["b", "a", "c"])
+        self.assertEqual(int((columns.scores > 75).sum()), 2)
+
+        columns.scores *= 2
+        columns.starts += 1.0
+        self.assertEqual(columns.scores.tolist(), [160.0, 180.0, 140.0])
+        self.assertEqual(columns.starts.tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(len(ClipColumns.from_clips([], use_numpy=True).scores), 0)
+
+    @unittest.skipIf(numpy is not None, "Requires numpy to be missing.")
+    def test_4_numpy_missing(self):
+        """
+        Test that requesting NumPy arrays without NumPy raises an error.
+        """
+
+        with self.assertRaises(MissingDependencyError):
+            ClipColumns.from_clips([], use_numpy=True)
+
+    async def test_5_async_query_columns(self):
+        """
+        Test the asynchronous columnar export.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            columns = await client.search.query_columns("index_1", "query", ["visual"], max_clips=5)
+            pages = [page async for page in client.search.iter_results("index_1", "query", ["visual"])]
+
+        self.assertEqual(len(columns), 5)
+        self.assertEqual(sum(len(page) for page in pages), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
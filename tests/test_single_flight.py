@@ -0,0 +1,150 @@
+import time
+import asyncio
+import unittest
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from py_twelvelabs.exceptions import DeadlineExceededError
+from py_twelvelabs.utilities.deadline import deadline
+from py_twelvelabs.utilities.single_flight import SingleFlight
+from tests.stub_server import StubServer, TASK, INDEX
+
+
+def _slow(payload):
+    def handler(request):
+        time.sleep(0.2)
+        return 200, payload
+    return handler
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    """
+    Test that concurrent identical GETs are coalesced into a single request.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start a stub server that answers task and index lookups slowly.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("GET", r"/v1.1/tasks/\w+", _slow(TASK))
+        cls.server.route("GET", r"/v1.1/indexes/\w+", _slow(INDEX))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_1_exceptions_are_shared(self):
+        """
+        Test that every caller waiting on a failed call receives its exception.
+        """
+
+        single_flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.1)
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(single_flight.do, "key", fail) for _ in range(4)]
+        for future in futures:
+            self.assertIsInstance(future.exception(), ValueError)
+
+    def test_2_concurrent_threads(self):
+        """
+        Test that threads getting the same task share one request and one parsed result.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client, ThreadPoolExecutor(max_workers=8) as executor:
+            tasks = list(executor.map(lambda _: client.task.get("task_1"), range(8)))
+            client.index.get("index_1")
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertTrue(all(task is tasks[0] for task in tasks))
+
+    def test_3_sequential_calls_are_not_coalesced(self):
+        """
+        Test that calls made after the previous one returned send a new request.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            client.task.get("task_1")
+            client.task.get("task_1")
+
+        self.assertEqual(len(self.server.requests), 2)
+
+    async def test_4_concurrent_coroutines(self):
+        """
+        Test that coroutines getting the same index share one request, even if one of them is cancelled.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            cancelled = asyncio.ensure_future(client.index.get("index_1"))
+            await asyncio.sleep(0.05)
+            cancelled.cancel()
+            indexes = await asyncio.gather(*[client.index.get("index_1") for _ in range(8)])
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertTrue(all(index is indexes[0] for index in indexes))
+
+    def test_5_deadlines_are_not_shared(self):
+        """
+        Test that a caller is not failed by the deadline of the caller it joined, and is bound by its own deadline.
+        """
+
+        def get_task(client, timeout):
+            with deadline(timeout):
+                return client.task.get("task_1")
+
+        with TwelveLabsAPIClient(api_key="test") as client, ThreadPoolExecutor(max_workers=2) as executor:
+            short = executor.submit(get_task, client, 0.1)
+            time.sleep(0.02)
+            unbounded = executor.submit(get_task, client, None)
+            self.assertIsInstance(short.exception(), DeadlineExceededError)
+            self.assertEqual(unbounded.result().id, TASK['_id'])
+
+            leader = executor.submit(get_task, client, None)
+            time.sleep(0.02)
+            started_at = time.monotonic()
+            with self.assertRaises(DeadlineExceededError):
+                get_task(client, 0.05)
+            self.assertLess(time.monotonic() - started_at, 0.15)
+            self.assertEqual(leader.result().id, TASK['_id'])
+
+    async def test_6_async_deadlines_are_not_shared(self):
+        """
+        Test that coroutines wait for a shared lookup within their own deadlines only.
+        """
+
+        async def get_index(client, timeout):
+            with deadline(timeout):
+                return await client.index.get("index_1")
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            short = asyncio.ensure_future(get_index(client, 0.05))
+            await asyncio.sleep(0.01)
+            index = await get_index(client, None)
+            with self.assertRaises(DeadlineExceededError):
+                await short
+
+        self.assertEqual(index.id, INDEX['_id'])
+        self.assertEqual(len(self.server.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
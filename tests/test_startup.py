@@ -0,0 +1,80 @@
+import os
+import sys
+import json
+import unittest
+import subprocess
+
+
+def _run(script: str, **env) -> dict:
+    """
+    Run a script in a fresh interpreter and return the JSON it prints.
+    """
+
+    env = {**os.environ, "PYTHONPATH": os.getcwd(), **env}
+    output = subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestStartup(unittest.TestCase):
+    """
+    Test that importing the package and creating a client defer expensive imports and leave host logging alone.
+    """
+
+    def test_1_import_is_lazy(self):
+        """
+        Test that importing the package does not import the HTTP libraries, pydantic-settings or NumPy.
+        """
+
+        modules = _run("import sys, json; import py_twelvelabs; print(json.dumps(sorted(sys.modules)))")
+
+        for module in ("requests", "httpx", "pydantic_settings", "numpy", "py_twelvelabs.client", "py_twelvelabs.resources"):
+            self.assertNotIn(module, modules)
+
+    def test_2_client_defers_resources(self):
+        """
+        Test that creating a synchronous client does not import httpx, the resources or the task watcher until they are used,
+        and that using the task resource does not import requests_toolbelt before a multi-part request is sent.
+        """
+
+        result = _run(
+            "import sys, json\n"
+            "from py_twelvelabs import TwelveLabsAPIClient\n"
+            "client = TwelveLabsAPIClient(api_key='test')\n"
+            "created = sorted(sys.modules)\n"
+            "task = client.task\n"
+            "print(json.dumps({'created': created, 'used': sorted(sys.modules), 'same': task is client.task}))"
+        )
+
+        for module in ("httpx", "numpy", "py_twelvelabs.resources", "py_twelvelabs.watcher"):
+            self.assertNotIn(module, result['created'])
+        self.assertIn("py_twelvelabs.resources.task", result['used'])
+        self.assertNotIn("requests_toolbelt", result['used'])
+        self.assertTrue(result['same'])
+
+    def test_3_logging_configured_once(self):
+        """
+        Test that getting loggers keeps the application's handlers and loggers, and configures logging only once.
+        """
+
+        result = _run(
+            "import json, logging\n"
+            "class Handler(logging.StreamHandler):\n"
+            "    closed = False\n"
+            "    def close(self):\n"
+            "        Handler.closed = True\n"
+            "logging.basicConfig(level=logging.DEBUG, handlers=[Handler()])\n"
+            "app_logger = logging.getLogger('app')\n"
+            "logging.getLogger('__main__').setLevel(logging.ERROR)\n"
+            "from py_twelvelabs import TwelveLabsAPIClient\n"
+            "from py_twelvelabs.utilities.logger import get_logger\n"
+            "TwelveLabsAPIClient(api_key='test')\n"
+            "get_logger('py_twelvelabs.b')\n"
+            "root = logging.getLogger()\n"
+            "print(json.dumps({'handlers': len(root.handlers), 'level': root.level, 'closed': Handler.closed, 'disabled': app_logger.disabled, 'main_level': logging.getLogger('__main__').level, 'package_handlers': len(logging.getLogger('py_twelvelabs').handlers)}))"
+        )
+
+        self.assertEqual(result, {"handlers": 1, "level": 10, "closed": False, "disabled": False, "main_level": 40, "package_handlers": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import unittest
+from unittest import mock
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.settings import settings
+from tests.stub_server import StubServer
+
+
+VIDEO_FILE = "tests/data/test.mp4"
+
+
+class TestUpload(unittest.IsolatedAsyncioTestCase):
+    """
+    Test streaming multi-part uploads against a local stub server.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up test fixtures: start the stub server and read the test video.
+        """
+
+        cls.server = StubServer()
+        cls.server.route("POST", r"/v1.1/tasks", lambda request: (201, {"_id": "task_1"}))
+        cls.server.start()
+
+        with open(VIDEO_FILE, "rb") as file:
+            cls.video_bytes = file.read()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Tear down test fixtures: stop the stub server.
+        """
+
+        cls.server.stop()
+
+    def setUp(self):
+        """
+        Set up test fixtures for each test: point the client at the stub server.
+        """
+
+        self.server.requests.clear()
+        patcher = mock.patch.object(settings, "BASE_API_URL", self.server.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _count_open_files():
+        return len(os.listdir("/proc/self/fd"))
+
+    def test_1_progress_and_chunk_size(self):
+        """
+        Test that the upload is read in chunks of the configured size and that progress is reported up to the full body size.
+        """
+
+        progress = []
+        with TwelveLabsAPIClient(api_key="test") as client:
+            task_id = client.task.create_async("index_1", video_file=VIDEO_FILE, chunk_size=64 * 1024, progress_callback=lambda sent, total: progress.append((sent, total)))
+
+        self.assertEqual(task_id, "task_1")
+        self.assertIn(self.video_bytes, self.server.requests[0].body)
+        self.assertEqual(progress[-1][0], progress[-1][1])
+        self.assertTrue(all(current - previous <= 64 * 1024 for (previous, _), (current, _) in zip(progress, progress[1:])))
+
+    @unittest.skipUnless(os.path.isdir("/proc/self/fd"), "Requires /proc to count open files.")
+    def test_2_file_handles_are_closed(self):
+        """
+        Test that no file handles are left open after uploads, with and without memory mapping.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            client.task.create_async("index_1", video_file=VIDEO_FILE)
+            open_files = self._count_open_files()
+            for use_mmap in (False, True, False, True):
+                client.task.create_async("index_1", video_file=VIDEO_FILE, use_mmap=use_mmap)
+            self.assertEqual(self._count_open_files(), open_files)
+
+        self.assertTrue(all(self.video_bytes in request.body for request in self.server.requests))
+
+    async def test_3_async_upload(self):
+        """
+        Test a streaming upload with the asynchronous client.
+        """
+
+        progress = []
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            await client.task.create_async("index_1", video_file=VIDEO_FILE, use_mmap=True, chunk_size=32 * 1024, progress_callback=lambda sent, total: progress.append(sent))
+
+        self.assertIn(self.video_bytes, self.server.requests[0].body)
+        self.assertGreater(len(progress), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+import asyncio
+import threading
+import unittest
+from unittest import mock
+from concurrent.futures import wait
+
+from py_twelvelabs import TwelveLabsAPIClient, AsyncTwelveLabsAPIClient
+from py_twelvelabs.models import Task
+from py_twelvelabs.settings import settings
+from py_twelvelabs.watcher import get_polling_interval
+from py_twelvelabs.utilities.retry import RetryPolicy
+from py_twelvelabs.exceptions import TaskFailedError, APIRequestError
+from tests.stub_server import StubServer, TASK
+
+
+class TestTaskWatcher(unittest.IsolatedAsyncioTestCase):
+    """
+    Test the task watchers against a local stub server whose tasks become ready after a few polls.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up test fixtures: start the stub server.
+        """
+
+        cls.lock = threading.Lock()
+        cls.server = StubServer()
+        cls.server.route("GET", r"/v1.1/tasks/(\w+)", lambda request: cls._get_task(request.match.group(1)))
+        cls.server.route("GET", r"/v1.1/tasks\?.*", lambda request: (200, {"data": [cls._poll(task_id) for task_id in cls.index_task_ids]}))
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Tear down test fixtures: stop the stub server.
+        """
+
+        cls.server.stop()
+
+    @classmethod
+    def _get_task(cls, task_id):
+        # Slow tasks are held until released, flaky tasks fail their first poll, broken tasks fail every poll.
+        if task_id.startswith("slow"):
+            cls.slow_poll_started.set()
+            cls.slow_poll_released.wait(10)
+        if task_id.startswith("broken") or (task_id.startswith("flaky") and task_id not in cls.polls):
+            with cls.lock:
+                cls.polls.setdefault(task_id, 0)
+            return 500, {"message": "Internal error"}
+        return 200, cls._poll(task_id)
+
+    @classmethod
+    def _poll(cls, task_id):
+        with cls.lock:
+            cls.polls[task_id] = cls.polls.get(task_id, 0) + 1
+            if cls.polls[task_id] < 3:
+                status = "indexing"
+            else:
+                status = "failed" if task_id.startswith("failed") else "ready"
+        return {**TASK, "_id": task_id, "status": status, "process": {"remain_seconds": 0}}
+
+    def setUp(self):
+        """
+        Set up test fixtures for each test: reset the task states, shorten polling intervals and point the client at the stub server.
+        """
+
+        self.server.requests.clear()
+        TestTaskWatcher.polls = {}
+        TestTaskWatcher.slow_poll_started = threading.Event()
+        TestTaskWatcher.slow_poll_released = threading.Event()
+        self.addCleanup(self.slow_poll_released.set)
+        TestTaskWatcher.index_task_ids = [f"task{i}" for i in range(10)] + ["failed1"]
+        for name, value in [("BASE_API_URL", self.server.base_url), ("TASK_WATCHER_MIN_POLLING_INTERVAL", 0.01), ("TASK_STATUS_POLLING_INTERVAL", 0.01)]:
+            patcher = mock.patch.object(settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _count_requests(self, prefix):
+        return len([request for request in self.server.requests if request.path.startswith(prefix)])
+
+    def test_1_polling_interval(self):
+        """
+        Test that the polling interval follows the remaining processing time, within the configured bounds.
+        """
+
+        task = Task(**{**TASK, "status": "indexing", "process": {"remain_seconds": 20}})
+        with mock.patch.object(settings, "TASK_WATCHER_POLLING_JITTER", 0):
+            self.assertEqual(get_polling_interval(task), 20)
+            task.process = {"remain_seconds": 1000}
+            self.assertEqual(get_polling_interval(task), settings.TASK_WATCHER_MAX_POLLING_INTERVAL)
+
+    def test_2_watch_many_tasks(self):
+        """
+        Test that tasks of the same index are polled together and resolved through their futures.
+        """
+
+        completed = []
+        with TwelveLabsAPIClient(api_key="test") as client:
+            futures = [client.task_watcher.watch(f"task{i}", index_id="index_1", callback=completed.append) for i in range(10)]
+            futures.append(client.task_watcher.watch("failed1", index_id="index_1"))
+            wait(futures, timeout=5)
+
+        self.assertTrue(all(isinstance(future.result(), Task) for future in futures[:10]))
+        self.assertIsInstance(futures[10].exception(), TaskFailedError)
+        self.assertEqual(len(completed), 10)
+        self.assertLessEqual(self._count_requests("/v1.1/tasks/"), 3)
+        self.assertLessEqual(self._count_requests("/v1.1/tasks?"), 4)
+
+    def test_3_watch_without_index(self):
+        """
+        Test that tasks without an index are polled one by one.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            task = client.task_watcher.watch("task1").result(timeout=5)
+
+        self.assertEqual(task.id, "task1")
+        self.assertEqual(self._count_requests("/v1.1/tasks/task1"), 3)
+
+    async def test_4_async_watcher(self):
+        """
+        Test the asynchronous watcher and its completion iterator.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            for i in range(5):
+                client.task_watcher.watch(f"task{i}", index_id="index_1")
+            tasks = await asyncio.wait_for(self._collect(client.task_watcher.as_completed()), 5)
+
+        self.assertEqual(sorted(task.id for task in tasks), [f"task{i}" for i in range(5)])
+
+    def test_5_several_waiters(self):
+        """
+        Test that callers waiting for the same task get their own futures and callbacks, and can be detached one by one.
+        """
+
+        completed = []
+        with TwelveLabsAPIClient(api_key="test") as client:
+            first = client.task_watcher.watch("task1", callback=lambda future: completed.append("first"))
+            second = client.task_watcher.watch("task1", index_id="index_1", callback=lambda future: completed.append("second"))
+            third = client.task_watcher.watch("task1")
+            client.task_watcher.unwatch("task1", second)
+            third.cancel()
+
+            self.assertEqual(first.result(timeout=5).id, "task1")
+            self.assertTrue(second.cancelled() and third.cancelled())
+            self.assertEqual(client.task_watcher._watched, {})
+
+        self.assertEqual(completed, ["first"])
+        self.assertEqual(self._count_requests("/v1.1/tasks/task1"), 3)
+
+    def test_6_failed_polls(self):
+        """
+        Test that a failed poll is retried, and that the wait only fails after too many consecutive failures.
+        """
+
+        with mock.patch.object(settings, "TASK_WATCHER_MAX_POLL_ERRORS", 3), TwelveLabsAPIClient(api_key="test", retry_policy=RetryPolicy(max_retries=0)) as client:
+            flaky = client.task_watcher.watch("flaky1")
+            broken = client.task_watcher.watch("broken1")
+
+            self.assertEqual(flaky.result(timeout=5).id, "flaky1")
+            self.assertIsInstance(broken.exception(timeout=5), APIRequestError)
+
+        self.assertEqual(self._count_requests("/v1.1/tasks/flaky1"), 4)
+        self.assertEqual(self._count_requests("/v1.1/tasks/broken1"), 3)
+
+    def test_7_watch_again_during_poll(self):
+        """
+        Test that a poll still running for a cancelled caller does not drop the task when it is watched again.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            first = client.task_watcher.watch("slow1")
+            self.assertTrue(self.slow_poll_started.wait(5))
+            first.cancel()
+            second = client.task_watcher.watch("slow1")
+            self.slow_poll_released.set()
+
+            self.assertEqual(second.result(timeout=5).id, "slow1")
+            self.assertEqual(client.task_watcher._watched, {})
+
+    def test_8_slow_poll_does_not_delay_other_tasks(self):
+        """
+        Test that tasks are polled while the poll of another task is stalled.
+        """
+
+        with TwelveLabsAPIClient(api_key="test") as client:
+            slow = client.task_watcher.watch("slow1")
+            self.assertTrue(self.slow_poll_started.wait(5))
+            fast = client.task_watcher.watch("task1")
+
+            self.assertEqual(fast.result(timeout=5).id, "task1")
+            self.assertFalse(slow.done())
+            self.slow_poll_released.set()
+            self.assertEqual(slow.result(timeout=5).id, "slow1")
+
+    async def test_9_async_slow_poll_does_not_delay_other_tasks(self):
+        """
+        Test that the asynchronous watcher polls tasks while the poll of another task is stalled.
+        """
+
+        async with AsyncTwelveLabsAPIClient(api_key="test") as client:
+            slow = client.task_watcher.watch("slow1")
+            self.assertTrue(await asyncio.get_running_loop().run_in_executor(None, self.slow_poll_started.wait, 5))
+            fast = client.task_watcher.watch("task1")
+
+            self.assertEqual((await asyncio.wait_for(fast, 5)).id, "task1")
+            self.assertFalse(slow.done())
+            self.slow_poll_released.set()
+            self.assertEqual((await asyncio.wait_for(slow, 5)).id, "slow1")
+
+    @staticmethod
+    async def _collect(iterator):
+        return [item async for item in iterator]
+
+
+if __name__ == "__main__":
+    unittest.main()